@@ -0,0 +1,168 @@
+"""
+Archive tier for completed interviews.
+
+Completed interviews older than ARCHIVE_AFTER_DAYS are moved, together with their
+questions and topic links, from the hot tables (interviews, questions,
+interview_topics) into interviews_archive, questions_archive and
+interview_topics_archive. Each batch is copied with INSERT ... SELECT and deleted
+in the same transaction, so a row is always in exactly one tier. The listings,
+counters and pagination indexes only ever see the hot tables. Evaluation and
+admin detail pages fall back to the archive (see app.database.queries).
+restore_interviews moves archived interviews back the same way, e.g. to edit them.
+
+Archived rows keep their ids. SQLite hands out max(id) + 1 for new rows, so the
+interview with the highest id, and the interview owning the highest question id,
+always stay in the hot tables. Otherwise an archived id could be handed out again.
+
+Usage (from the AIInterviewer directory, e.g. nightly from cron):
+    python -m app.database.archive                # archive with ARCHIVE_AFTER_DAYS
+    python -m app.database.archive --days 30      # override the age threshold
+    python -m app.database.archive --dry-run      # only count what would move
+    python -m app.database.archive --restore 12   # move interview 12 back to the hot tables
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import and_, delete, func, insert, or_, select
+from app.database.database import engine
+from app.models.models import (
+    ArchivedInterview, ArchivedQuestion, Interview, Question, interview_topics, interview_topics_archive
+)
+
+# Completed interviews older than this many days are moved to the archive tables
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "180"))
+
+# Interviews moved per transaction, keeping each write lock short
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+
+def _archivable_ids(connection, cutoff: datetime, limit: Optional[int]) -> List[int]:
+    """Ids of completed interviews finished before the cutoff (created_at when completed_at is unset)"""
+    newest_interview = select(func.max(Interview.id)).scalar_subquery()
+    newest_question_owner = (
+        select(Question.interview_id).order_by(Question.id.desc()).limit(1).scalar_subquery()
+    )
+    return list(connection.execute(
+        select(Interview.id)
+        .where(
+            Interview.status == "completed",
+            or_(
+                Interview.completed_at < cutoff,
+                and_(Interview.completed_at.is_(None), Interview.created_at < cutoff)
+            ),
+            Interview.id != newest_interview,
+            Interview.id != func.coalesce(newest_question_owner, 0)
+        )
+        .order_by(Interview.id)
+        .limit(limit)
+    ).scalars())
+
+def _copy_columns(source, target):
+    """Columns of the target table that the source table has too, as (names, source columns)"""
+    names = [column.name for column in target.columns if column.name in source.columns]
+    return names, [source.columns[name] for name in names]
+
+# (interviews, questions, topic links) of each tier
+HOT_TABLES = (Interview.__table__, Question.__table__, interview_topics)
+ARCHIVE_TABLES = (ArchivedInterview.__table__, ArchivedQuestion.__table__, interview_topics_archive)
+
+def _move_batch(connection, ids: List[int], source=HOT_TABLES, target=ARCHIVE_TABLES):
+    """Copy interviews with their questions and topic links from one tier to the other, then delete them"""
+    interviews, questions, topics = source
+    target_interviews, target_questions, target_topics = target
+
+    names, columns = _copy_columns(interviews, target_interviews)
+    connection.execute(insert(target_interviews).from_select(
+        names, select(*columns).where(interviews.c.id.in_(ids))
+    ))
+    names, columns = _copy_columns(questions, target_questions)
+    connection.execute(insert(target_questions).from_select(
+        names, select(*columns).where(questions.c.interview_id.in_(ids))
+    ))
+    connection.execute(insert(target_topics).from_select(
+        ["interview_id", "topic_id"],
+        select(topics.c.interview_id, topics.c.topic_id).where(topics.c.interview_id.in_(ids))
+    ))
+
+    connection.execute(delete(topics).where(topics.c.interview_id.in_(ids)))
+    connection.execute(delete(questions).where(questions.c.interview_id.in_(ids)))
+    connection.execute(delete(interviews).where(interviews.c.id.in_(ids)))
+
+def archive_completed_interviews(
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    dry_run: bool = False,
+    bind=None
+) -> int:
+    """
+    Move completed interviews older than the threshold into the archive tables
+
+    Args:
+        older_than_days (int): Age threshold in days since completion
+        batch_size (int): Interviews moved per transaction
+        dry_run (bool): Only count the interviews that would be archived
+        bind: Engine to use (defaults to the application engine)
+
+    Returns:
+        int: Number of interviews archived (or archivable, for a dry run)
+    """
+    bind = bind if bind is not None else engine
+    cutoff = datetime.now() - timedelta(days=older_than_days)
+
+    if dry_run:
+        with bind.connect() as connection:
+            return len(_archivable_ids(connection, cutoff, limit=None))
+
+    archived = 0
+    while True:
+        with bind.begin() as connection:
+            ids = _archivable_ids(connection, cutoff, batch_size)
+            if not ids:
+                break
+            _move_batch(connection, ids)
+        archived += len(ids)
+        print(f"  ✓ Archived {archived} interviews")
+        if len(ids) < batch_size:
+            break
+    return archived
+
+def restore_interviews(ids: List[int], bind=None) -> int:
+    """
+    Move archived interviews, with their questions and topic links, back to the hot tables
+
+    Args:
+        ids (List[int]): Ids of the interviews to restore; ids not in the archive are skipped
+        bind: Engine to use (defaults to the application engine)
+
+    Returns:
+        int: Number of interviews restored
+    """
+    bind = bind if bind is not None else engine
+    with bind.begin() as connection:
+        archived_ids = list(connection.execute(
+            select(ArchivedInterview.id).where(ArchivedInterview.id.in_(ids))
+        ).scalars())
+        if archived_ids:
+            _move_batch(connection, archived_ids, source=ARCHIVE_TABLES, target=HOT_TABLES)
+    return len(archived_ids)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Move old completed interviews to the archive tables")
+    parser.add_argument("--days", type=int, default=ARCHIVE_AFTER_DAYS, help="Archive interviews completed this many days ago")
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE, help="Interviews moved per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived")
+    parser.add_argument("--restore", type=int, nargs="+", metavar="ID", help="Move these interviews back from the archive")
+    args = parser.parse_args()
+
+    if args.restore:
+        count = restore_interviews(args.restore)
+        print(f"✅ Restored {count} of {len(args.restore)} interviews from the archive")
+        raise SystemExit(0)
+
+    count = archive_completed_interviews(args.days, args.batch_size, args.dry_run)
+    if args.dry_run:
+        print(f"📦 {count} interviews would be archived")
+    else:
+        print(f"✅ Archived {count} interviews completed more than {args.days} days ago")
@@ -0,0 +1,96 @@
+"""
+Transparent compression for large text columns.
+
+Answers, feedback, summaries and model answers are long LLM or candidate texts that
+are written once and read back whole. CompressedText stores values of at least
+TEXT_COMPRESSION_MIN_BYTES compressed (zlib by default, zstd when the optional
+zstandard package is installed and TEXT_COMPRESSION=zstd). Shorter values, and
+values that do not shrink, are stored as plain text.
+
+Compression only applies on SQLite. PostgreSQL already compresses large text values
+itself (TOAST), so there the columns stay plain text and the type is a pass-through.
+
+Compressed values are BLOBs starting with a NUL byte and a method byte. Text never
+starts with NUL, so rows written before compression was enabled (plain TEXT) keep
+reading back unchanged and can be compressed later (migration 6).
+
+SQL cannot read compressed values, so nothing in the schema may depend on their text:
+the full-text search index over model answers is kept in sync by the app
+(see app.database.search), and other SQLite clients can still write every table.
+"""
+
+import os
+import zlib
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+# Compression method for new values: zlib, zstd or none
+TEXT_COMPRESSION = os.getenv("TEXT_COMPRESSION", "zlib").lower()
+
+# Values shorter than this (UTF-8 bytes) are stored as plain text
+TEXT_COMPRESSION_MIN_BYTES = int(os.getenv("TEXT_COMPRESSION_MIN_BYTES", "512"))
+
+if TEXT_COMPRESSION not in ("zlib", "zstd", "none"):
+    raise ValueError(f"Unknown TEXT_COMPRESSION '{TEXT_COMPRESSION}', expected one of: zlib, zstd, none")
+if TEXT_COMPRESSION == "zstd" and zstandard is None:
+    raise ValueError("TEXT_COMPRESSION=zstd requires the zstandard package (pip install zstandard)")
+
+ZLIB_HEADER = b"\x00z"
+ZSTD_HEADER = b"\x00s"
+
+def compress_text(value, method: str = None, min_bytes: int = None):
+    """
+    Compressed BLOB for a text value, or the value itself when it is short or does not shrink
+
+    Args:
+        value (str): Text to store
+        method (str): zlib, zstd or none (defaults to TEXT_COMPRESSION)
+        min_bytes (int): Size threshold (defaults to TEXT_COMPRESSION_MIN_BYTES)
+    """
+    method = method or TEXT_COMPRESSION
+    min_bytes = TEXT_COMPRESSION_MIN_BYTES if min_bytes is None else min_bytes
+    if not isinstance(value, str) or method == "none":
+        return value
+    data = value.encode("utf-8")
+    if len(data) < min_bytes:
+        return value
+    if method == "zstd":
+        compressed = ZSTD_HEADER + zstandard.ZstdCompressor(level=6).compress(data)
+    else:
+        compressed = ZLIB_HEADER + zlib.compress(data, 6)
+    return compressed if len(compressed) < len(data) else value
+
+def decompress_text(value):
+    """Text of a stored value; plain text and NULL pass through unchanged"""
+    if not isinstance(value, bytes):
+        return value
+    header, payload = value[:2], value[2:]
+    if header == ZLIB_HEADER:
+        return zlib.decompress(payload).decode("utf-8")
+    if header == ZSTD_HEADER:
+        if zstandard is None:
+            raise RuntimeError("Column holds zstd-compressed text but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    return value.decode("utf-8")
+
+def is_compressed(value) -> bool:
+    return isinstance(value, bytes) and value[:2] in (ZLIB_HEADER, ZSTD_HEADER)
+
+class CompressedText(TypeDecorator):
+    """Text column stored compressed on SQLite once a value reaches TEXT_COMPRESSION_MIN_BYTES"""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name != "sqlite":
+            return value
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        return decompress_text(value)
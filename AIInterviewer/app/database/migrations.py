@@ -0,0 +1,335 @@
+"""
+Versioned schema migrations.
+
+Base.metadata.create_all() only creates missing tables, so changes to existing tables
+(new indexes, new columns) ship as numbered migrations. Each migration runs once in its
+own transaction and is recorded in the schema_migrations table; data migrations that
+rewrite many rows commit batch by batch instead, so they never hold the write lock for
+the whole run. Migrations must be idempotent: on a fresh database create_all() has
+already built the current schema and the migration only gets recorded, and an
+interrupted batched migration carries on where it stopped.
+
+Usage (from the AIInterviewer directory):
+    python -m app.database.migrations          # apply pending migrations
+    python -m app.database.migrations --check  # assert the hot queries use an index (SQLite)
+"""
+
+from datetime import datetime
+from sqlalchemy import (
+    Column, DateTime, Integer, LargeBinary, MetaData, String, Table, and_, bindparam, case, cast, func, inspect,
+    select, text, tuple_, update
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateColumn
+from app.database.compression import TEXT_COMPRESSION_MIN_BYTES
+from app.database.database import Base, engine
+from app.database.search import install_search_index
+from app.models.models import Interview, Question, QuestionBank
+
+# Kept out of Base.metadata so init_db.py's drop_all() does not forget applied migrations
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String),
+    Column("applied_at", DateTime, default=datetime.now)
+)
+
+# (version, description, upgrade function) in registration order
+MIGRATIONS = []
+
+def migration(version: int, description: str, transactional: bool = True):
+    """
+    Register an upgrade function
+
+    It receives a Connection inside a transaction, or with transactional=False the
+    Engine, to commit in batches itself.
+    """
+    def register(upgrade):
+        MIGRATIONS.append((version, description, upgrade, transactional))
+        return upgrade
+    return register
+
+def create_indexes(connection, table_name: str, index_names):
+    """Create the named indexes declared on a model table, skipping ones that already exist"""
+    table = Base.metadata.tables[table_name]
+    indexes = {index.name: index for index in table.indexes}
+    unknown = set(index_names) - set(indexes)
+    if unknown:
+        # A migration naming an index the models no longer declare would silently do nothing
+        raise ValueError(f"Indexes not declared on {table_name}: {', '.join(sorted(unknown))}")
+    for name in index_names:
+        indexes[name].create(bind=connection, checkfirst=True)
+
+def add_columns(connection, table_name: str, column_names):
+    """Add the named columns declared on a model table, skipping ones that already exist"""
+    table = Base.metadata.tables[table_name]
+    existing = {column["name"] for column in inspect(connection).get_columns(table_name)}
+    for name in column_names:
+        if name not in existing:
+            definition = CreateColumn(table.c[name]).compile(dialect=connection.dialect)
+            connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {definition}"))
+
+# Rows rewritten per statement when compressing existing text columns
+COMPRESSION_BATCH_SIZE = 1000
+
+def compress_columns(bind, table_name: str, column_names, batch_size: int = COMPRESSION_BATCH_SIZE):
+    """
+    Rewrite plain text values of CompressedText columns so they are stored compressed (SQLite only)
+
+    Each batch is committed on its own, so other writers get the database between batches.
+    """
+    if bind.dialect.name != "sqlite":
+        return
+    table = Base.metadata.tables[table_name]
+    for name in column_names:
+        column = table.c[name]
+        last_id = 0
+        while True:
+            with bind.begin() as connection:
+                rows = connection.execute(
+                    select(table.c.id, column)
+                    .where(
+                        table.c.id > last_id,
+                        func.typeof(column) == "text",
+                        func.length(cast(column, LargeBinary)) >= TEXT_COMPRESSION_MIN_BYTES
+                    )
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                # Binding through the column type compresses values above the size threshold
+                connection.execute(
+                    update(table).where(table.c.id == bindparam("b_id")).values({name: bindparam("b_value")}),
+                    [{"b_id": row_id, "b_value": value} for row_id, value in rows]
+                )
+
+@migration(1, "Composite indexes for question bank, question and interview filters")
+def add_performance_indexes(connection):
+    create_indexes(connection, "question_bank", {"ix_question_bank_topic_difficulty"})
+    create_indexes(connection, "questions", {"ix_questions_interview_order"})
+    create_indexes(connection, "interviews", {"ix_interviews_user_created"})
+    # The single-column status filters of this version; migration 2 replaces them with
+    # composite indexes, so they are no longer declared on the model
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_interviews_status ON interviews (status)"))
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_interviews_approval_status ON interviews (approval_status)"))
+
+@migration(2, "Keyset pagination indexes for the interview and question bank listings")
+def add_pagination_indexes(connection):
+    create_indexes(connection, "question_bank", {"ix_question_bank_topic_id"})
+    create_indexes(connection, "interviews", {
+        "ix_interviews_created",
+        "ix_interviews_status_created",
+        "ix_interviews_approval_created",
+    })
+    # Superseded by the composite indexes above, which share their leading column
+    connection.execute(text("DROP INDEX IF EXISTS ix_interviews_status"))
+    connection.execute(text("DROP INDEX IF EXISTS ix_interviews_approval_status"))
+
+@migration(3, "Full-text search index over question bank text and model answers")
+def add_question_search_index(connection):
+    # Creates the FTS5 table and sync triggers (SQLite) or GIN index (PostgreSQL) and indexes existing rows
+    install_search_index(connection)
+
+@migration(4, "Stored progress and score aggregates on interviews")
+def add_interview_aggregates(connection):
+    add_columns(connection, "interviews", [
+        "question_count", "answered_count", "scored_count", "total_score", "average_score", "topic_scores",
+    ])
+
+    # Backfill from the questions, one grouped pass
+    answered = and_(Question.answer.isnot(None), Question.answer != "")
+    rows = connection.execute(
+        select(
+            Question.interview_id,
+            Question.topic_id,
+            func.count(Question.id),
+            func.coalesce(func.sum(case((answered, 1), else_=0)), 0),
+            func.count(Question.score),
+            func.coalesce(func.sum(Question.score), 0),
+        ).group_by(Question.interview_id, Question.topic_id)
+    )
+    aggregates = {}
+    for interview_id, topic_id, questions, answered_count, scored, total in rows:
+        interview = aggregates.setdefault(interview_id, {
+            "b_id": interview_id, "question_count": 0, "answered_count": 0,
+            "scored_count": 0, "total_score": 0, "topic_scores": {},
+        })
+        interview["question_count"] += questions
+        interview["answered_count"] += answered_count
+        interview["scored_count"] += scored
+        interview["total_score"] += total
+        interview["topic_scores"][str(topic_id)] = {
+            "questions": questions, "answered": answered_count, "scored": scored, "total": total,
+        }
+    for interview in aggregates.values():
+        interview["average_score"] = (
+            interview["total_score"] / interview["scored_count"] if interview["scored_count"] else None
+        )
+
+    if aggregates:
+        interviews = Base.metadata.tables["interviews"]
+        connection.execute(
+            update(interviews).where(interviews.c.id == bindparam("b_id")).values(
+                question_count=bindparam("question_count"),
+                answered_count=bindparam("answered_count"),
+                scored_count=bindparam("scored_count"),
+                total_score=bindparam("total_score"),
+                average_score=bindparam("average_score"),
+                topic_scores=bindparam("topic_scores"),
+            ),
+            list(aggregates.values())
+        )
+
+@migration(5, "Archive tables for completed interviews, their questions and topic links")
+def add_archive_tables(connection):
+    for table_name in ("interviews_archive", "questions_archive", "interview_topics_archive"):
+        Base.metadata.tables[table_name].create(bind=connection, checkfirst=True)
+
+@migration(6, "Compress large answer, feedback, summary and model answer texts", transactional=False)
+def compress_text_columns(bind):
+    # Replaces the sync triggers of migration 3, which would index compressed model answers
+    with bind.begin() as connection:
+        install_search_index(connection)
+    for table_name, column_names in (
+        ("question_bank", ["model_answer"]),
+        ("questions", ["answer", "feedback"]),
+        ("questions_archive", ["answer", "feedback"]),
+        ("interviews", ["summary"]),
+        ("interviews_archive", ["summary"]),
+    ):
+        compress_columns(bind, table_name, column_names)
+
+@migration(7, "Persistent cache of generated question sets")
+def add_question_set_cache(connection):
+    Base.metadata.tables["question_set_cache"].create(bind=connection, checkfirst=True)
+
+@migration(8, "Content-addressed cache of answer evaluations")
+def add_evaluation_cache(connection):
+    Base.metadata.tables["evaluation_cache"].create(bind=connection, checkfirst=True)
+
+@migration(9, "Background job queue for evaluations, summaries and question generation")
+def add_job_queue(connection):
+    Base.metadata.tables["jobs"].create(bind=connection, checkfirst=True)
+
+@migration(10, "Question search index kept in sync by the app instead of triggers")
+def drop_search_triggers(connection):
+    # Migration 6 used to install triggers calling decompress_text(), a function only this
+    # app registers, so any other SQLite client failed to write to question_bank
+    install_search_index(connection)
+
+def run_migrations(bind=None):
+    """Apply every migration that is not yet recorded in schema_migrations"""
+    bind = bind if bind is not None else engine
+    schema_migrations.create(bind=bind, checkfirst=True)
+
+    with bind.connect() as connection:
+        applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+    for version, description, upgrade, transactional in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in applied:
+            continue
+        try:
+            if not transactional:
+                upgrade(bind)
+            with bind.begin() as connection:
+                if transactional:
+                    upgrade(connection)
+                connection.execute(
+                    schema_migrations.insert().values(
+                        version=version, description=description, applied_at=datetime.now()
+                    )
+                )
+            print(f"  ✓ Applied migration {version}: {description}")
+        except IntegrityError:
+            # Another app node recorded this version while we were applying it
+            print(f"  ✓ Migration {version} already applied by another process")
+
+def hot_queries():
+    """The filters the routers run on every dashboard, listing and interview page"""
+    return {
+        "user.dashboard: a user's interviews, newest first":
+            select(Interview).where(Interview.user_id == 1).order_by(Interview.created_at.desc()),
+        "user.start_interview: question bank for a difficulty and topics":
+            select(QuestionBank).where(QuestionBank.difficulty_id == 1, QuestionBank.topic_id.in_([1, 2])),
+        "user.answer_question_form: an interview's questions in order":
+            select(Question).where(Question.interview_id == 1).order_by(Question.question_order),
+        "interview.public_interview_session: question bank for a topic and difficulty":
+            select(QuestionBank).where(QuestionBank.topic_id == 1, QuestionBank.difficulty_id == 1),
+        "interview.public_interview_session: interview by UUID":
+            select(Interview).where(Interview.uuid == "00000000-0000-0000-0000-000000000000"),
+        "admin.dashboard: interviews by approval status":
+            select(func.count(Interview.id)).where(Interview.approval_status == "requested"),
+        "admin.dashboard: interviews by status":
+            select(func.count(Interview.id)).where(Interview.status == "completed"),
+        "admin.view_interview: an interview's questions":
+            select(Question).where(Question.interview_id == 1),
+        "queries.paginate_interviews: next page, newest first":
+            select(Interview)
+            .where(tuple_(Interview.created_at, Interview.id) < (datetime(2024, 1, 1), 100))
+            .order_by(Interview.created_at.desc(), Interview.id.desc()).limit(51),
+        "queries.paginate_interviews: next page of a user's interviews":
+            select(Interview)
+            .where(Interview.user_id == 1, tuple_(Interview.created_at, Interview.id) < (datetime(2024, 1, 1), 100))
+            .order_by(Interview.created_at.desc(), Interview.id.desc()).limit(51),
+        "queries.paginate_interviews: next page filtered by status":
+            select(Interview)
+            .where(Interview.status == "completed", tuple_(Interview.created_at, Interview.id) < (datetime(2024, 1, 1), 100))
+            .order_by(Interview.created_at.desc(), Interview.id.desc()).limit(51),
+        "queries.paginate_question_bank: next page filtered by topic":
+            select(QuestionBank)
+            .where(QuestionBank.topic_id == 1, QuestionBank.id > 100)
+            .order_by(QuestionBank.id).limit(51),
+    }
+
+def check_query_plans(bind=None):
+    """
+    Run EXPLAIN QUERY PLAN for every hot query and assert it searches an index
+
+    Returns:
+        Dict: query name -> list of plan steps
+    """
+    bind = bind if bind is not None else engine
+    if bind.dialect.name != "sqlite":
+        raise RuntimeError("EXPLAIN QUERY PLAN checks are only available on SQLite")
+
+    plans = {}
+    failures = []
+    with bind.connect() as connection:
+        for name, statement in hot_queries().items():
+            sql = str(statement.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True}))
+            steps = [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+            plans[name] = steps
+
+            # A bare "SCAN table" is a full table scan, and a temp B-tree means the
+            # ORDER BY could not be served from the index
+            uses_index = any("INDEX" in step for step in steps)
+            full_scan = any(step.startswith("SCAN") and "INDEX" not in step for step in steps)
+            sorts = any("TEMP B-TREE" in step for step in steps)
+            if not uses_index or full_scan or sorts:
+                failures.append(f"{name}: {' | '.join(steps)}")
+
+    assert not failures, "Queries not served by an index:\n" + "\n".join(failures)
+    return plans
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply schema migrations")
+    parser.add_argument("--check", action="store_true", help="Verify the hot queries use an index")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations()
+    print("✅ Schema is up to date")
+
+    if args.check:
+        for name, steps in check_query_plans().items():
+            print(f"✓ {name}")
+            for step in steps:
+                print(f"    {step}")
+        print("✅ All hot queries use an index")
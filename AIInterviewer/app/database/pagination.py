@@ -0,0 +1,117 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Listings are ordered by a unique key (created_at, id for interviews, id for users and
+question bank rows). A page fetches limit + 1 rows after the last key of the previous
+page, so every page is a bounded index range scan however deep the reader pages,
+unlike OFFSET which re-reads every skipped row. The cursor handed to clients is that
+last key, base64-encoded so it can travel in a query string.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+from fastapi import HTTPException, Query
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+@dataclass
+class Page:
+    items: List[Any]
+    next_cursor: Optional[str]
+    limit: int
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Page size within 1..MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE when not given"""
+    if not limit:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(MAX_PAGE_SIZE, limit))
+
+def encode_cursor(*values) -> str:
+    """Opaque cursor for the key of the last row on a page"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor (str): Cursor from a previous page
+        types: Expected type of each key part (datetime or int)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if len(payload) != len(types):
+            raise ValueError
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, payload)
+        )
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid pagination cursor")
+
+def keyset_after(columns, cursor: Optional[str], *types):
+    """WHERE clause selecting rows strictly after the cursor in descending key order"""
+    if not cursor:
+        return None
+    return tuple_(*columns) < decode_cursor(cursor, *types)
+
+def keyset_after_ascending(columns, cursor: Optional[str], *types):
+    """WHERE clause selecting rows strictly after the cursor in ascending key order"""
+    if not cursor:
+        return None
+    return tuple_(*columns) > decode_cursor(cursor, *types)
+
+def build_page(rows, limit: int, key) -> Page:
+    """Trim the extra look-ahead row and derive the next cursor from the last row kept"""
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(*key(items[-1])) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor, limit=limit)
+
+def page_url(request, cursor: Optional[str] = None) -> str:
+    """Current path and filters with the cursor replaced (or dropped for the first page)"""
+    params = [(key, value) for key, value in request.query_params.multi_items() if key != "cursor"]
+    if cursor:
+        params.append(("cursor", cursor))
+    return request.url.path + (f"?{urlencode(params)}" if params else "")
+
+def page_params(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE)
+) -> Dict:
+    """Dependency: cursor and page size query parameters"""
+    return {"cursor": cursor, "limit": limit}
+
+def interview_filters(
+    status: Optional[str] = None,
+    approval_status: Optional[str] = None,
+    topic_id: Optional[int] = None,
+    difficulty_id: Optional[int] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None
+) -> Dict:
+    """Dependency: server-side interview listing filters"""
+    return {
+        "status": status,
+        "approval_status": approval_status,
+        "topic_id": topic_id,
+        "difficulty_id": difficulty_id,
+        "created_from": created_from,
+        "created_to": created_to,
+    }
+
+async def fetch_page(loader, db, **kwargs) -> Page:
+    """Run a paginated loader, answering a malformed cursor with 400 Bad Request"""
+    try:
+        return await loader(db, **kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
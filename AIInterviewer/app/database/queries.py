@@ -0,0 +1,359 @@
+"""
+Purpose-built interview and question loaders shared by the routers.
+
+Templates walk relationships (interview.user, interview.topics, question.topic, ...),
+and lazy loads are not available on an AsyncSession. Every loader here therefore
+eager-loads exactly what its view renders: many-to-one relationships are joined into
+the main query and collections are fetched with one extra SELECT ... IN per collection.
+A page costs the same small, fixed number of queries however many rows it shows.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from sqlalchemy import and_, column, func, literal_column, or_, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from app.database.database import DATABASE_BACKEND
+from app.database.pagination import (
+    Page, build_page, clamp_limit, keyset_after, keyset_after_ascending
+)
+from app.database.search import (
+    POSTGRES_DOCUMENT, QUESTION_TEXT_WEIGHT, fts5_match_expression, search_terms, tsquery_expression
+)
+from app.models.models import (
+    ArchivedInterview, ArchivedQuestion, Interview, Question, QuestionBank, Topic, User
+)
+
+# Admin interview tables: candidate, difficulty, timing and topic badges per row
+INTERVIEW_LISTING_OPTIONS = (
+    joinedload(Interview.user),
+    joinedload(Interview.difficulty),
+    joinedload(Interview.timing),
+    selectinload(Interview.topics),
+)
+
+# Interview header on detail and evaluation pages
+INTERVIEW_DETAIL_OPTIONS = (
+    selectinload(Interview.topics),
+    joinedload(Interview.difficulty),
+    joinedload(Interview.timing),
+)
+
+# Session pages also render every question with its topic
+INTERVIEW_SESSION_OPTIONS = INTERVIEW_DETAIL_OPTIONS + (
+    selectinload(Interview.questions).joinedload(Question.topic),
+)
+
+# AI interview listing shows topics; the question count is stored on the interview
+AI_INTERVIEW_LISTING_OPTIONS = (
+    selectinload(Interview.topics),
+    joinedload(Interview.difficulty),
+)
+
+# Archived interviews (see app.database.archive) carry everything their evaluation and detail pages render
+ARCHIVED_INTERVIEW_OPTIONS = (
+    selectinload(ArchivedInterview.topics),
+    joinedload(ArchivedInterview.difficulty),
+    joinedload(ArchivedInterview.timing),
+    selectinload(ArchivedInterview.questions).joinedload(ArchivedQuestion.topic),
+)
+
+def _interview_filter(statement, interview_id=None, interview_uuid=None, user_id=None, model=Interview):
+    if interview_id is not None:
+        statement = statement.where(model.id == interview_id)
+    if interview_uuid is not None:
+        statement = statement.where(model.uuid == interview_uuid)
+    if user_id is not None:
+        statement = statement.where(model.user_id == user_id)
+    return statement
+
+def _date_range(column, created_from: Optional[date], created_to: Optional[date]):
+    """Conditions for an inclusive calendar-date range on a DateTime column"""
+    conditions = []
+    if created_from:
+        conditions.append(column >= datetime.combine(created_from, time.min))
+    if created_to:
+        conditions.append(column < datetime.combine(created_to + timedelta(days=1), time.min))
+    return conditions
+
+async def paginate_interviews(
+    db: AsyncSession,
+    options=(),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    user_id: Optional[int] = None,
+    status: Optional[str] = None,
+    approval_status: Optional[str] = None,
+    exclude_approval_status: Optional[str] = None,
+    topic_id: Optional[int] = None,
+    difficulty_id: Optional[int] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None
+) -> Page:
+    """
+    One page of interviews, newest first, filtered in SQL
+
+    Args:
+        options: Loader options for what the caller renders, e.g. INTERVIEW_LISTING_OPTIONS
+        cursor (str): next_cursor of the previous page
+        limit (int): Page size, clamped to MAX_PAGE_SIZE
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = clamp_limit(limit)
+    statement = select(Interview).options(*options)
+
+    conditions = _date_range(Interview.created_at, created_from, created_to)
+    if user_id is not None:
+        conditions.append(Interview.user_id == user_id)
+    if status:
+        conditions.append(Interview.status == status)
+    if approval_status:
+        conditions.append(Interview.approval_status == approval_status)
+    elif exclude_approval_status:
+        conditions.append(Interview.approval_status != exclude_approval_status)
+    if topic_id is not None:
+        conditions.append(Interview.topics.any(Topic.id == topic_id))
+    if difficulty_id is not None:
+        conditions.append(Interview.difficulty_id == difficulty_id)
+    after = keyset_after((Interview.created_at, Interview.id), cursor, datetime, int)
+    if after is not None:
+        conditions.append(after)
+
+    rows = (await db.scalars(
+        statement.where(*conditions)
+        .order_by(Interview.created_at.desc(), Interview.id.desc())
+        .limit(limit + 1)
+    )).all()
+    return build_page(rows, limit, lambda interview: (interview.created_at, interview.id))
+
+async def paginate_users(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    is_admin: Optional[bool] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    search: Optional[str] = None
+) -> Page:
+    """
+    One page of users in id order, filtered in SQL
+
+    Args:
+        search (str): Start of the username or email (case-insensitive), e.g. typed in a user picker
+    """
+    limit = clamp_limit(limit)
+    conditions = _date_range(User.created_at, created_from, created_to)
+    if is_active is not None:
+        conditions.append(User.is_active == is_active)
+    if is_admin is not None:
+        conditions.append(User.is_admin == is_admin)
+    if search:
+        # Typed % and _ match themselves
+        prefix = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        conditions.append(or_(User.username.ilike(prefix, escape="\\"), User.email.ilike(prefix, escape="\\")))
+    after = keyset_after_ascending((User.id,), cursor, int)
+    if after is not None:
+        conditions.append(after)
+
+    rows = (await db.scalars(
+        select(User).where(*conditions).order_by(User.id).limit(limit + 1)
+    )).all()
+    return build_page(rows, limit, lambda user: (user.id,))
+
+def _question_bank_conditions(
+    topic_id: Optional[int] = None,
+    difficulty_id: Optional[int] = None,
+    has_model_answer: Optional[bool] = None
+):
+    conditions = []
+    if topic_id is not None:
+        conditions.append(QuestionBank.topic_id == topic_id)
+    if difficulty_id is not None:
+        conditions.append(QuestionBank.difficulty_id == difficulty_id)
+    if has_model_answer is True:
+        conditions.append(and_(QuestionBank.model_answer.isnot(None), QuestionBank.model_answer != ""))
+    elif has_model_answer is False:
+        conditions.append(or_(QuestionBank.model_answer.is_(None), QuestionBank.model_answer == ""))
+    return conditions
+
+async def paginate_question_bank(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    topic_id: Optional[int] = None,
+    difficulty_id: Optional[int] = None,
+    has_model_answer: Optional[bool] = None,
+    search: Optional[str] = None
+) -> Page:
+    """
+    One page of the question bank in id order with topic and difficulty joined in
+
+    Args:
+        search (str): Search box query; when given, pages are ranked by relevance instead
+    """
+    if search:
+        return await search_question_bank(
+            db, search, cursor, limit, topic_id, difficulty_id, has_model_answer
+        )
+    limit = clamp_limit(limit)
+    conditions = _question_bank_conditions(topic_id, difficulty_id, has_model_answer)
+    after = keyset_after_ascending((QuestionBank.id,), cursor, int)
+    if after is not None:
+        conditions.append(after)
+
+    rows = (await db.scalars(
+        select(QuestionBank)
+        .options(joinedload(QuestionBank.topic), joinedload(QuestionBank.difficulty))
+        .where(*conditions)
+        .order_by(QuestionBank.id)
+        .limit(limit + 1)
+    )).all()
+    return build_page(rows, limit, lambda question: (question.id,))
+
+def _search_matches(terms):
+    """Subquery of (id, score) for every matching question; a lower score is a better match"""
+    if DATABASE_BACKEND == "postgresql":
+        query = func.to_tsquery(literal_column("'english'"), tsquery_expression(terms))
+        return select(
+            QuestionBank.id.label("id"),
+            (-func.ts_rank(POSTGRES_DOCUMENT, query)).label("score")
+        ).where(POSTGRES_DOCUMENT.op("@@")(query)).subquery()
+
+    # bm25() is negative, best match lowest; question_text is weighted above model_answer
+    fts = table("question_bank_fts", column("rowid"))
+    return select(
+        fts.c.rowid.label("id"),
+        literal_column(f"bm25(question_bank_fts, {QUESTION_TEXT_WEIGHT}, 1.0)").label("score")
+    ).where(literal_column("question_bank_fts").op("MATCH")(fts5_match_expression(terms))).subquery()
+
+async def search_question_bank(
+    db: AsyncSession,
+    query: str,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    topic_id: Optional[int] = None,
+    difficulty_id: Optional[int] = None,
+    has_model_answer: Optional[bool] = None
+) -> Page:
+    """
+    One page of question bank rows matching a search box query, best match first
+
+    Matching runs on the full-text index (see app.database.search), so only matching
+    rows are read. Every word must match (after stemming). Pages are keyed
+    on (score, id).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = clamp_limit(limit)
+    terms = search_terms(query)
+    if not terms:
+        return Page(items=[], next_cursor=None, limit=limit)
+
+    matches = _search_matches(terms)
+    conditions = _question_bank_conditions(topic_id, difficulty_id, has_model_answer)
+    after = keyset_after_ascending((matches.c.score, matches.c.id), cursor, float, int)
+    if after is not None:
+        conditions.append(after)
+
+    rows = (await db.execute(
+        select(QuestionBank, matches.c.score)
+        .join(matches, QuestionBank.id == matches.c.id)
+        .options(joinedload(QuestionBank.topic), joinedload(QuestionBank.difficulty))
+        .where(*conditions)
+        .order_by(matches.c.score, matches.c.id)
+        .limit(limit + 1)
+    )).all()
+    page = build_page(rows, limit, lambda row: (row.score, row[0].id))
+    page.items = [question for question, score in page.items]
+    return page
+
+async def list_recent_interviews(db: AsyncSession, limit: int = 5):
+    """Newest interviews; the dashboard only renders their own columns"""
+    return (await db.scalars(
+        select(Interview).order_by(Interview.created_at.desc()).limit(limit)
+    )).all()
+
+async def get_interview(db: AsyncSession, interview_id=None, interview_uuid=None, user_id=None):
+    """A bare interview row for status updates, by id or UUID and optionally owner"""
+    return await db.scalar(_interview_filter(select(Interview), interview_id, interview_uuid, user_id))
+
+async def get_archived_interview(db: AsyncSession, interview_id=None, interview_uuid=None, user_id=None):
+    """An archived interview with its topics, difficulty, timing and ordered questions"""
+    statement = select(ArchivedInterview).options(*ARCHIVED_INTERVIEW_OPTIONS)
+    return await db.scalar(_interview_filter(statement, interview_id, interview_uuid, user_id, ArchivedInterview))
+
+async def get_interview_detail(
+    db: AsyncSession,
+    interview_id=None,
+    interview_uuid=None,
+    user_id=None,
+    include_archived: bool = False
+):
+    """
+    An interview with its topics, difficulty and timing
+
+    Args:
+        include_archived (bool): Fall back to the archive tier for read-only pages
+    """
+    statement = select(Interview).options(*INTERVIEW_DETAIL_OPTIONS)
+    interview = await db.scalar(_interview_filter(statement, interview_id, interview_uuid, user_id))
+    if interview is None and include_archived:
+        interview = await get_archived_interview(db, interview_id, interview_uuid, user_id)
+    return interview
+
+async def get_interview_session(
+    db: AsyncSession,
+    interview_id=None,
+    interview_uuid=None,
+    user_id=None,
+    refresh: bool = False,
+    include_archived: bool = False
+):
+    """
+    An interview with its detail relationships plus every question and question topic
+
+    Args:
+        refresh (bool): Overwrite already-loaded instances, e.g. after adding questions
+        include_archived (bool): Fall back to the archive tier for read-only pages
+    """
+    statement = _interview_filter(
+        select(Interview).options(*INTERVIEW_SESSION_OPTIONS), interview_id, interview_uuid, user_id
+    )
+    if refresh:
+        statement = statement.execution_options(populate_existing=True)
+    interview = await db.scalar(statement)
+    if interview is None and include_archived:
+        interview = await get_archived_interview(db, interview_id, interview_uuid, user_id)
+    return interview
+
+async def list_interview_questions(
+    db: AsyncSession,
+    interview_id: int,
+    with_topic: bool = True,
+    archived: bool = False
+):
+    """An interview's questions in order (served by ix_questions_interview_order or its archive twin)"""
+    model = ArchivedQuestion if archived else Question
+    statement = (
+        select(model).where(model.interview_id == interview_id).order_by(model.question_order)
+    )
+    if with_topic:
+        statement = statement.options(joinedload(model.topic))
+    return (await db.scalars(statement)).all()
+
+async def get_interview_question(db: AsyncSession, interview_id: int, question_id: int, with_topic: bool = False):
+    """One question, only if it belongs to the given interview"""
+    statement = select(Question).where(Question.id == question_id, Question.interview_id == interview_id)
+    if with_topic:
+        statement = statement.options(joinedload(Question.topic))
+    return await db.scalar(statement)
+
+async def list_question_bank(db: AsyncSession):
+    """The whole question bank with topic and difficulty joined in"""
+    return (await db.scalars(
+        select(QuestionBank).options(joinedload(QuestionBank.topic), joinedload(QuestionBank.difficulty))
+    )).all()
@@ -0,0 +1,171 @@
+"""
+Full-text search index over the question bank.
+
+SQLite keeps an FTS5 table (question_bank_fts) over question_text and model_answer.
+It is an external-content table: it stores only the inverted index and reads the
+text back from question_bank. model_answer may be stored compressed (see
+app.database.compression), which SQL cannot read, so the app keeps the index in
+sync itself: ORM writes to QuestionBank update it in the same transaction, and
+bulk inserts call index_questions for the new rows. Other SQLite clients can write
+to question_bank, but their changes are only searchable after a rebuild:
+
+    python -m app.database.search
+
+PostgreSQL uses a GIN index over the same tsvector expression that search queries use.
+
+The DDL is attached to the question_bank table's create and drop events, so
+create_all() builds the index on a fresh database. Migration 3 installs it on
+existing ones.
+"""
+
+import re
+from sqlalchemy import event, literal_column, select, text
+
+# Highest number of terms taken from a search box query
+MAX_SEARCH_TERMS = 16
+
+# Ranking weight of question_text relative to model_answer
+QUESTION_TEXT_WEIGHT = 2.0
+
+# Question bank rows read and indexed per statement when (re)building the index
+SEARCH_INDEX_BATCH_SIZE = 1000
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS question_bank_fts USING fts5(
+        question_text, model_answer,
+        content='question_bank', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+]
+
+# Sync triggers of earlier versions; model_answer may be compressed, which SQL triggers cannot read
+SQLITE_SEARCH_TRIGGERS = ["question_bank_fts_insert", "question_bank_fts_delete", "question_bank_fts_update"]
+
+# Must be the same expression as POSTGRES_DOCUMENT below, or the planner cannot use the index
+POSTGRES_SEARCH_DDL = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_question_bank_search ON question_bank USING gin (
+        (setweight(to_tsvector('english', coalesce(question_text, '')), 'A') ||
+         setweight(to_tsvector('english', coalesce(model_answer, '')), 'B'))
+    )
+    """,
+]
+
+POSTGRES_DOCUMENT = literal_column(
+    "(setweight(to_tsvector('english', coalesce(question_text, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(model_answer, '')), 'B'))"
+)
+
+def _question_bank():
+    from app.database.database import Base
+    return Base.metadata.tables["question_bank"]
+
+def _indexed_text(connection, ids=None, after_id: int = 0):
+    """Batches of (id, question_text, model_answer) as text; model_answer is decompressed by its column type"""
+    question_bank = _question_bank()
+    last_id = after_id
+    while True:
+        statement = (
+            select(question_bank.c.id, question_bank.c.question_text, question_bank.c.model_answer)
+            .where(question_bank.c.id > last_id)
+            .order_by(question_bank.c.id)
+            .limit(SEARCH_INDEX_BATCH_SIZE)
+        )
+        if ids is not None:
+            statement = statement.where(question_bank.c.id.in_(ids))
+        rows = connection.execute(statement).all()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield [{"b_id": row_id, "b_question": question, "b_answer": answer} for row_id, question, answer in rows]
+
+def index_questions(connection, ids=None, after_id: int = 0):
+    """
+    Add question bank rows to the SQLite index; call after inserting or updating them
+
+    Args:
+        connection: Connection that wrote the rows
+        ids: Rows to index (default: all rows after after_id)
+        after_id (int): Index only rows with a higher id, e.g. the highest id before a bulk insert
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for batch in _indexed_text(connection, ids, after_id):
+        connection.execute(
+            text("INSERT INTO question_bank_fts(rowid, question_text, model_answer) VALUES (:b_id, :b_question, :b_answer)"),
+            batch
+        )
+
+def unindex_questions(connection, ids):
+    """Remove question bank rows from the SQLite index; call before updating or deleting them"""
+    if connection.dialect.name != "sqlite":
+        return
+    for batch in _indexed_text(connection, ids):
+        # An external-content index is told the text it indexed for the row
+        connection.execute(
+            text(
+                "INSERT INTO question_bank_fts(question_bank_fts, rowid, question_text, model_answer) "
+                "VALUES ('delete', :b_id, :b_question, :b_answer)"
+            ),
+            batch
+        )
+
+def rebuild_search_index(connection):
+    """Re-index every question bank row (SQLite). Not FTS5's 'rebuild': that reads model_answer as stored"""
+    if connection.dialect.name != "sqlite":
+        return
+    connection.execute(text("INSERT INTO question_bank_fts(question_bank_fts) VALUES ('delete-all')"))
+    index_questions(connection)
+
+def install_search_index(connection):
+    """Create the search index for the connection's dialect and build its contents"""
+    if connection.dialect.name == "sqlite":
+        for trigger in SQLITE_SEARCH_TRIGGERS:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        for statement in SQLITE_SEARCH_DDL:
+            connection.execute(text(statement))
+        rebuild_search_index(connection)
+    elif connection.dialect.name == "postgresql":
+        for statement in POSTGRES_SEARCH_DDL:
+            connection.execute(text(statement))
+
+def drop_search_index(connection):
+    """Drop the FTS table with question_bank"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS question_bank_fts"))
+
+def register_search_index(model):
+    """Build and drop the search index with the model's table, and keep it in sync with ORM writes"""
+    table = model.__table__
+    event.listen(table, "after_create", lambda target, connection, **kw: install_search_index(connection))
+    event.listen(table, "before_drop", lambda target, connection, **kw: drop_search_index(connection))
+    event.listen(model, "after_insert", lambda mapper, connection, target: index_questions(connection, [target.id]))
+    event.listen(model, "before_update", lambda mapper, connection, target: unindex_questions(connection, [target.id]))
+    event.listen(model, "after_update", lambda mapper, connection, target: index_questions(connection, [target.id]))
+    event.listen(model, "before_delete", lambda mapper, connection, target: unindex_questions(connection, [target.id]))
+
+def search_terms(query: str):
+    """Word tokens of a search box query; punctuation and operators are dropped"""
+    return re.findall(r"\w+", query or "")[:MAX_SEARCH_TERMS]
+
+def fts5_match_expression(terms) -> str:
+    """
+    FTS5 query requiring every term; each is quoted so user input is never parsed as syntax
+
+    Terms match whole words after Porter stemming ("decorators" finds "decorator").
+    Prefix queries are avoided on purpose: a short prefix merges the postings of
+    every word it expands to and is many times slower on a large bank.
+    """
+    return " ".join(f'"{term}"' for term in terms)
+
+def tsquery_expression(terms) -> str:
+    """PostgreSQL equivalent of fts5_match_expression for to_tsquery()"""
+    return " & ".join(terms)
+
+if __name__ == "__main__":
+    from app.database.database import engine
+
+    with engine.begin() as connection:
+        rebuild_search_index(connection)
+    print("✅ Question bank search index rebuilt")
@@ -0,0 +1,200 @@
+"""
+Startup seeding of reference data and the question bank.
+
+The seed content (SEED_QUESTIONS, the standard timings and the default admin) is hashed
+and the fingerprint stored in the seed_state table. When the fingerprint is unchanged,
+startup skips seeding after a single primary-key lookup. Otherwise topics, difficulties
+and questions are loaded with set-based inserts in one transaction.
+
+Schema creation, migrations and seeding run under a startup lock so several uvicorn
+workers booting together do the work exactly once.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from sqlalchemy import Column, DateTime, MetaData, String, Table, func, insert, select, text
+from app.database.database import SessionLocal, engine
+from app.database.search import index_questions
+from app.database.seed_questions import SEED_QUESTIONS
+from app.models.models import Topic, Difficulty, Timing, User, QuestionBank
+
+try:
+    import fcntl
+except ImportError:  # Windows: workers there cannot share a lock file this way
+    fcntl = None
+
+# Standard interview timings (independent of the questions)
+SEED_TIMINGS = [
+    {"name": "15 Minutes", "minutes": 15},
+    {"name": "30 Minutes", "minutes": 30},
+    {"name": "45 Minutes", "minutes": 45},
+    {"name": "60 Minutes", "minutes": 60},
+    {"name": "90 Minutes", "minutes": 90},
+    {"name": "120 Minutes", "minutes": 120},
+]
+
+SEED_ADMIN = {
+    "username": "admin",
+    "email": "admin@techinterviewer.com",
+    "password": "admin",
+}
+
+# Lock file shared by the workers of one host
+SEED_LOCK_FILE = os.getenv("SEED_LOCK_FILE", os.path.join(tempfile.gettempdir(), "techinterviewer-seed.lock"))
+
+# Arbitrary constant identifying the seeding advisory lock on PostgreSQL
+POSTGRES_SEED_LOCK_KEY = 7305142
+
+seed_metadata = MetaData()
+
+seed_state = Table(
+    "seed_state",
+    seed_metadata,
+    Column("name", String, primary_key=True),
+    Column("fingerprint", String),
+    Column("seeded_at", DateTime)
+)
+
+def seed_fingerprint():
+    """Content hash of everything the seeder writes"""
+    content = json.dumps(
+        {"questions": SEED_QUESTIONS, "timings": SEED_TIMINGS, "admin": SEED_ADMIN},
+        sort_keys=True
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+@contextmanager
+def startup_lock():
+    """Exclusive lock held while one worker creates the schema and seeds the database"""
+    if fcntl is None:
+        yield
+        return
+
+    with open(SEED_LOCK_FILE, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _stored_fingerprint(db):
+    return db.execute(
+        select(seed_state.c.fingerprint).where(seed_state.c.name == "initial_data")
+    ).scalar()
+
+def _seed_timings(db):
+    """Make sure exactly one timing with the standard name exists for each standard duration"""
+    minutes_in_db = {}
+    for timing in db.query(Timing).all():
+        minutes_in_db.setdefault(timing.minutes, []).append(timing)
+
+    for timing_data in SEED_TIMINGS:
+        minutes = timing_data["minutes"]
+        std_name = timing_data["name"]
+        existing_timings = minutes_in_db.get(minutes, [])
+
+        if not any(timing.name == std_name for timing in existing_timings):
+            db.add(Timing(name=std_name, minutes=minutes))
+            print(f"  ✓ Added timing: {std_name} ({minutes} min)")
+
+        # Silently remove non-standard names for the same duration
+        for timing in existing_timings:
+            if timing.name != std_name:
+                db.delete(timing)
+
+def _seed_reference_rows(db, model, names):
+    """Insert the missing names in one statement and return a name -> id map"""
+    existing = set(db.execute(select(model.name)).scalars())
+    missing = [name for name in names if name not in existing]
+    if missing:
+        db.execute(insert(model), [{"name": name} for name in missing])
+        print(f"  ✓ Added {model.__tablename__}: {', '.join(missing)}")
+    return dict(db.execute(select(model.name, model.id)).all())
+
+def _seed_questions(db, topic_ids, difficulty_ids):
+    """Insert every seed question that is not in the bank yet, with its model answer"""
+    existing = set(db.execute(select(QuestionBank.topic_id, QuestionBank.question_text)).all())
+
+    rows = []
+    for topic_name, questions_list in SEED_QUESTIONS.items():
+        topic_id = topic_ids[topic_name]
+        for q_data in questions_list:
+            if (topic_id, q_data["question"]) in existing:
+                continue
+            rows.append({
+                "topic_id": topic_id,
+                "difficulty_id": difficulty_ids[q_data["difficulty"]],
+                "question_text": q_data["question"],
+                "model_answer": str(q_data["answer"]) if "answer" in q_data else None,
+            })
+
+    if rows:
+        # Bulk inserts skip the ORM events that keep the search index in sync
+        last_id = db.scalar(select(func.max(QuestionBank.id))) or 0
+        db.execute(insert(QuestionBank), rows)
+        index_questions(db.connection(), after_id=last_id)
+    return len(rows)
+
+def seed_initial_data(force: bool = False):
+    """
+    Seed topics, difficulties, timings, the default admin and the question bank
+
+    Args:
+        force (bool): Seed even when the stored fingerprint matches
+
+    Returns:
+        bool: True if seeding ran, False if the database was already up to date
+    """
+    fingerprint = seed_fingerprint()
+    seed_state.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        if engine.dialect.name == "postgresql":
+            # Serialize seeding across app nodes; released when the transaction ends
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": POSTGRES_SEED_LOCK_KEY})
+
+        if not force and _stored_fingerprint(db) == fingerprint:
+            print("✓ Seed data unchanged, skipping seeding")
+            db.rollback()
+            return False
+
+        # Topics come from the SEED_QUESTIONS keys, difficulties from the questions themselves
+        topic_names = list(SEED_QUESTIONS.keys())
+        difficulty_names = sorted({q["difficulty"] for questions in SEED_QUESTIONS.values() for q in questions})
+        print(f"📚 Seeding {len(topic_names)} topics and {len(difficulty_names)} difficulty levels")
+
+        topic_ids = _seed_reference_rows(db, Topic, topic_names)
+        difficulty_ids = _seed_reference_rows(db, Difficulty, difficulty_names)
+        _seed_timings(db)
+
+        # Seed default admin user
+        if not db.query(User).filter(User.username == SEED_ADMIN["username"]).first():
+            from app.services.auth import get_password_hash
+            db.add(User(
+                username=SEED_ADMIN["username"],
+                email=SEED_ADMIN["email"],
+                hashed_password=get_password_hash(SEED_ADMIN["password"]),
+                is_admin=True
+            ))
+
+        questions_added = _seed_questions(db, topic_ids, difficulty_ids)
+
+        # Record the fingerprint in the same transaction as the data it describes
+        db.execute(seed_state.delete().where(seed_state.c.name == "initial_data"))
+        db.execute(seed_state.insert().values(
+            name="initial_data", fingerprint=fingerprint, seeded_at=datetime.now()
+        ))
+        db.commit()
+        print(f"✓ Seeded {questions_added} new questions with model answers")
+        return True
+    except Exception as e:
+        print(f"Error seeding data: {str(e)}")
+        db.rollback()
+        return False
+    finally:
+        db.close()
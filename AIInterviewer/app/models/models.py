@@ -1,9 +1,9 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, Table, DateTime, Float
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, Table, DateTime, Float, Index, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
-
-Base = declarative_base()
+from app.database.database import Base
+from app.database.compression import CompressedText
+from app.database.search import register_search_index
 
 # Association table for many-to-many relationship between Interview and Topic
 interview_topics = Table(
@@ -27,9 +27,8 @@ class User(Base):
     # Relationships
     interviews = relationship("Interview", foreign_keys="Interview.user_id", back_populates="user")
 
-class Interview(Base):
-    __tablename__ = "interviews"
-
+class InterviewColumns:
+    """Columns shared by Interview and ArchivedInterview"""
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String, unique=True, index=True)
     candidate_name = Column(String)
@@ -42,14 +41,35 @@ class Interview(Base):
     approved_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     approved_at = Column(DateTime, nullable=True)
     admin_notes = Column(Text, nullable=True)
-    summary = Column(Text, nullable=True)
+    summary = Column(CompressedText, nullable=True)
     created_at = Column(DateTime, default=datetime.now)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     
+    # Progress and score aggregates maintained by InterviewProgress with every question write (migration 4)
+    question_count = Column(Integer, default=0, server_default="0", nullable=False)
+    answered_count = Column(Integer, default=0, server_default="0", nullable=False)
+    scored_count = Column(Integer, default=0, server_default="0", nullable=False)
+    total_score = Column(Integer, default=0, server_default="0", nullable=False)
+    average_score = Column(Float, nullable=True)  # total_score / scored_count
+    topic_scores = Column(JSON, nullable=True)  # str(topic_id) -> questions, answered, scored, total
+
+class Interview(InterviewColumns, Base):
+    __tablename__ = "interviews"
+    
+    is_archived = False
+    
+    # Indexes for the dashboard filters and keyset-paginated listings (migrations 1 and 2)
+    __table_args__ = (
+        Index("ix_interviews_user_created", "user_id", "created_at"),
+        Index("ix_interviews_created", "created_at", "id"),
+        Index("ix_interviews_status_created", "status", "created_at", "id"),
+        Index("ix_interviews_approval_created", "approval_status", "created_at", "id"),
+    )
+    
     # Relationships
-    user = relationship("User", foreign_keys=[user_id], back_populates="interviews")
-    approver = relationship("User", foreign_keys=[approved_by])
+    user = relationship("User", foreign_keys="Interview.user_id", back_populates="interviews")
+    approver = relationship("User", foreign_keys="Interview.approved_by")
     difficulty = relationship("Difficulty", back_populates="interviews")
     timing = relationship("Timing", back_populates="interviews")
     topics = relationship("Topic", secondary=interview_topics, back_populates="interviews")
@@ -90,25 +110,139 @@ class QuestionBank(Base):
     topic_id = Column(Integer, ForeignKey("topics.id"))
     difficulty_id = Column(Integer, ForeignKey("difficulties.id"))
     question_text = Column(Text)
-    model_answer = Column(Text, nullable=True)  # Added this field for sample answers
+    model_answer = Column(CompressedText, nullable=True)  # Added this field for sample answers
+    
+    __table_args__ = (
+        Index("ix_question_bank_topic_difficulty", "topic_id", "difficulty_id"),
+        Index("ix_question_bank_topic_id", "topic_id", "id"),
+    )
     
     # Relationships
     topic = relationship("Topic")
     difficulty = relationship("Difficulty")
 
-class Question(Base):
-    __tablename__ = "questions"
+# Full-text index over question_text and model_answer, built and dropped with the table
+register_search_index(QuestionBank)
 
+class QuestionColumns:
+    """Columns shared by Question and ArchivedQuestion (interview_id differs in its foreign key)"""
     id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("interviews.id"))
     topic_id = Column(Integer, ForeignKey("topics.id"))
     question_text = Column(Text)
-    answer = Column(Text, nullable=True)
-    feedback = Column(Text, nullable=True)
+    answer = Column(CompressedText, nullable=True)
+    feedback = Column(CompressedText, nullable=True)
     score = Column(Integer, nullable=True)
     question_order = Column(Integer, nullable=True)  # Renamed from 'order' to avoid SQL keyword conflict
     answered_at = Column(DateTime, nullable=True)
+
+class Question(QuestionColumns, Base):
+    __tablename__ = "questions"
+
+    interview_id = Column(Integer, ForeignKey("interviews.id"))
+    
+    __table_args__ = (
+        Index("ix_questions_interview_order", "interview_id", "question_order"),
+    )
     
     # Relationships
     interview = relationship("Interview", back_populates="questions")
     topic = relationship("Topic")
+
+# Archive tier: completed interviews moved out of the hot tables by app.database.archive (migration 5).
+# Rows keep their original ids, so links to archived interviews and questions keep working.
+interview_topics_archive = Table(
+    "interview_topics_archive",
+    Base.metadata,
+    Column("interview_id", Integer, ForeignKey("interviews_archive.id"), primary_key=True),
+    Column("topic_id", Integer, ForeignKey("topics.id"), primary_key=True)
+)
+
+class ArchivedInterview(InterviewColumns, Base):
+    __tablename__ = "interviews_archive"
+    
+    is_archived = True
+    archived_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        Index("ix_interviews_archive_user_created", "user_id", "created_at"),
+    )
+    
+    # Relationships (read-only views of the same reference rows as Interview)
+    user = relationship("User", foreign_keys="ArchivedInterview.user_id")
+    approver = relationship("User", foreign_keys="ArchivedInterview.approved_by")
+    difficulty = relationship("Difficulty")
+    timing = relationship("Timing")
+    topics = relationship("Topic", secondary=interview_topics_archive)
+    questions = relationship(
+        "ArchivedQuestion", back_populates="interview",
+        order_by="(ArchivedQuestion.question_order, ArchivedQuestion.id)"
+    )
+
+class ArchivedQuestion(QuestionColumns, Base):
+    __tablename__ = "questions_archive"
+
+    interview_id = Column(Integer, ForeignKey("interviews_archive.id"))
+    
+    __table_args__ = (
+        Index("ix_questions_archive_interview_order", "interview_id", "question_order"),
+    )
+    
+    # Relationships
+    interview = relationship("ArchivedInterview", back_populates="questions")
+    topic = relationship("Topic")
+
+class CachedQuestionSet(Base):
+    """Generated question set kept by app.services.question_cache (migration 7)"""
+    __tablename__ = "question_set_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String, unique=True, index=True)  # hash of the normalized prompt, model and temperature
+    model = Column(String)
+    temperature = Column(Float)
+    questions = Column(CompressedText)  # JSON list of question_text / expected_answer objects
+    size_bytes = Column(Integer, default=0, nullable=False)
+    generation_seconds = Column(Float, default=0.0, nullable=False)  # API time the set cost, saved by every hit
+    hits = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+    last_used_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        Index("ix_question_set_cache_last_used", "last_used_at", "id"),
+    )
+
+class CachedEvaluation(Base):
+    """Answer evaluation kept by app.services.evaluation_cache (migration 8)"""
+    __tablename__ = "evaluation_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String, unique=True, index=True)  # hash of the exact evaluation prompt, model and temperature
+    model = Column(String)
+    evaluation = Column(CompressedText)  # JSON with score, feedback, strengths and areas_for_improvement
+    created_at = Column(DateTime, default=datetime.now)
+    
+    __table_args__ = (
+        Index("ix_evaluation_cache_created", "created_at"),
+    )
+
+class Job(Base):
+    """Background job run by app.services.job_queue (migration 9)"""
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    uuid = Column(String, unique=True, index=True)  # public id used by the polling endpoint
+    kind = Column(String)  # evaluate_answer, summarize_interview, generate_interview
+    status = Column(String, default="queued")  # queued, running, succeeded, failed
+    payload = Column(JSON)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    run_after = Column(DateTime, default=datetime.now)  # not claimed before this time (retry backoff)
+    locked_until = Column(DateTime, nullable=True)  # a running job past this time was abandoned by its worker
+    created_at = Column(DateTime, default=datetime.now)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after", "id"),
+    )
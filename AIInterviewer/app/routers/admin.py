@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Form, Query
 from fastapi.responses import RedirectResponse, HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Dict, List, Optional
 import json
-from datetime import datetime
-from app.database.database import get_db
+from datetime import date, datetime
+from app.database.database import get_async_db
+from app.database import queries
+from app.database.pagination import fetch_page, interview_filters, page_params, page_url
 from app.models.models import User, Interview, Topic, Difficulty, Timing, Question, QuestionBank
 from app.services.auth import validate_admin
+from app.services.evaluation_cache import evaluation_cache
+from app.services.statistics import StatisticsService
+from app.services.reference_data import reference_data
+from app.services.user_principals import user_principals
+from app.schemas.schemas import InterviewPage, QuestionBankPage, UserPage
 
 router = APIRouter(
     prefix="/admin",
@@ -16,62 +25,97 @@ router = APIRouter(
 
 templates = Jinja2Templates(directory="app/templates")
 templates.env.globals['datetime'] = datetime
+templates.env.globals['page_url'] = page_url
+
+# Pending interview requests listed above the interview listing
+PENDING_REQUESTS_SHOWN = 10
+
+def question_bank_filters(
+    q: Optional[str] = Query(None, max_length=200),
+    topic_id: Optional[int] = None,
+    difficulty_id: Optional[int] = None,
+    answer: Optional[str] = Query(None, pattern="^(answered|unanswered)$")
+) -> Dict:
+    """
+    Dependency: question bank filters
+
+    q is a full-text search over question and model answer (results ranked by relevance);
+    answer=answered|unanswered filters on the model answer.
+    """
+    return {
+        "search": q.strip() if q else None,
+        "topic_id": topic_id,
+        "difficulty_id": difficulty_id,
+        "has_model_answer": None if answer is None else answer == "answered",
+    }
+
+def user_filters(
+    user_status: Optional[str] = Query(None, alias="status", pattern="^(active|inactive)$"),
+    role: Optional[str] = Query(None, pattern="^(admin|user)$"),
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    q: Optional[str] = Query(None, max_length=100)
+) -> Dict:
+    """Dependency: user listing filters; q matches the start of the username or email"""
+    return {
+        "is_active": None if user_status is None else user_status == "active",
+        "is_admin": None if role is None else role == "admin",
+        "created_from": created_from,
+        "created_to": created_to,
+        "search": q.strip() if q else None,
+    }
 
 @router.get("/questions")
 async def list_questions(
     request: Request,
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(question_bank_filters),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # We only want to show questions from the question bank, not from interviews
-    
-    # Get questions from the question bank
-    question_bank = db.query(QuestionBank).all()
-    
-    # Prepare data for the template
-    question_bank_items = []
-    
-    # Process question bank items
-    for qb in question_bank:
-        # Only include if we have topic and difficulty
-        if qb.topic and qb.difficulty:
-            question_bank_items.append({
-                "id": qb.id,  # Prefix to distinguish from interview questions
-                "question_text": qb.question_text,
-                "answer": None,
-                "model_answer": qb.model_answer,  # No answer for question bank items
-                "model_answer": qb.model_answer,  # Include model answer if available
-                "topic": qb.topic,
-                "difficulty": qb.difficulty,
-                "interview": None  # No interview for question bank items
-            })
+    # One page of the question bank, filtered in SQL
+    page = await fetch_page(queries.paginate_question_bank, db, **paging, **filters)
     
     # Get all topics and difficulties for filters
-    topics = db.query(Topic).all()
-    difficulties = db.query(Difficulty).all()
+    topics = await reference_data.topics(db)
+    difficulties = await reference_data.difficulties(db)
     
     return templates.TemplateResponse(
         "admin/questions.html", 
         {
             "request": request, 
             "admin": admin,
-            "all_questions": question_bank_items,
+            "all_questions": page.items,
+            "page": page,
+            "filters": filters,
             "topics": topics,
             "difficulties": difficulties
         }
     )
+
+@router.get("/api/questions", response_model=QuestionBankPage)
+async def list_questions_json(
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(question_bank_filters),
+    admin: User = Depends(validate_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """JSON variant of the question bank listing; with q, a ranked full-text search"""
+    page = await fetch_page(queries.paginate_question_bank, db, **paging, **filters)
+    return QuestionBankPage.model_validate(page, from_attributes=True)
 @router.get("/questions-debug")
 async def list_questions_debug(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Debug version of the questions list that shows raw data"""
     # Get questions from actual interviews - these will have answers
-    interview_questions = db.query(Question).all()
+    interview_questions = (await db.scalars(select(Question).options(joinedload(Question.topic)))).all()
     
     # Get questions from the question bank
-    question_bank = db.query(QuestionBank).all()
+    question_bank = await queries.list_question_bank(db)
     
     # Create simple response
     interview_q_data = [{"id": q.id, "text": q.question_text[:50], "has_topic": bool(q.topic)} for q in interview_questions]
@@ -104,66 +148,61 @@ async def list_questions_debug(
 async def dashboard(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get stats for dashboard
-    user_count = db.query(User).count()
-    interview_count = db.query(Interview).count()
-    requested_interviews_count = db.query(Interview).filter(Interview.approval_status == "requested").count()
-    
-    # Get additional stats
-    completed_count = db.query(Interview).filter(Interview.status == "completed").count()
-    in_progress_count = db.query(Interview).filter(Interview.status == "in_progress").count()
-    rejected_count = db.query(Interview).filter(Interview.approval_status == "rejected").count()
-    
-    # Get counts for the question bank
-    question_count = db.query(QuestionBank).count()
-    topic_count = db.query(Topic).count()
-    difficulty_count = db.query(Difficulty).count()
+    # Get stats for dashboard (one aggregate query, cached for a few seconds)
+    stats = await StatisticsService.get_dashboard_stats(db)
     
     # Get recent interviews
-    recent_interviews = db.query(Interview).order_by(Interview.created_at.desc()).limit(5).all()
+    recent_interviews = await queries.list_recent_interviews(db, limit=5)
     
     return templates.TemplateResponse(
         "admin/dashboard.html", 
         {
             "request": request, 
             "admin": admin,
-            "user_count": user_count,
-            "interview_count": interview_count,
-            "requested_interviews_count": requested_interviews_count,
             "recent_interviews": recent_interviews,
-            "completed_count": completed_count,
-            "in_progress_count": in_progress_count,
-            "rejected_count": rejected_count,
-            "question_count": question_count,
-            "topic_count": topic_count,
-            "difficulty_count": difficulty_count
+            **stats
         }
     )
 
 @router.get("/users")
 async def list_users(
     request: Request,
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(user_filters),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    users = db.query(User).all()
+    page = await fetch_page(queries.paginate_users, db, **paging, **filters)
     
     return templates.TemplateResponse(
         "admin/users.html", 
         {
             "request": request, 
             "admin": admin,
-            "users": users
+            "users": page.items,
+            "page": page,
+            "filters": filters
         }
     )
 
+@router.get("/api/users", response_model=UserPage)
+async def list_users_json(
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(user_filters),
+    admin: User = Depends(validate_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """JSON variant of the user listing"""
+    page = await fetch_page(queries.paginate_users, db, **paging, **filters)
+    return UserPage.model_validate(page, from_attributes=True)
+
 @router.get("/users/add")
 async def add_user_form(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     return templates.TemplateResponse(
         "admin/user_form.html", 
@@ -183,18 +222,18 @@ async def add_user(
     is_admin: bool = Form(False),
     is_active: bool = Form(True),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Check if username or email already exists
-    if db.query(User).filter(User.username == username).first():
+    if await db.scalar(select(User).where(User.username == username)):
         raise HTTPException(status_code=400, detail="Username already exists")
     
-    if db.query(User).filter(User.email == email).first():
+    if await db.scalar(select(User).where(User.email == email)):
         raise HTTPException(status_code=400, detail="Email already exists")
     
     # Create new user
-    from app.services.auth import get_password_hash
-    hashed_password = get_password_hash(password)
+    from app.services.auth import hash_password
+    hashed_password = await hash_password(password)
     
     new_user = User(
         username=username,
@@ -205,7 +244,8 @@ async def add_user(
     )
     
     db.add(new_user)
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
     
     return RedirectResponse(url="/admin/users", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -214,10 +254,10 @@ async def edit_user_form(
     request: Request,
     user_id: int,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get user by ID
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -242,19 +282,19 @@ async def edit_user(
     is_admin: bool = Form(False),
     is_active: bool = Form(True),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get user by ID
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Check if username or email already exists (excluding current user)
-    if db.query(User).filter(User.username == username, User.id != user_id).first():
+    if await db.scalar(select(User).where(User.username == username, User.id != user_id)):
         raise HTTPException(status_code=400, detail="Username already exists")
     
-    if db.query(User).filter(User.email == email, User.id != user_id).first():
+    if await db.scalar(select(User).where(User.email == email, User.id != user_id)):
         raise HTTPException(status_code=400, detail="Email already exists")
     
     # Update user
@@ -265,97 +305,86 @@ async def edit_user(
     
     # Update password if provided
     if password:
-        from app.services.auth import get_password_hash
-        user.hashed_password = get_password_hash(password)
+        from app.services.auth import hash_password
+        user.hashed_password = await hash_password(password)
     
-    db.commit()
+    await db.commit()
+    # Role and active flag changes apply to the user's next request, not after the cache TTL
+    user_principals.invalidate(user.id)
     
     return RedirectResponse(url="/admin/users", status_code=status.HTTP_303_SEE_OTHER)
 
 @router.get("/interviews")
 async def list_interviews(
     request: Request,
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(interview_filters),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get all interviews
-    interviews = db.query(Interview).all()
-    
-    # Separate pending approval interviews
-    pending_interviews = [i for i in interviews if i.approval_status == "requested"]
-    other_interviews = [i for i in interviews if i.approval_status != "requested"]
+    # Newest pending requests get their own section, the rest are one click away on the
+    # filtered listing; the total comes from the cached counters
+    pending_interviews = (await queries.paginate_interviews(
+        db, queries.INTERVIEW_LISTING_OPTIONS, limit=PENDING_REQUESTS_SHOWN, approval_status="requested"
+    )).items
+    stats = await StatisticsService.get_dashboard_stats(db)
+    
+    # One page of the other interviews (pending ones too when explicitly filtered for)
+    page = await fetch_page(
+        queries.paginate_interviews, db, options=queries.INTERVIEW_LISTING_OPTIONS,
+        exclude_approval_status="requested", **paging, **filters
+    )
     
     # Get topics, difficulties and timings for the schedule modal
-    topics = db.query(Topic).all()
-    difficulties = db.query(Difficulty).all()
-    timings = db.query(Timing).all()
-    
-    # Get all active users for the schedule modal
-    users = db.query(User).filter(User.is_active == True).all()
+    topics = await reference_data.topics(db)
+    difficulties = await reference_data.difficulties(db)
+    timings = await reference_data.timings(db)
     
+    # The schedule modal searches active users through /admin/api/users as the admin types
     return templates.TemplateResponse(
         "admin/interviews.html", 
         {
             "request": request, 
             "admin": admin,
             "pending_interviews": pending_interviews,
-            "other_interviews": other_interviews,
-            "interviews": interviews,
+            "pending_count": stats["requested_interviews_count"],
+            "other_interviews": page.items,
+            "page": page,
+            "filters": filters,
             "topics": topics,
             "difficulties": difficulties,
-            "timings": timings,
-            "users": users
+            "timings": timings
         }
     )
 
-async def list_interviews(
-    request: Request,
+@router.get("/api/interviews", response_model=InterviewPage)
+async def list_interviews_json(
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(interview_filters),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get all interviews
-    interviews = db.query(Interview).all()
-    
-    # Separate pending approval interviews
-    pending_interviews = [i for i in interviews if i.approval_status == "requested"]
-    other_interviews = [i for i in interviews if i.approval_status != "requested"]
-    
-    # Get topics, difficulties and timings for the schedule modal
-    topics = db.query(Topic).all()
-    difficulties = db.query(Difficulty).all()
-    timings = db.query(Timing).all()
-    
-    # Get all active users for the schedule modal
-    users = db.query(User).filter(User.is_active == True).all()
-    
-    return templates.TemplateResponse(
-        "admin/interviews.html", 
-        {
-            "request": request, 
-            "admin": admin,
-            "pending_interviews": pending_interviews,
-            "other_interviews": other_interviews,
-            "topics": topics,
-            "difficulties": difficulties,
-            "timings": timings,
-            "users": users
-        }
+    """JSON variant of the interview listing (all approval states unless filtered)"""
+    page = await fetch_page(
+        queries.paginate_interviews, db, options=queries.INTERVIEW_LISTING_OPTIONS, **paging, **filters
     )
+    return InterviewPage.model_validate(page, from_attributes=True)
 
 @router.get("/interviews/{interview_id}")
 async def view_interview(
     request: Request,
     interview_id: int,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    # Archived interviews are shown read-only from the archive tier
+    interview = await queries.get_interview_detail(db, interview_id=interview_id, include_archived=True)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
     # Get questions for this interview
-    questions = db.query(Question).filter(Question.interview_id == interview_id).all()
+    questions = await queries.list_interview_questions(db, interview_id, archived=interview.is_archived)
     
     return templates.TemplateResponse(
         "admin/interview_details.html", 
@@ -375,14 +404,17 @@ async def schedule_interview(
     timing_id: int = Form(...),
     topic_ids: List[int] = Form(...),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get the user
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
+    # Get the selected topics
+    topics = (await db.scalars(select(Topic).where(Topic.id.in_(topic_ids)))).all()
+    
     # Create a unique identifier for the interview
     from uuid import uuid4
     
@@ -397,19 +429,13 @@ async def schedule_interview(
         status="pending",
         approval_status="approved",
         approved_by=admin.id,
-        approved_at=datetime.now()
+        approved_at=datetime.now(),
+        topics=list(topics)
     )
     
     db.add(interview)
-    db.commit()
-    
-    # Add topics
-    for topic_id in topic_ids:
-        topic = db.query(Topic).filter(Topic.id == topic_id).first()
-        if topic:
-            interview.topics.append(topic)
-    
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
     
     return RedirectResponse(url="/admin/interviews", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -419,10 +445,10 @@ async def approve_interview(
     interview_id: int,
     admin_notes: str = Form(None),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get interview by ID
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = await queries.get_interview(db, interview_id=interview_id)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -435,7 +461,8 @@ async def approve_interview(
     if admin_notes:
         interview.admin_notes = admin_notes
     
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
     
     # Return a success response for fetch API
     if "application/json" in request.headers.get("accept", ""):
@@ -449,10 +476,10 @@ async def reject_interview(
     interview_id: int,
     admin_notes: str = Form(None),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get interview by ID
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = await queries.get_interview(db, interview_id=interview_id)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -465,7 +492,8 @@ async def reject_interview(
     if admin_notes:
         interview.admin_notes = admin_notes
     
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
     
     # Return a success response for fetch API
     if "application/json" in request.headers.get("accept", ""):
@@ -477,9 +505,9 @@ async def reject_interview(
 async def list_topics(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    topics = db.query(Topic).all()
+    topics = await reference_data.topics(db)
     
     return templates.TemplateResponse(
         "admin/topics.html", 
@@ -494,7 +522,7 @@ async def list_topics(
 async def add_topic_form(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     return templates.TemplateResponse(
         "admin/topic_form.html", 
@@ -510,16 +538,18 @@ async def add_topic(
     request: Request,
     name: str = Form(...),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Check if topic already exists
-    if db.query(Topic).filter(Topic.name == name).first():
+    if await db.scalar(select(Topic).where(Topic.name == name)):
         raise HTTPException(status_code=400, detail="Topic already exists")
     
     # Create new topic
     new_topic = Topic(name=name)
     db.add(new_topic)
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
+    reference_data.invalidate()
     
     return RedirectResponse(url="/admin/topics", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -527,9 +557,9 @@ async def add_topic(
 async def list_difficulties(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    difficulties = db.query(Difficulty).all()
+    difficulties = await reference_data.difficulties(db)
     
     return templates.TemplateResponse(
         "admin/difficulties.html", 
@@ -544,7 +574,7 @@ async def list_difficulties(
 async def add_difficulty_form(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     return templates.TemplateResponse(
         "admin/difficulty_form.html", 
@@ -560,16 +590,18 @@ async def add_difficulty(
     request: Request,
     name: str = Form(...),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Check if difficulty already exists
-    if db.query(Difficulty).filter(Difficulty.name == name).first():
+    if await db.scalar(select(Difficulty).where(Difficulty.name == name)):
         raise HTTPException(status_code=400, detail="Difficulty already exists")
     
     # Create new difficulty
     new_difficulty = Difficulty(name=name)
     db.add(new_difficulty)
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
+    reference_data.invalidate()
     
     return RedirectResponse(url="/admin/difficulties", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -577,9 +609,9 @@ async def add_difficulty(
 async def list_timings(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    timings = db.query(Timing).all()
+    timings = await reference_data.timings(db)
     
     return templates.TemplateResponse(
         "admin/timings.html", 
@@ -594,7 +626,7 @@ async def list_timings(
 async def add_timing_form(
     request: Request,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     return templates.TemplateResponse(
         "admin/timing_form.html", 
@@ -611,33 +643,43 @@ async def add_timing(
     name: str = Form(...),
     minutes: int = Form(...),
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Check if timing already exists
-    if db.query(Timing).filter(Timing.name == name).first():
+    if await db.scalar(select(Timing).where(Timing.name == name)):
         raise HTTPException(status_code=400, detail="Timing already exists")
     
     # Create new timing
     new_timing = Timing(name=name, minutes=minutes)
     db.add(new_timing)
-    db.commit()
+    await db.commit()
+    reference_data.invalidate()
     
     return RedirectResponse(url="/admin/timings", status_code=status.HTTP_303_SEE_OTHER)
 
+@router.delete("/api/evaluation-cache")
+async def purge_evaluation_cache(
+    older_than_days: Optional[float] = Query(None, ge=0),
+    admin: User = Depends(validate_admin)
+):
+    """Delete stored answer evaluations, all of them or only those older than older_than_days"""
+    purged = await evaluation_cache.purge(None if older_than_days is None else older_than_days * 86400)
+    return {"status": "ok", "purged": purged}
+
 @router.get("/debug/interview/{interview_id}")
 async def debug_admin_interview_details(
     request: Request,
     interview_id: int,
     admin: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = await queries.get_interview(db, interview_id=interview_id)
     
     if not interview:
         return HTMLResponse(content=f"<html><body><h1>Interview not found: {interview_id}</h1></body></html>", status_code=404)
     
     # Get questions for this interview
-    questions = db.query(Question).filter(Question.interview_id == interview_id).order_by(Question.question_order).all()
+    questions = await queries.list_interview_questions(db, interview_id, with_topic=False)
     
     # Create a simplified HTML view
     html_content = f'''
@@ -1,12 +1,17 @@
 from fastapi import APIRouter, Depends, Request, Form, HTTPException
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List
 from datetime import datetime
-from app.database.database import get_db
-from app.models.models import User, Interview
+from app.database.database import get_async_db
+from app.database import queries
+from app.database.pagination import fetch_page, interview_filters, page_params, page_url
+from app.models.models import User
 from app.services.auth import validate_admin
+from app.services.statistics import StatisticsService
+from app.services.reference_data import reference_data
+from app.schemas.schemas import InterviewPage
 import os
 import dotenv
 from pathlib import Path
@@ -17,12 +22,13 @@ router = APIRouter(
 )
 
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals['page_url'] = page_url
 
 @router.get("/settings")
 async def ai_settings_page(
     request: Request,
     user: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Admin page for managing OpenAI API settings"""
     # Get current API key (redacted)
@@ -32,9 +38,8 @@ async def ai_settings_page(
     else:
         redacted_key = "Not configured"
     
-    # Get AI interview statistics
-    total_ai_interviews = db.query(Interview).count()
-    completed_ai_interviews = db.query(Interview).filter(Interview.status == "completed").count()
+    # Get AI interview statistics (shared with the admin dashboard cache)
+    stats = await StatisticsService.get_dashboard_stats(db)
     
     return templates.TemplateResponse(
         "admin/ai_settings.html",
@@ -42,8 +47,8 @@ async def ai_settings_page(
             "request": request,
             "user": user,
             "api_key_status": redacted_key,
-            "total_ai_interviews": total_ai_interviews,
-            "completed_ai_interviews": completed_ai_interviews
+            "total_ai_interviews": stats["interview_count"],
+            "completed_ai_interviews": stats["completed_count"]
         }
     )
 
@@ -97,18 +102,42 @@ async def update_api_key(
 @router.get("/interviews")
 async def list_ai_interviews(
     request: Request,
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(interview_filters),
     user: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all AI-powered interviews"""
-    # Get all interviews
-    interviews = db.query(Interview).order_by(Interview.created_at.desc()).all()
+    """List AI-powered interviews, one page at a time"""
+    page = await fetch_page(
+        queries.paginate_interviews, db, options=queries.AI_INTERVIEW_LISTING_OPTIONS, **paging, **filters
+    )
+    
+    # Get topics and difficulties for the filters
+    topics = await reference_data.topics(db)
+    difficulties = await reference_data.difficulties(db)
     
     return templates.TemplateResponse(
         "admin/ai_interviews.html",
         {
             "request": request,
             "user": user,
-            "interviews": interviews
+            "interviews": page.items,
+            "page": page,
+            "filters": filters,
+            "topics": topics,
+            "difficulties": difficulties
         }
     )
+
+@router.get("/api/interviews", response_model=InterviewPage)
+async def list_ai_interviews_json(
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(interview_filters),
+    user: User = Depends(validate_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """JSON variant of the AI interview listing"""
+    page = await fetch_page(
+        queries.paginate_interviews, db, options=queries.INTERVIEW_LISTING_OPTIONS, **paging, **filters
+    )
+    return InterviewPage.model_validate(page, from_attributes=True)
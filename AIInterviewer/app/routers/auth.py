@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
 from fastapi.responses import RedirectResponse
+from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-from app.database.database import get_db
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.database import get_async_db
 from app.models.models import User
-from app.services.auth import verify_password, get_password_hash
+from app.schemas.schemas import Token, TokenRefresh
+from app.services.auth import create_token_pair, decode_token, hash_password, verify_and_update_password
+from app.services.statistics import StatisticsService
+from app.services.user_principals import UserPrincipal, user_principals
 from typing import Optional
 from datetime import datetime
 
@@ -15,6 +20,22 @@ router = APIRouter(
 templates = Jinja2Templates(directory="app/templates")
 templates.env.globals["datetime"] = datetime
 
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """The user with this username and password, or None; outdated password hashes are upgraded"""
+    user = await db.scalar(select(User).where(User.username == username))
+    if not user:
+        return None
+    
+    verified, new_hash = await verify_and_update_password(password, user.hashed_password)
+    if not verified:
+        return None
+    
+    # The stored hash predates the current BCRYPT_ROUNDS; replace it while we have the password
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    return user
+
 @router.get("/register")
 async def register_form(request: Request):
     return templates.TemplateResponse("register.html", {"request": request})
@@ -26,7 +47,7 @@ async def register(
     email: str = Form(...),
     password: str = Form(...),
     confirm_password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Check if passwords match
     if password != confirm_password:
@@ -36,21 +57,21 @@ async def register(
         )
     
     # Check if username exists
-    if db.query(User).filter(User.username == username).first():
+    if await db.scalar(select(User).where(User.username == username)):
         return templates.TemplateResponse(
             "register.html", 
             {"request": request, "error": "Username already exists"}
         )
     
     # Check if email exists
-    if db.query(User).filter(User.email == email).first():
+    if await db.scalar(select(User).where(User.email == email)):
         return templates.TemplateResponse(
             "register.html", 
             {"request": request, "error": "Email already exists"}
         )
     
     # Hash password
-    hashed_password = get_password_hash(password)
+    hashed_password = await hash_password(password)
     
     # Create user
     db_user = User(
@@ -60,12 +81,13 @@ async def register(
     )
     
     # Make the first user an admin
-    if db.query(User).count() == 0:
+    if await db.scalar(select(func.count(User.id))) == 0:
         db_user.is_admin = True
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    StatisticsService.invalidate()
     
     # Store user ID in session
     request.session["user_id"] = db_user.id
@@ -84,12 +106,10 @@ async def login(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Find the user
-    user = db.query(User).filter(User.username == username).first()
-    
-    if not user or not verify_password(password, user.hashed_password):
+    user = await authenticate_user(db, username, password)
+    if not user:
         return templates.TemplateResponse(
             "login.html", 
             {"request": request, "error": "Incorrect username or password"}
@@ -123,3 +143,39 @@ async def login(
 async def logout(request: Request):
     request.session.clear()
     return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
+
+# Bearer tokens for API clients (integrations, load generators)
+@router.post("/api/auth/token", response_model=Token)
+async def issue_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Exchange a username and password for an access and refresh token"""
+    user = await authenticate_user(db, form_data.username, form_data.password)
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password" if not user else "Account is inactive",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return create_token_pair(
+        UserPrincipal(user.id, user.username, user.email, bool(user.is_admin), bool(user.is_active))
+    )
+
+@router.post("/api/auth/refresh", response_model=Token)
+async def refresh_token(body: TokenRefresh, db: AsyncSession = Depends(get_async_db)):
+    """
+    Exchange a refresh token for a new token pair
+
+    The user is looked up again (through the principal cache), so deactivation and
+    role changes take effect here.
+    """
+    claims = decode_token(body.refresh_token, token_type="refresh")
+    user = await user_principals.get(db, int(claims["sub"]))
+    if user is None or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Account is inactive or no longer exists",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return create_token_pair(user)
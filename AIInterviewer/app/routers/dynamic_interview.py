@@ -1,15 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Form, Query
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
 import uuid
 
-from app.database.database import get_db
-from app.models.models import User, Interview, Topic, Difficulty, Question
+from app.database.database import get_async_db
+from app.database import queries
+from app.models.models import User, Interview, Question, Job
 from app.services.auth import validate_logged_in
-from app.services.openai_service import OpenAIService
+from app.services.statistics import StatisticsService
+from app.services.interview_progress import InterviewProgress
+from app.services.reference_data import reference_data
+from app.services.openai_service import AsyncOpenAIService
 
 router = APIRouter(
     prefix="/interview",
@@ -33,11 +38,11 @@ async def ai_intro_page(
 async def create_dynamic_interview_form(
     request: Request,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get all topics and difficulties
-    topics = db.query(Topic).all()
-    difficulties = db.query(Difficulty).all()
+    topics = await reference_data.topics(db)
+    difficulties = await reference_data.difficulties(db)
     
     return templates.TemplateResponse(
         "interview/dynamic_interview.html", 
@@ -53,10 +58,10 @@ async def dynamic_interview_session(
     request: Request,
     interview_uuid: str,
     question_index: int = Query(0),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    interview = await queries.get_interview_session(db, interview_uuid=interview_uuid)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -72,7 +77,8 @@ async def dynamic_interview_session(
     if interview.status == "pending":
         interview.status = "in_progress"
         interview.started_at = datetime.now()
-        db.commit()
+        await db.commit()
+        StatisticsService.invalidate()
     
     # Get all questions
     questions = interview.questions
@@ -115,10 +121,10 @@ async def dynamic_interview_session(
 async def dynamic_interview_evaluation(
     request: Request,
     interview_uuid: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    # Get the interview by UUID, from the archive if it has been moved there
+    interview = await queries.get_interview_session(db, interview_uuid=interview_uuid, include_archived=True)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -135,24 +141,27 @@ async def dynamic_interview_evaluation(
     difficulty = interview.difficulty.name
     
     # Parse summary from the interview
+    summary_job = None
     if interview.summary:
         summary_data = interview.summary
     else:
-        summary_data = "No summary available."
+        summary_data = "The AI summary is being prepared. Refresh the page in a moment."
+        # The page follows the summary job and streams the summary in as it is written
+        summary_job = await db.scalar(
+            select(Job.uuid).where(
+                Job.kind == "summarize_interview",
+                Job.status.in_(("queued", "running")),
+                Job.payload["interview_id"].as_integer() == interview.id
+            ).order_by(Job.id.desc()).limit(1)
+        )
     
-    # Calculate overall score
+    # Overall and per-topic scores come from the aggregates stored on the interview
     questions = interview.questions
-    scores = [q.score for q in questions if q.score is not None]
-    overall_score = round(sum(scores) / len(scores)) if scores else 0
-    
-    # Extract basic topic scores (in a real implementation, this would be parsed from the AI summary)
-    topic_scores = {}
-    for topic in interview.topics:
-        topic_questions = [q for q in questions if q.topic_id == topic.id]
-        if topic_questions:
-            topic_scores[topic.name] = round(sum(q.score for q in topic_questions if q.score is not None) / len(topic_questions))
-        else:
-            topic_scores[topic.name] = 0
+    overall_score = round(interview.average_score or 0)
+    
+    # Basic topic scores (in a real implementation, this would be parsed from the AI summary)
+    topic_averages = InterviewProgress.topic_averages(interview)
+    topic_scores = {topic.name: topic_averages.get(topic.id, 0) for topic in interview.topics}
     
     # Extract strengths and areas for improvement (would be parsed from AI summary)
     # For now using placeholder data
@@ -175,6 +184,7 @@ async def dynamic_interview_evaluation(
             "topics": topics,
             "difficulty": difficulty,
             "summary": summary_data,
+            "summary_job": summary_job,
             "overall_score": overall_score,
             "topic_scores": topic_scores,
             "strengths": strengths,
@@ -1,13 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
-import random
-from app.database.database import get_db
+from app.database.database import get_async_db
+from app.database import queries
 from app.models.models import User, Interview, Topic, Difficulty, Timing, Question, QuestionBank
-from app.services.auth import validate_logged_in
+from app.services.auth import validate_api_user
+from app.services.statistics import StatisticsService
+from app.services.interview_progress import InterviewProgress
+from app.services.reference_data import reference_data
+from app.services.question_pool import question_pool
 
 router = APIRouter(
     prefix="/interview",
@@ -22,10 +27,10 @@ templates.env.globals['datetime'] = datetime
 async def public_interview_session(
     request: Request,
     interview_uuid: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    interview = await queries.get_interview_session(db, interview_uuid=interview_uuid)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -43,7 +48,8 @@ async def public_interview_session(
     # Update interview status if it's pending
     if interview.status == "pending":
         interview.status = "in_progress"
-        db.commit()
+        await db.commit()
+        StatisticsService.invalidate()
     
     # Get related data
     topics = [topic.name for topic in interview.topics]
@@ -51,39 +57,32 @@ async def public_interview_session(
     
     # Generate questions if they don't exist yet
     if not interview.questions:
-        # Get questions from QuestionBank
-        difficulty_obj = db.query(Difficulty).filter(Difficulty.name == difficulty).first()
-        
+        # Sample question IDs per topic from the in-memory pool, then load only those rows
         questions_per_topic = 5 // len(interview.topics) + 1
-        selected_questions = []
+        selected_ids = []
         
         for topic in interview.topics:
-            # Get random questions for this topic and difficulty
-            available_questions = db.query(QuestionBank).filter(
-                QuestionBank.topic_id == topic.id,
-                QuestionBank.difficulty_id == difficulty_obj.id
-            ).all()
-            
-            if available_questions:
-                # Randomly select questions
-                num_to_select = min(questions_per_topic, len(available_questions))
-                selected = random.sample(available_questions, num_to_select)
-                selected_questions.extend(selected)
+            selected_ids.extend(await question_pool.sample_ids(
+                db, [topic.id], interview.difficulty_id, questions_per_topic
+            ))
         
         # Limit to 5 questions total
-        selected_questions = selected_questions[:5]
+        selected_questions = await question_pool.load(db, selected_ids[:5])
         
         # Save the questions to the interview
-        for q_bank in selected_questions:
-            question = Question(
+        new_questions = [
+            Question(
                 interview_id=interview.id,
                 topic_id=q_bank.topic_id,
                 question_text=q_bank.question_text
             )
-            db.add(question)
+            for q_bank in selected_questions
+        ]
+        db.add_all(new_questions)
+        InterviewProgress.add_questions(interview, new_questions)
         
-        db.commit()
-        db.refresh(interview)
+        await db.commit()
+        interview = await queries.get_interview_session(db, interview_uuid=interview_uuid, refresh=True)
     
     return templates.TemplateResponse(
         "interview/session.html", 
@@ -100,26 +99,20 @@ async def submit_public_answer(
     interview_uuid: str,
     question_id: int = Form(...),
     answer: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    # Get the interview by UUID; its stored aggregates answer the completion check
+    interview = await queries.get_interview_detail(db, interview_uuid=interview_uuid)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
     # Get the question
-    question = db.query(Question).filter(
-        Question.id == question_id, 
-        Question.interview_id == interview.id
-    ).first()
+    question = await queries.get_interview_question(db, interview.id, question_id)
     
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
     
-    # Save the answer
-    question.answer = answer
-    
     # Basic scoring based on answer length and completeness
     score = 0
     feedback = "Answer received. "
@@ -134,34 +127,27 @@ async def submit_public_answer(
         score = 80
         feedback += "Well-detailed answer with good coverage."
     
+    # Save the answer and score; the interview aggregates are updated in the same transaction
     question.feedback = feedback
-    question.score = score
-    db.commit()
-    
-    # Check if all questions have been answered
-    all_answered = True
-    for q in interview.questions:
-        if not q.answer:
-            all_answered = False
-            break
+    await InterviewProgress.record_answer(db, interview, question, answer, score)
     
     # If all questions answered, complete the interview
-    if all_answered:
+    if InterviewProgress.all_answered(interview):
         interview.status = "completed"
         
         # Generate simple summary
-        total_score = sum(q.score for q in interview.questions if q.score)
-        average_score = total_score / len(interview.questions) if interview.questions else 0
+        average_score = interview.average_score or 0
         
         performance_level = "Excellent" if average_score >= 80 else "Good" if average_score >= 60 else "Needs Improvement"
         
         summary = f"Interview completed with an average score of {average_score:.1f}/100.\n"
         summary += f"Overall Performance: {performance_level}\n\n"
-        summary += f"Questions Answered: {len(interview.questions)}\n"
+        summary += f"Questions Answered: {interview.answered_count}\n"
         summary += f"Topics Covered: {', '.join([t.name for t in interview.topics])}"
         
         interview.summary = summary
-        db.commit()
+        await db.commit()
+        StatisticsService.invalidate()
         
         # Redirect to the evaluation page
         return RedirectResponse(
@@ -169,13 +155,16 @@ async def submit_public_answer(
             status_code=status.HTTP_303_SEE_OTHER
         )
     
+    await db.commit()
+    
     # Show feedback and continue with next question
+    questions = await queries.list_interview_questions(db, interview.id)
     return templates.TemplateResponse(
         "interview/session.html", 
         {
             "request": request, 
             "interview": interview,
-            "questions": interview.questions,
+            "questions": questions,
             "current_question_id": question_id,
             "feedback": feedback,
             "score": score
@@ -186,10 +175,10 @@ async def submit_public_answer(
 async def public_interview_evaluation(
     request: Request,
     interview_uuid: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    # Get the interview by UUID, from the archive if it has been moved there
+    interview = await queries.get_interview_session(db, interview_uuid=interview_uuid, include_archived=True)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -201,23 +190,13 @@ async def public_interview_evaluation(
             status_code=status.HTTP_303_SEE_OTHER
         )
     
-    # Calculate average score
-    total_score = 0
-    question_count = 0
-    for question in interview.questions:
-        if question.score is not None:
-            total_score += question.score
-            question_count += 1
-    
-    average_score = total_score / question_count if question_count > 0 else 0
-    
     return templates.TemplateResponse(
         "interview/evaluation.html", 
         {
             "request": request, 
             "interview": interview,
             "questions": interview.questions,
-            "average_score": average_score
+            "average_score": interview.average_score or 0
         }
     )
 
@@ -227,12 +206,12 @@ async def api_generate_questions(
     request: Request,
     topic_ids: List[int] = Form(...),
     difficulty_id: int = Form(...),
-    user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    user: User = Depends(validate_api_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get topics and difficulty
-    topics = db.query(Topic).filter(Topic.id.in_(topic_ids)).all()
-    difficulty = db.query(Difficulty).filter(Difficulty.id == difficulty_id).first()
+    # Get topics and difficulty from the cached reference tables
+    topics = await reference_data.topics_by_id(db, topic_ids)
+    difficulty = await reference_data.difficulty(db, difficulty_id)
     
     if not topics or not difficulty:
         return JSONResponse(
@@ -240,20 +219,19 @@ async def api_generate_questions(
             content={"error": "Invalid topics or difficulty"}
         )
     
-    # Get sample questions from QuestionBank
-    questions_data = []
+    # Get sample questions from QuestionBank: two per topic from the in-memory pool
+    topic_names = {topic.id: topic.name for topic in topics}
+    selected_ids = []
     for topic in topics:
-        available_questions = db.query(QuestionBank).filter(
-            QuestionBank.topic_id == topic.id,
-            QuestionBank.difficulty_id == difficulty.id
-        ).limit(2).all()
-        
-        for q in available_questions:
-            questions_data.append({
-                "topic": topic.name,
-                "question": q.question_text,
-                "difficulty": difficulty.name
-            })
+        selected_ids.extend(await question_pool.sample_ids(db, [topic.id], difficulty.id, 2))
+    
+    questions_data = []
+    for q in await question_pool.load(db, selected_ids):
+        questions_data.append({
+            "topic": topic_names[q.topic_id],
+            "question": q.question_text,
+            "difficulty": difficulty.name
+        })
     
     return JSONResponse(
         content={"questions": questions_data[:5]}
@@ -263,10 +241,10 @@ async def api_generate_questions(
 async def share_interview_link(
     request: Request,
     interview_uuid: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    interview = await queries.get_interview_detail(db, interview_uuid=interview_uuid)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
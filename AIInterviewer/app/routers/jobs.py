@@ -0,0 +1,97 @@
+import json
+from typing import AsyncIterator
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.database import AsyncSessionLocal, get_async_db
+from app.models.models import Job
+from app.schemas.schemas import JobStatus
+from app.services.job_queue import JOB_POLL_INTERVAL, job_streams
+
+router = APIRouter(
+    prefix="/api/jobs",
+    tags=["jobs"]
+)
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Status of a background job, with its result once it has succeeded
+
+    Job ids are random UUIDs handed out by the endpoint that queued the job, like
+    interview UUIDs, so knowing the id is what grants access.
+    """
+    job = await db.scalar(select(Job).where(Job.uuid == job_id))
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return JobStatus(
+        job_id=job.uuid,
+        kind=job.kind,
+        status=job.status,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at
+    )
+
+def _event(name: str, data) -> str:
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+async def _job_events(job_id: str) -> AsyncIterator[str]:
+    streamed_attempt = None
+    last_status = None
+    while True:
+        # A short session per check; the response may stay open for minutes
+        async with AsyncSessionLocal() as db:
+            job = (await db.execute(
+                select(Job.status, Job.result, Job.error).where(Job.uuid == job_id)
+            )).first()
+        
+        if job is None:
+            yield _event("error", {"error": "Job not found"})
+            return
+        if job.status != last_status:
+            last_status = job.status
+            yield _event("status", {"status": job.status})
+        if job.status == "succeeded":
+            yield _event("result", job.result)
+            return
+        if job.status == "failed":
+            yield _event("error", {"error": job.error})
+            return
+        
+        # Follow the job token by token if a worker in this process runs it,
+        # otherwise check the database again after the poll interval
+        stream = await job_streams.wait(job_id, JOB_POLL_INTERVAL)
+        if stream is None:
+            continue
+        if streamed_attempt is not None and stream.attempt != streamed_attempt:
+            # A retry writes its text from the start
+            yield _event("reset", {"attempt": stream.attempt})
+        streamed_attempt = stream.attempt
+        async for piece in stream.follow():
+            yield _event("token", piece)
+
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    Server-Sent Events for a background job, ending with its result
+
+    Events: "status" when the job's status changes, "token" with each piece of text
+    the job produces (streamed AI feedback), "reset" when a retry starts its text
+    again, and finally "result" with the job's result or "error" with its error.
+    """
+    if not await db.scalar(select(Job.id).where(Job.uuid == job_id)):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return StreamingResponse(
+        _job_events(job_id),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,15 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Form, Body
 from fastapi.responses import JSONResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict
+import asyncio
+import os
+import time
 import uuid
 from datetime import datetime
 
-from app.database.database import get_db
+from app.database.database import get_async_db
+from app.database import queries
 from app.models.models import User, Interview, Topic, Difficulty, Question
-from app.services.auth import validate_logged_in
-from app.services.openai_service import OpenAIService
+from app.services.auth import validate_api_user
+from app.services.statistics import StatisticsService
+from app.services.interview_progress import InterviewProgress
+from app.services.openai_resilience import CircuitOpenError, is_transient
+from app.services.openai_service import AsyncOpenAIService
+from app.services.job_queue import enqueue, job_queue
 from app.schemas.openai_schemas import (
     TopicRequest, 
     GenerateQuestionRequest, 
@@ -25,6 +34,15 @@ router = APIRouter(
     tags=["openai_interview"]
 )
 
+# Seconds the outcome of a key check is reused. Pages check the key when they load and
+# every check is a (paid) OpenAI request; /api/status/openai always makes a live one
+OPENAI_KEY_CHECK_TTL = float(os.getenv("OPENAI_KEY_CHECK_TTL", "300"))
+
+# Per-process cache: api_key -> (expires_at, result). The lock lets one check run at a time,
+# so pages loading together share its outcome
+_key_checks: Dict[str, tuple] = {}
+_key_check_lock = asyncio.Lock()
+
 @router.get("/validate-key")
 async def validate_openai_api_key():
     """
@@ -35,20 +53,23 @@ async def validate_openai_api_key():
     if not api_key or api_key == "your-openai-api-key-here":
         return {"valid": False, "message": "OpenAI API key is not configured."}
     
-    try:
-        # Initialize client with the key
-        client = OpenAI(api_key=api_key)
+    async with _key_check_lock:
+        cached = _key_checks.get(api_key)
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1])
         
-        # Make a simple request to test the key
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": "Hello"}],
-            max_tokens=5
-        )
+        try:
+            # Make a simple request to test the key
+            await AsyncOpenAIService.check_connection(api_key)
+            result = {"valid": True}
+        except Exception as e:
+            result = {"valid": False, "message": f"API key validation failed: {str(e)}"}
+            # An unhealthy provider says nothing about the key; check again next time
+            if isinstance(e, CircuitOpenError) or is_transient(e):
+                return result
         
-        return {"valid": True}
-    except Exception as e:
-        return {"valid": False, "message": f"API key validation failed: {str(e)}"}
+        _key_checks[api_key] = (time.monotonic() + OPENAI_KEY_CHECK_TTL, result)
+        return dict(result)
 
 
 templates = Jinja2Templates(directory="app/templates")
@@ -56,13 +77,14 @@ templates = Jinja2Templates(directory="app/templates")
 @router.post("/generate-questions", response_model=GenerateQuestionsResponse)
 async def generate_questions(
     request: GenerateQuestionRequest,
-    db: Session = Depends(get_db)
+    user: User = Depends(validate_api_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate interview questions using OpenAI based on topic and difficulty
     """
     try:
-        questions = OpenAIService.generate_interview_questions(
+        questions = await AsyncOpenAIService.generate_interview_questions(
             topic=request.topic_name,
             difficulty=request.difficulty_name,
             count=request.question_count
@@ -79,13 +101,14 @@ async def generate_questions(
 @router.post("/evaluate-answer", response_model=EvaluationResponse)
 async def evaluate_answer(
     request: EvaluateAnswerRequest,
-    db: Session = Depends(get_db)
+    user: User = Depends(validate_api_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Evaluate a candidate's answer using OpenAI
     """
     try:
-        evaluation = OpenAIService.evaluate_answer(
+        evaluation = await AsyncOpenAIService.evaluate_answer(
             question=request.question,
             candidate_answer=request.candidate_answer,
             expected_answer=request.expected_answer,
@@ -104,13 +127,14 @@ async def evaluate_answer(
 @router.post("/summarize-interview", response_model=InterviewSummaryResponse)
 async def summarize_interview(
     request: SummarizeInterviewRequest,
-    db: Session = Depends(get_db)
+    user: User = Depends(validate_api_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate an interview summary based on all evaluations
     """
     try:
-        summary = OpenAIService.summarize_interview(
+        summary = await AsyncOpenAIService.summarize_interview(
             evaluations=request.evaluations,
             topics=request.topics,
             difficulty=request.difficulty
@@ -124,163 +148,103 @@ async def summarize_interview(
             detail=f"Error generating interview summary: {str(e)}"
         )
 
-@router.post("/create-dynamic-interview")
+@router.post("/create-dynamic-interview", status_code=202)
 async def create_dynamic_interview(
     topic_ids: List[int] = Body(...),
     difficulty_id: int = Body(...),
     candidate_name: str = Body(...),
     email: str = Body(...),
-    user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    user: User = Depends(validate_api_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Create a new interview with dynamically generated questions via OpenAI
+    Queue the creation of an interview with dynamically generated questions via OpenAI
+
+    Returns at once with a job id; poll status_url until the job has succeeded. The
+    interview (with the topics that got questions) exists from then on.
     """
     # Get topics and difficulty
-    topics = db.query(Topic).filter(Topic.id.in_(topic_ids)).all()
-    difficulty = db.query(Difficulty).filter(Difficulty.id == difficulty_id).first()
+    topics = (await db.scalars(select(Topic).where(Topic.id.in_(topic_ids)))).all()
+    difficulty = await db.scalar(select(Difficulty).where(Difficulty.id == difficulty_id))
     
     if not topics or not difficulty:
         raise HTTPException(status_code=400, detail="Invalid topics or difficulty")
     
-    # Create a new interview
+    # The interview UUID is chosen now, so a retried job never creates a second interview
     interview_uuid = str(uuid.uuid4())
-    new_interview = Interview(
-        uuid=interview_uuid,
-        candidate_name=candidate_name,
-        email=email,
-        user_id=user.id,
-        difficulty_id=difficulty.id,
-        status="pending",
-        created_at=datetime.now()
-    )
-    
-    db.add(new_interview)
-    db.flush()  # Get the ID without committing
+    job = enqueue(db, "generate_interview", {
+        "topic_ids": [topic.id for topic in topics],
+        "difficulty_id": difficulty.id,
+        "candidate_name": candidate_name,
+        "email": email,
+        "user_id": user.id,
+        "interview_uuid": interview_uuid
+    })
+    await db.commit()
+    job_queue.notify()
     
-    # Associate topics
-    for topic in topics:
-        new_interview.topics.append(topic)
-    
-    # Generate questions using OpenAI for each topic
-    for topic in topics:
-        # Generate 2 questions per topic
-        openai_questions = OpenAIService.generate_interview_questions(
-            topic=topic.name,
-            difficulty=difficulty.name,
-            count=2
-        )
-        
-        # Save the generated questions
-        for i, q_data in enumerate(openai_questions):
-            question = Question(
-                interview_id=new_interview.id,
-                topic_id=topic.id,
-                question_text=q_data["question_text"],
-                question_order=i + 1
-            )
-            # Store expected answer as feedback for evaluation
-            question.feedback = q_data.get("expected_answer", "")
-            db.add(question)
-    
-    db.commit()
-    db.refresh(new_interview)
-    
-    # Return the interview details
     return {
+        "job_id": job.uuid,
+        "status_url": f"/api/jobs/{job.uuid}",
         "interview_uuid": interview_uuid,
-        "message": "Interview created successfully with dynamically generated questions"
+        "message": "Interview creation queued, questions are being generated"
     }
 
-@router.post("/dynamic-submit-answer/{interview_uuid}")
+@router.post("/dynamic-submit-answer/{interview_uuid}", status_code=202)
 async def submit_dynamic_answer(
     interview_uuid: str,
     question_id: int = Form(...),
     answer: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Submit a candidate's answer and get immediate AI evaluation
+    Save a candidate's answer and queue its AI evaluation
+
+    Returns at once with a job id; the evaluation is the job's result, and its feedback
+    can be followed as it is written at stream_url. The last answer completes the
+    interview and also queues its summary.
     """
-    # Get the interview by UUID
-    interview = db.query(Interview).filter(Interview.uuid == interview_uuid).first()
+    # Get the interview by UUID; its stored aggregates answer the completion check
+    interview = await queries.get_interview_detail(db, interview_uuid=interview_uuid)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
     # Get the question
-    question = db.query(Question).filter(
-        Question.id == question_id, 
-        Question.interview_id == interview.id
-    ).first()
+    question = await queries.get_interview_question(db, interview.id, question_id)
     
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
     
-    # Save the answer
-    question.answer = answer
+    # Save the answer now; the score and feedback are written by the evaluation job.
+    # The answer, the aggregates and the jobs are committed in one transaction
     question.answered_at = datetime.now()
+    await InterviewProgress.record_answer(db, interview, question, answer)
+    job = enqueue(db, "evaluate_answer", {"interview_id": interview.id, "question_id": question.id, "answer": answer})
     
-    # Get topic name and difficulty name
-    topic_name = question.topic.name
-    difficulty_name = interview.difficulty.name
-    
-    # The expected answer is stored in the feedback field when questions were generated
-    expected_answer = question.feedback
-    
-    # Evaluate using OpenAI
-    evaluation = OpenAIService.evaluate_answer(
-        question=question.question_text,
-        candidate_answer=answer,
-        expected_answer=expected_answer,
-        topic=topic_name,
-        difficulty=difficulty_name
-    )
-    
-    # Update the question with evaluation results
-    question.score = evaluation["score"]
-    question.feedback = evaluation["feedback"]
-    db.commit()
-    
-    # Check if all questions have been answered
-    all_answered = all(q.answer for q in interview.questions)
-    
-    if all_answered:
+    interview_completed = InterviewProgress.all_answered(interview) and interview.status != "completed"
+    if interview_completed:
         interview.status = "completed"
         interview.completed_at = datetime.now()
-        
-        # Prepare data for summary
-        evaluations = []
-        for q in interview.questions:
-            evaluations.append({
-                "question": q.question_text,
-                "answer": q.answer,
-                "score": q.score,
-                "feedback": q.feedback,
-                "strengths": evaluation.get("strengths", []),
-                "areas_for_improvement": evaluation.get("areas_for_improvement", [])
-            })
-        
-        topics = [topic.name for topic in interview.topics]
-        
-        # Generate interview summary
-        summary_result = OpenAIService.summarize_interview(
-            evaluations=evaluations,
-            topics=topics,
-            difficulty=difficulty_name
-        )
-        
-        # Update interview with summary
-        interview.summary = summary_result["summary"]
-        db.commit()
-        
+        # Runs once the answers are evaluated
+        enqueue(db, "summarize_interview", {"interview_id": interview.id})
+    
+    await db.commit()
+    job_queue.notify()
+    
+    if interview_completed:
+        StatisticsService.invalidate()
         return {
-            "evaluation": evaluation,
+            "job_id": job.uuid,
+            "status_url": f"/api/jobs/{job.uuid}",
+            "stream_url": f"/api/jobs/{job.uuid}/stream",
             "interview_completed": True,
-            "redirect_url": f"/interview/evaluation/{interview_uuid}"
+            "redirect_url": f"/interview/dynamic-evaluation/{interview_uuid}"
         }
     
     return {
-        "evaluation": evaluation,
+        "job_id": job.uuid,
+        "status_url": f"/api/jobs/{job.uuid}",
+        "stream_url": f"/api/jobs/{job.uuid}/stream",
         "interview_completed": False
     }
@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 import os
-from openai import OpenAI
-from app.database.database import get_db
-from sqlalchemy.orm import Session
+from app.database.database import get_async_db, async_engine, DATABASE_BACKEND, SQLITE_PROFILE, SQLITE_PRAGMAS
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.evaluation_cache import evaluation_cache
+from app.services.job_queue import job_queue
+from app.services.openai_resilience import openai_resilience
+from app.services.openai_service import AsyncOpenAIService
+from app.services.question_cache import question_cache
+from app.services.reference_data import reference_data
+from app.services.user_principals import user_principals
 import sqlalchemy
 import sys
 import platform
@@ -35,16 +41,32 @@ async def system_status():
         )
 
 @router.get("/database")
-async def database_status(db: Session = Depends(get_db)):
+async def database_status(db: AsyncSession = Depends(get_async_db)):
     """
     Check database connection and status
     """
     try:
         # Execute simple query to verify database connection
-        result = db.execute(sqlalchemy.text("SELECT 1")).scalar()
+        result = (await db.execute(sqlalchemy.text("SELECT 1"))).scalar()
         
         if result == 1:
-            return {"status": "ok", "message": "Database connection successful"}
+            status_data = {
+                "status": "ok",
+                "message": "Database connection successful",
+                "backend": DATABASE_BACKEND,
+                "pool": async_engine.pool.status()
+            }
+            
+            if DATABASE_BACKEND == "sqlite":
+                # Report the performance profile and the pragma values the connection actually runs with
+                pragmas = {}
+                for name in SQLITE_PRAGMAS:
+                    pragmas[name] = (await db.execute(sqlalchemy.text(f"PRAGMA {name}"))).scalar()
+                
+                status_data["profile"] = SQLITE_PROFILE
+                status_data["pragmas"] = pragmas
+            
+            return status_data
         else:
             return JSONResponse(
                 status_code=500,
@@ -59,7 +81,7 @@ async def database_status(db: Session = Depends(get_db)):
 @router.get("/openai")
 async def openai_status():
     """
-    Check OpenAI API connection and status
+    Check OpenAI API connection and status, with the circuit breaker state and call counters
     """
     api_key = os.getenv("OPENAI_API_KEY")
     
@@ -69,37 +91,52 @@ async def openai_status():
             content={
                 "status": "error", 
                 "message": "OpenAI API key not configured",
-                "configuration_required": True
+                "configuration_required": True,
+                "resilience": openai_resilience.stats()
             }
         )
     
     try:
-        start_time = time.time()
-        
-        # Initialize client with the key
-        client = OpenAI(api_key=api_key)
-        
         # Make a simple request to test the key
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": "Hello"}],
-            max_tokens=5
-        )
-        
-        latency = time.time() - start_time
+        latency = await AsyncOpenAIService.check_connection(api_key)
         
         return {
             "status": "ok", 
             "message": "OpenAI API connection successful",
             "model": "gpt-3.5-turbo",
-            "latency_seconds": round(latency, 2)
+            "latency_seconds": round(latency, 2),
+            "resilience": openai_resilience.stats()
         }
     except Exception as e:
         return JSONResponse(
             status_code=500,
-            content={"status": "error", "message": f"OpenAI API error: {str(e)}"}
+            content={
+                "status": "error",
+                "message": f"OpenAI API error: {str(e)}",
+                "resilience": openai_resilience.stats()
+            }
         )
 
+@router.get("/cache")
+async def cache_status():
+    """
+    Reference data, session user, generated question set and answer evaluation cache counters for this worker
+    """
+    return {
+        "status": "ok",
+        "reference_data": reference_data.stats(),
+        "user_principals": user_principals.stats(),
+        "question_sets": await question_cache.stats(),
+        "evaluations": await evaluation_cache.stats(),
+    }
+
+@router.get("/jobs")
+async def jobs_status():
+    """
+    Background jobs per status, and the workers and counters of this process
+    """
+    return {"status": "ok", **(await job_queue.stats())}
+
 @router.get("/health")
 async def health_check():
     """
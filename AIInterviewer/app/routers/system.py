@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Request
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-from app.database.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.database import get_async_db
 from app.models.models import User, Interview
 from app.services.auth import validate_admin
 
@@ -16,7 +16,7 @@ templates = Jinja2Templates(directory="app/templates")
 async def system_status_page(
     request: Request,
     user: User = Depends(validate_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """System status page for administrators"""
     return templates.TemplateResponse(
@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, HTMLResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List
 from datetime import datetime
-import random
 from uuid import uuid4  # Import UUID generator
-from app.database.database import get_db
+from app.database.database import get_async_db
+from app.database import queries
+from app.database.pagination import fetch_page, interview_filters, page_params, page_url
 from app.models.models import User, Interview, Topic, Difficulty, Timing, QuestionBank, Question
 from app.services.auth import validate_logged_in
+from app.services.statistics import StatisticsService
+from app.services.interview_progress import InterviewProgress
+from app.services.reference_data import reference_data
+from app.services.question_pool import question_pool
+from app.schemas.schemas import InterviewPage
 
 router = APIRouter(
     prefix="/user",
@@ -17,35 +24,62 @@ router = APIRouter(
 
 templates = Jinja2Templates(directory="app/templates")
 templates.env.globals['datetime'] = datetime
+templates.env.globals['page_url'] = page_url
 
 @router.get("/dashboard")
 async def dashboard(
     request: Request,
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(interview_filters),
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get user's interviews
-    interviews = db.query(Interview).filter(Interview.user_id == user.id).order_by(Interview.created_at.desc()).all()
+    # Get one page of the user's interviews and their overall counts
+    page = await fetch_page(queries.paginate_interviews, db, user_id=user.id, **paging, **filters)
+    stats = await StatisticsService.get_user_interview_stats(db, user.id)
+    
+    # Get topics and difficulties for the filters
+    topics = await reference_data.topics(db)
+    difficulties = await reference_data.difficulties(db)
     
     return templates.TemplateResponse(
         "user/dashboard.html", 
         {
             "request": request, 
             "user": user,
-            "interviews": interviews
+            "interviews": page.items,
+            "page": page,
+            "stats": stats,
+            "filters": filters,
+            "topics": topics,
+            "difficulties": difficulties
         }
     )
 
+@router.get("/api/interviews", response_model=InterviewPage)
+async def list_interviews_json(
+    paging: Dict = Depends(page_params),
+    filters: Dict = Depends(interview_filters),
+    user: User = Depends(validate_logged_in),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """JSON variant of the dashboard interview listing"""
+    page = await fetch_page(
+        queries.paginate_interviews, db, options=queries.INTERVIEW_LISTING_OPTIONS,
+        user_id=user.id, **paging, **filters
+    )
+    return InterviewPage.model_validate(page, from_attributes=True)
+
 @router.get("/request-interview")
 async def request_interview_form(
     request: Request,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get topics, difficulties and timings for the form
-    topics = db.query(Topic).all()
-    difficulties = db.query(Difficulty).all()
-    timings = db.query(Timing).all()
+    topics = await reference_data.topics(db)
+    difficulties = await reference_data.difficulties(db)
+    timings = await reference_data.timings(db)
     
     return templates.TemplateResponse(
         "user/request_interview.html", 
@@ -65,8 +99,11 @@ async def request_interview(
     difficulty_id: int = Form(...),
     timing_id: int = Form(...),
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
+    # Get the selected topics
+    topics = (await db.scalars(select(Topic).where(Topic.id.in_(topic_ids)))).all()
+    
     # Create the interview request using logged-in user info
     new_interview = Interview(
         uuid=str(uuid4()),  # Generate a UUID for the interview
@@ -75,18 +112,13 @@ async def request_interview(
         user_id=user.id,
         difficulty_id=difficulty_id,
         timing_id=timing_id,
-        approval_status="requested"
+        approval_status="requested",
+        topics=list(topics)
     )
     
     db.add(new_interview)
-    db.commit()
-    db.refresh(new_interview)
-    
-    # Add topics to the interview
-    for topic_id in topic_ids:
-        topic = db.query(Topic).filter(Topic.id == topic_id).first()
-        if topic:
-            new_interview.topics.append(topic)
+    await db.commit()
+    StatisticsService.invalidate()
     
     return RedirectResponse(url="/user/dashboard", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -95,12 +127,11 @@ async def view_interview(
     request: Request,
     interview_id: int,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    interview = db.query(Interview).filter(
-        Interview.id == interview_id,
-        Interview.user_id == user.id
-    ).first()
+    interview = await queries.get_interview_session(
+        db, interview_id=interview_id, user_id=user.id, include_archived=True
+    )
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -127,12 +158,9 @@ async def start_interview(
     request: Request,
     interview_id: int,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    interview = db.query(Interview).filter(
-        Interview.id == interview_id,
-        Interview.user_id == user.id
-    ).first()
+    interview = await queries.get_interview_session(db, interview_id=interview_id, user_id=user.id)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -153,45 +181,40 @@ async def start_interview(
         # Get topics selected for this interview
         topics = interview.topics
         
-        # Get the question bank for the selected difficulty and topics
-        question_bank = db.query(QuestionBank).filter(
-            QuestionBank.difficulty_id == difficulty.id,
-            QuestionBank.topic_id.in_([t.id for t in topics])
-        ).all()
-        
         # Determine how many questions to ask based on interview timing
         interview_minutes = interview.timing.minutes
         
         # Roughly one question per 5 minutes, with a minimum of 3 and maximum of 20
         num_questions = max(3, min(20, interview_minutes // 5))
         
-        # Randomly select questions from the question bank
-        if len(question_bank) > num_questions:
-            selected_questions = random.sample(question_bank, num_questions)
-        else:
-            selected_questions = question_bank
+        # Randomly select questions for the difficulty and topics from the in-memory pool,
+        # loading only the chosen rows
+        selected_questions = await question_pool.sample_questions(
+            db, [t.id for t in topics], difficulty.id, num_questions
+        )
         
         # Create questions for this interview
-        for i, qb in enumerate(selected_questions):
-            question = Question(
+        new_questions = [
+            Question(
                 interview_id=interview.id,
-                
                 question_text=qb.question_text,
                 topic_id=qb.topic_id,
                 question_order=i + 1
             )
-            db.add(question)
+            for i, qb in enumerate(selected_questions)
+        ]
+        db.add_all(new_questions)
+        InterviewProgress.add_questions(interview, new_questions)
         
         # Mark the interview as in progress
         interview.status = "in_progress"
         interview.started_at = datetime.now()
         
-        db.commit()
+        await db.commit()
+        StatisticsService.invalidate()
     
     # Get the first question (or the first unanswered question)
-    questions = db.query(Question).filter(
-        Question.interview_id == interview_id
-    ).order_by(Question.question_order).all()
+    questions = await queries.list_interview_questions(db, interview_id, with_topic=False)
     
     # Find the first unanswered question, if any
     current_question = None
@@ -217,13 +240,10 @@ async def answer_question_form(
     interview_id: int,
     question_id: int,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get the interview
-    interview = db.query(Interview).filter(
-        Interview.id == interview_id,
-        Interview.user_id == user.id
-    ).first()
+    interview = await queries.get_interview_detail(db, interview_id=interview_id, user_id=user.id)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -232,16 +252,9 @@ async def answer_question_form(
     if interview.approval_status != "approved":
         raise HTTPException(status_code=400, detail="This interview has not been approved yet")
     
-    # Get all questions for navigation
-    questions = db.query(Question).filter(
-        Question.interview_id == interview_id
-    ).order_by(Question.question_order).all()
-    
-    # Get the current question
-    current_question = db.query(Question).filter(
-        Question.id == question_id,
-        Question.interview_id == interview_id
-    ).first()
+    # Get all questions for navigation; the current question is one of them
+    questions = await queries.list_interview_questions(db, interview_id)
+    current_question = next((q for q in questions if q.id == question_id), None)
     
     if not current_question:
         raise HTTPException(status_code=404, detail="Question not found")
@@ -276,27 +289,27 @@ async def submit_answer(
     question_id: int,
     answer: str = Form(...),
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get the question
-    question = db.query(Question).filter(
-        Question.id == question_id,
-        Question.interview_id == interview_id
-    ).first()
+    # Get the interview and the question
+    interview = await queries.get_interview(db, interview_id=interview_id, user_id=user.id)
+    
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    question = await queries.get_interview_question(db, interview_id, question_id)
     
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
     
-    # Save the answer
-    question.answer = answer
+    # Save the answer; the interview aggregates are updated in the same transaction
+    await InterviewProgress.record_answer(db, interview, question, answer)
     print(f"Saved answer for question {question_id}: {answer[:30]}...")
     question.answered_at = datetime.now()
-    db.commit()
+    await db.commit()
     
     # Get all questions for the interview
-    questions = db.query(Question).filter(
-        Question.interview_id == interview_id
-    ).order_by(Question.question_order).all()
+    questions = await queries.list_interview_questions(db, interview_id, with_topic=False)
     
     # Find the current question index
     current_question_index = next((i for i, q in enumerate(questions) if q.id == question_id), 0)
@@ -310,15 +323,10 @@ async def submit_answer(
         )
     else:
         # If this was the last question, mark the interview as completed
-        interview = db.query(Interview).filter(
-            Interview.id == interview_id,
-            Interview.user_id == user.id
-        ).first()
-        
-        if interview:
-            interview.status = "completed"
-            interview.completed_at = datetime.now()
-            db.commit()
+        interview.status = "completed"
+        interview.completed_at = datetime.now()
+        await db.commit()
+        StatisticsService.invalidate()
         
         return RedirectResponse(
             url=f"/user/finish-interview/{interview_id}", 
@@ -330,13 +338,10 @@ async def finish_interview(
     request: Request,
     interview_id: int,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Get the interview
-    interview = db.query(Interview).filter(
-        Interview.id == interview_id,
-        Interview.user_id == user.id
-    ).first()
+    interview = await queries.get_interview(db, interview_id=interview_id, user_id=user.id)
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -344,7 +349,8 @@ async def finish_interview(
     # Mark the interview as completed
     interview.status = "completed"
     interview.completed_at = datetime.now()
-    db.commit()
+    await db.commit()
+    StatisticsService.invalidate()
     
     # Redirect to the evaluation page
     return RedirectResponse(
@@ -357,13 +363,12 @@ async def interview_evaluation(
     request: Request,
     interview_id: int,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    # Get the interview
-    interview = db.query(Interview).filter(
-        Interview.id == interview_id,
-        Interview.user_id == user.id
-    ).first()
+    # Get the interview, from the archive if it has been moved there
+    interview = await queries.get_interview_detail(
+        db, interview_id=interview_id, user_id=user.id, include_archived=True
+    )
     
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -373,13 +378,7 @@ async def interview_evaluation(
         raise HTTPException(status_code=400, detail="This interview is not completed yet")
     
     # Get questions with answers
-    questions = db.query(Question).filter(
-        Question.interview_id == interview_id
-    ).order_by(Question.question_order).all()
-    
-    # Calculate average score (if questions have been evaluated)
-    scores = [q.score for q in questions if q.score is not None]
-    average_score = sum(scores) / len(scores) if scores else 0
+    questions = await queries.list_interview_questions(db, interview_id, archived=interview.is_archived)
     
     return templates.TemplateResponse(
         "user/interview_evaluation.html", 
@@ -388,7 +387,7 @@ async def interview_evaluation(
             "user": user,
             "interview": interview,
             "questions": questions,
-            "average_score": average_score
+            "average_score": interview.average_score or 0
         }
     )
 
@@ -398,28 +397,18 @@ async def debug_question_data(
     interview_id: int,
     question_id: int,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Debug version of the question page that shows all data"""
     # Get the interview
-    interview = db.query(Interview).filter(
-        Interview.id == interview_id,
-        Interview.user_id == user.id
-    ).first()
+    interview = await queries.get_interview_detail(db, interview_id=interview_id, user_id=user.id)
     
     if not interview:
         return HTMLResponse(content="<html><body>Interview not found</body></html>", status_code=404)
     
     # Get all questions for navigation
-    questions = db.query(Question).filter(
-        Question.interview_id == interview_id
-    ).order_by(Question.question_order).all()
-    
-    # Get the current question
-    current_question = db.query(Question).filter(
-        Question.id == question_id,
-        Question.interview_id == interview_id
-    ).first()
+    questions = await queries.list_interview_questions(db, interview_id, with_topic=False)
+    current_question = next((q for q in questions if q.id == question_id), None)
     
     if not current_question:
         return HTMLResponse(content="<html><body>Question not found</body></html>", status_code=404)
@@ -534,7 +523,7 @@ async def debug_question_data(
 async def user_profile(
     request: Request,
     user: User = Depends(validate_logged_in),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """User profile page where they can update their information"""
     return templates.TemplateResponse(
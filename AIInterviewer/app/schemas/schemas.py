@@ -14,6 +14,15 @@ class UserLogin(BaseModel):
     username: str
     password: str
 
+class Token(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+    expires_in: int  # seconds until the access token expires
+
+class TokenRefresh(BaseModel):
+    refresh_token: str
+
 class UserUpdate(BaseModel):
     username: Optional[str] = None
     email: Optional[EmailStr] = None
@@ -135,3 +144,83 @@ class InterviewWithDetails(Interview):
 
     class Config:
         from_attributes = True
+
+# Paginated listing schemas (JSON variants of the admin and user listing pages)
+class UserListItem(BaseModel):
+    id: int
+    username: str
+    email: str
+    is_admin: bool
+    is_active: bool
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class InterviewListItem(BaseModel):
+    id: int
+    uuid: str
+    candidate_name: str
+    email: str
+    user_id: Optional[int] = None
+    status: str
+    approval_status: str
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    question_count: int = 0
+    answered_count: int = 0
+    average_score: Optional[float] = None
+    difficulty: Optional[Difficulty] = None
+    timing: Optional[Timing] = None
+    topics: List[Topic] = []
+
+    class Config:
+        from_attributes = True
+
+class QuestionBankItem(BaseModel):
+    id: int
+    question_text: str
+    model_answer: Optional[str] = None
+    topic: Optional[Topic] = None
+    difficulty: Optional[Difficulty] = None
+
+    class Config:
+        from_attributes = True
+        protected_namespaces = ()
+
+class UserPage(BaseModel):
+    items: List[UserListItem]
+    next_cursor: Optional[str] = None
+    limit: int
+
+    class Config:
+        from_attributes = True
+
+class InterviewPage(BaseModel):
+    items: List[InterviewListItem]
+    next_cursor: Optional[str] = None
+    limit: int
+
+    class Config:
+        from_attributes = True
+
+class QuestionBankPage(BaseModel):
+    items: List[QuestionBankItem]
+    next_cursor: Optional[str] = None
+    limit: int
+
+    class Config:
+        from_attributes = True
+
+# Background job schemas
+class JobStatus(BaseModel):
+    job_id: str
+    kind: str
+    status: str  # queued, running, succeeded, failed
+    attempts: int
+    max_attempts: int
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,172 @@
+"""
+Background job handlers for AI answer evaluation, interview summaries and question generation.
+
+Each handler reads what it needs in a short transaction, calls OpenAI with no
+transaction open, and writes the result in a second short transaction. Evaluation
+feedback and summaries are streamed to the pages following the job (JobContext.emit). Until the
+final attempt OpenAI errors are raised, so the job queue retries them; the final
+attempt stores the usual fallback result instead of failing the candidate's interview.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict
+from sqlalchemy import select, update
+from app.database.database import AsyncSessionLocal
+from app.database import queries
+from app.models.models import Difficulty, Interview, Question, Topic
+from app.services.interview_progress import InterviewProgress
+from app.services.job_queue import JobContext, RetryLater, job_handler
+from app.services.openai_resilience import openai_resilience
+from app.services.openai_service import AsyncOpenAIService
+from app.services.statistics import StatisticsService
+
+# Seconds a summary waits for the interview's answers to be evaluated before it is written anyway
+SUMMARY_MAX_WAIT = float(os.getenv("SUMMARY_MAX_WAIT", "600"))
+
+def _wait_for_openai():
+    """Queue the job again while the OpenAI circuit breaker is open, instead of using up an attempt on a fast failure"""
+    breaker = openai_resilience.breaker
+    if breaker.state == "open":
+        raise RetryLater(max(breaker.retry_after, 1), "OpenAI circuit breaker is open")
+
+@job_handler("evaluate_answer")
+async def evaluate_answer(job: JobContext) -> Dict:
+    """Evaluate a submitted answer and store its score and feedback"""
+    interview_id, question_id, answer = job.payload["interview_id"], job.payload["question_id"], job.payload["answer"]
+    _wait_for_openai()
+
+    async with AsyncSessionLocal() as db:
+        interview = await queries.get_interview_detail(db, interview_id=interview_id)
+        question = await queries.get_interview_question(db, interview_id, question_id, with_topic=True)
+        if not interview or not question:
+            raise ValueError(f"Question {question_id} of interview {interview_id} not found")
+        question_text, topic_name, difficulty_name = question.question_text, question.topic.name, interview.difficulty.name
+        # The expected answer is stored in the feedback field when questions were generated
+        expected_answer = question.feedback
+
+    evaluation = await AsyncOpenAIService.evaluate_answer(
+        question=question_text,
+        candidate_answer=answer,
+        expected_answer=expected_answer,
+        topic=topic_name,
+        difficulty=difficulty_name,
+        fallback=job.final_attempt,
+        on_token=job.emit
+    )
+
+    async with AsyncSessionLocal() as db:
+        interview = await db.get(Interview, interview_id)
+        question = await db.get(Question, question_id)
+        await InterviewProgress.lock(db, interview, question)
+        # A newer submission of this question has its own job
+        if question.answer != answer:
+            return evaluation
+        question.feedback = evaluation["feedback"]
+        await InterviewProgress.record_answer(db, interview, question, answer, evaluation["score"])
+        await db.commit()
+        if interview.status == "completed":
+            StatisticsService.invalidate()
+    return evaluation
+
+@job_handler("summarize_interview")
+async def summarize_interview(job: JobContext) -> Dict:
+    """Summarize a completed interview once its answers are evaluated"""
+    interview_id = job.payload["interview_id"]
+    _wait_for_openai()
+
+    async with AsyncSessionLocal() as db:
+        interview = await queries.get_interview_session(db, interview_id=interview_id)
+        if not interview:
+            raise ValueError(f"Interview {interview_id} not found")
+        if (interview.scored_count < interview.question_count
+                and datetime.now() - job.created_at < timedelta(seconds=SUMMARY_MAX_WAIT)):
+            raise RetryLater(2, "answers are still being evaluated")
+
+        evaluations = [
+            {
+                "question": q.question_text,
+                "answer": q.answer,
+                "score": q.score,
+                # Unscored questions still hold the expected answer in feedback
+                "feedback": q.feedback if q.score is not None else "",
+                "strengths": [],
+                "areas_for_improvement": []
+            }
+            for q in interview.questions if q.answer
+        ]
+        topics = [topic.name for topic in interview.topics]
+        difficulty_name = interview.difficulty.name
+
+    summary = await AsyncOpenAIService.summarize_interview(
+        evaluations=evaluations,
+        topics=topics,
+        difficulty=difficulty_name,
+        fallback=job.final_attempt,
+        on_token=job.emit
+    )
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(Interview).where(Interview.id == interview_id).values(summary=summary["summary"]))
+        await db.commit()
+    StatisticsService.invalidate()
+    return summary
+
+@job_handler("generate_interview")
+async def generate_interview(job: JobContext) -> Dict:
+    """Create a dynamic interview with 2 generated questions per topic"""
+    payload = job.payload
+    _wait_for_openai()
+
+    async with AsyncSessionLocal() as db:
+        # A previous attempt may have created the interview before its job was marked done
+        if await db.scalar(select(Interview.id).where(Interview.uuid == payload["interview_uuid"])):
+            return {"interview_uuid": payload["interview_uuid"], "failed_topics": []}
+        topics = (await db.scalars(select(Topic).where(Topic.id.in_(payload["topic_ids"])))).all()
+        difficulty = await db.scalar(select(Difficulty).where(Difficulty.id == payload["difficulty_id"]))
+        if not topics or not difficulty:
+            raise ValueError("Invalid topics or difficulty")
+        topic_names, difficulty_name = [topic.name for topic in topics], difficulty.name
+
+    # All topics at once, with no transaction open while OpenAI answers
+    generated = await AsyncOpenAIService.generate_questions_for_topics(topic_names, difficulty_name, count=2)
+    failed_topics = [name for name, questions in zip(topic_names, generated) if not questions]
+    if len(failed_topics) == len(topic_names):
+        raise RuntimeError("Question generation failed for every topic, please try again")
+
+    async with AsyncSessionLocal() as db:
+        topics = (await db.scalars(select(Topic).where(Topic.id.in_(payload["topic_ids"])))).all()
+        by_name = {topic.name: topic for topic in topics}
+        kept_topics = [by_name[name] for name, questions in zip(topic_names, generated) if questions and name in by_name]
+
+        # Create a new interview with the topics that got questions
+        new_interview = Interview(
+            uuid=payload["interview_uuid"],
+            candidate_name=payload["candidate_name"],
+            email=payload["email"],
+            user_id=payload["user_id"],
+            difficulty_id=payload["difficulty_id"],
+            status="pending",
+            created_at=datetime.now(),
+            topics=kept_topics
+        )
+        db.add(new_interview)
+        await db.flush()  # Get the ID without committing
+
+        # Save the generated questions
+        for topic in kept_topics:
+            for i, q_data in enumerate(generated[topic_names.index(topic.name)]):
+                question = Question(
+                    interview_id=new_interview.id,
+                    topic_id=topic.id,
+                    question_text=q_data["question_text"],
+                    question_order=i + 1
+                )
+                # Store expected answer as feedback for evaluation
+                question.feedback = q_data.get("expected_answer", "")
+                db.add(question)
+                InterviewProgress.add_questions(new_interview, [question])
+
+        await db.commit()
+    StatisticsService.invalidate()
+    return {"interview_uuid": payload["interview_uuid"], "failed_topics": failed_topics}
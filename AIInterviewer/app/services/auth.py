@@ -1,19 +1,40 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from fastapi import Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from app.database.database import get_db
-from app.models.models import User
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.database import get_async_db
+from app.services.user_principals import UserPrincipal, user_principals
 
-# Secret key and algorithm for JWT
-SECRET_KEY = "your-secret-key"  # Change this in production!
+# Secret key and algorithm for JWT (the same SECRET_KEY signs the session cookie)
+SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key")  # Change this in production!
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+
+# Role claim carried by API tokens
+TOKEN_ROLES = ("user", "admin")
+
+# Bearer tokens for the JSON API; optional so browser requests fall back to the session
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token", auto_error=False)
+
+# bcrypt work factor (log2 of the iterations); each step doubles the cost of a hash
+# Hashes made with another factor are upgraded at the user's next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Threads hashing and verifying passwords for the request handlers
+# bcrypt releases the GIL, so this bounds how many CPU cores logins can occupy at once
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
 
 # Verify password
 def verify_password(plain_password, hashed_password):
@@ -23,6 +44,23 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# Async variants for request handlers: bcrypt runs on the worker pool so the event
+# loop keeps serving other requests while a password is hashed
+async def hash_password(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, pwd_context.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password and, when the stored hash uses outdated parameters, rehash it
+
+    Returns:
+        Tuple[bool, Optional[str]]: Whether the password matches, and a replacement hash
+        to store (None when the stored hash is current)
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _password_executor, pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
 # Create access token
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -34,18 +72,74 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def create_token_pair(user: UserPrincipal) -> dict:
+    """
+    Access and refresh token for a user
+
+    The access token carries everything validate_api_user needs (id, name, email,
+    role), so API requests are authenticated from the signature alone. Role and active
+    flag changes reach a client when it refreshes, at most ACCESS_TOKEN_EXPIRE_MINUTES later.
+    """
+    claims = {
+        "sub": str(user.id),
+        "username": user.username,
+        "email": user.email,
+        "role": "admin" if user.is_admin else "user",
+    }
+    return {
+        "access_token": create_access_token(dict(claims, type="access")),
+        "refresh_token": create_access_token(
+            {"sub": str(user.id), "type": "refresh"}, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        ),
+        "token_type": "bearer",
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+def decode_token(token: str, token_type: str = "access") -> dict:
+    """Claims of a token signed by us, unexpired and of the given type; 401 otherwise"""
+    credentials_error = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        # Verifies the signature and the exp claim
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        raise credentials_error
+    if claims.get("type") != token_type or not str(claims.get("sub", "")).isdigit():
+        raise credentials_error
+    if token_type == "access" and claims.get("role") not in TOKEN_ROLES:
+        raise credentials_error
+    return claims
+
+def principal_from_token(token: str) -> UserPrincipal:
+    claims = decode_token(token)
+    return UserPrincipal(
+        id=int(claims["sub"]),
+        username=claims.get("username"),
+        email=claims.get("email"),
+        is_admin=claims["role"] == "admin",
+        is_active=True,
+    )
+
 # Get current user from session
-def get_current_user_from_session(request: Request, db: Session = Depends(get_db)):
+# Resolved through the per-worker principal cache; deactivated users count as logged out
+async def get_current_user_from_session(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> Optional[UserPrincipal]:
     user_id = request.session.get("user_id")
     if user_id is None:
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await user_principals.get(db, user_id)
+    if user is None or not user.is_active:
+        return None
     return user
 
 # Validate user is logged in
-def validate_logged_in(request: Request, db: Session = Depends(get_db)):
-    user = get_current_user_from_session(request, db)
+async def validate_logged_in(request: Request, db: AsyncSession = Depends(get_async_db)):
+    user = await get_current_user_from_session(request, db)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -55,11 +149,29 @@ def validate_logged_in(request: Request, db: Session = Depends(get_db)):
     return user
 
 # Validate user is admin
-def validate_admin(request: Request, db: Session = Depends(get_db)):
-    user = get_current_user_from_session(request, db)
+async def validate_admin(request: Request, db: AsyncSession = Depends(get_async_db)):
+    user = await get_current_user_from_session(request, db)
     if user is None or not user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized",
         )
     return user
+
+# Validate an API client: a bearer access token if one is sent, otherwise the browser session
+# Tokens are checked from their signature and claims alone, without a database lookup
+async def validate_api_user(
+    request: Request,
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> UserPrincipal:
+    if token:
+        return principal_from_token(token)
+    user = await get_current_user_from_session(request, db)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
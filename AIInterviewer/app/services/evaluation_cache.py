@@ -0,0 +1,175 @@
+import asyncio
+import copy
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.database.database import AsyncSessionLocal, SessionLocal
+from app.models.models import CachedEvaluation
+
+# Seconds a stored evaluation is returned again for byte-identical input (0 disables the cache)
+EVALUATION_CACHE_RETENTION = float(os.getenv("EVALUATION_CACHE_RETENTION", "604800"))
+
+def evaluation_key(request: Dict) -> str:
+    """Content address of an evaluation request: a hash of its exact model, temperature, format and messages"""
+    payload = json.dumps(
+        [request["model"], request.get("temperature"), request.get("response_format"), request["messages"]],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class EvaluationCache:
+    """
+    Deduplicating cache of answer evaluations, shared by every worker through the database
+
+    Retries, double-clicks and demo runs submit byte-identical (question, answer,
+    expected answer, topic, difficulty) tuples. Their prompt hashes to the same key, so
+    the stored evaluation is returned instead of calling OpenAI again, for up to
+    EVALUATION_CACHE_RETENTION seconds. Identical evaluations running at the same time
+    in one worker share a single call. Failed calls are not stored, so the next
+    identical submission tries again.
+    """
+
+    def __init__(self, retention: float = EVALUATION_CACHE_RETENTION, session_factory=AsyncSessionLocal,
+                 sync_session_factory=SessionLocal):
+        self.retention = retention
+        self.session_factory = session_factory
+        self.sync_session_factory = sync_session_factory
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stores = 0
+        self.purged = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.retention > 0
+
+    def _get(self, db: Session, key: str) -> Optional[Dict]:
+        now = datetime.now()
+        # Read-only, so hits never wait on the database write lock
+        row = db.execute(
+            select(CachedEvaluation.evaluation, CachedEvaluation.created_at).where(CachedEvaluation.cache_key == key)
+        ).first()
+        if row is None or row.created_at < now - timedelta(seconds=self.retention):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row.evaluation)
+
+    def _put(self, db: Session, key: str, model: str, evaluation: Dict):
+        # Stored evaluations past the retention window go with every store
+        self.purged += db.execute(
+            delete(CachedEvaluation).where(
+                (CachedEvaluation.cache_key == key)
+                | (CachedEvaluation.created_at < datetime.now() - timedelta(seconds=self.retention))
+            )
+        ).rowcount or 0
+        db.add(CachedEvaluation(cache_key=key, model=model, evaluation=json.dumps(evaluation), created_at=datetime.now()))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same evaluation at the same time
+            db.rollback()
+            return
+        self.stores += 1
+
+    def _purge(self, db: Session, older_than: Optional[float]) -> int:
+        query = delete(CachedEvaluation)
+        if older_than is not None:
+            query = query.where(CachedEvaluation.created_at < datetime.now() - timedelta(seconds=older_than))
+        purged = db.execute(query).rowcount or 0
+        db.commit()
+        self.purged += purged
+        return purged
+
+    def _stats(self, db: Session) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "retention_seconds": self.retention,
+            "entries": db.scalar(select(func.count(CachedEvaluation.id))),
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stores": self.stores,
+            "purged": self.purged,
+        }
+
+    async def _load_or_evaluate(self, key: str, request: Dict, evaluate: Callable[[], Awaitable[Dict]]) -> Dict:
+        try:
+            async with self.session_factory() as db:
+                cached = await db.run_sync(self._get, key)
+        except Exception as e:
+            print(f"Evaluation cache lookup failed: {str(e)}")
+            cached = None
+        if cached is not None:
+            return cached
+
+        evaluation = await evaluate()
+        try:
+            async with self.session_factory() as db:
+                await db.run_sync(self._put, key, request["model"], evaluation)
+        except Exception as e:
+            print(f"Evaluation cache store failed: {str(e)}")
+        return evaluation
+
+    async def get_or_evaluate(self, request: Dict, evaluate: Callable[[], Awaitable[Dict]]) -> Dict:
+        """
+        The stored evaluation for this request, or the result of evaluate(), which is then stored
+
+        A request identical to one already in flight waits for that call instead of
+        making its own. Exceptions from evaluate() reach every waiting caller.
+        """
+        if not self.enabled:
+            return await evaluate()
+        key = evaluation_key(request)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_or_evaluate(key, request, evaluate))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded so a caller that disconnects does not cancel the call the others wait for
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def get_or_evaluate_sync(self, request: Dict, evaluate: Callable[[], Dict]) -> Dict:
+        """get_or_evaluate for the synchronous OpenAIService (no in-flight coalescing)"""
+        if not self.enabled:
+            return evaluate()
+        key = evaluation_key(request)
+        try:
+            with self.sync_session_factory() as db:
+                cached = self._get(db, key)
+        except Exception as e:
+            print(f"Evaluation cache lookup failed: {str(e)}")
+            cached = None
+        if cached is not None:
+            return cached
+
+        evaluation = evaluate()
+        try:
+            with self.sync_session_factory() as db:
+                self._put(db, key, request["model"], evaluation)
+        except Exception as e:
+            print(f"Evaluation cache store failed: {str(e)}")
+        return evaluation
+
+    async def purge(self, older_than: Optional[float] = None) -> int:
+        """Delete stored evaluations, all of them or those older than the given seconds; returns the count"""
+        async with self.session_factory() as db:
+            return await db.run_sync(self._purge, older_than)
+
+    async def stats(self) -> Dict:
+        """Entries, retention and hit/miss/coalesced counters for the status page"""
+        async with self.session_factory() as db:
+            return await db.run_sync(self._stats)
+
+# Shared by every request in this worker process
+evaluation_cache = EvaluationCache()
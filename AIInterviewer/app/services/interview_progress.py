@@ -0,0 +1,121 @@
+from typing import Dict, Iterable, Optional
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Interview, Question
+
+class InterviewProgress:
+    """
+    Keeps the progress and score aggregates stored on an Interview in step with its questions
+
+    Callers change questions through these methods and commit once, so the aggregates
+    are written in the same transaction as the questions they describe. Completion checks
+    and evaluation pages then read the interview row instead of every question.
+
+    topic_scores maps str(topic_id) to {"questions", "answered", "scored", "total"}.
+    """
+
+    # Columns record_answer re-reads once it holds the interview's write lock
+    LOCKED_INTERVIEW_COLUMNS = ["question_count", "answered_count", "scored_count", "total_score",
+                                "average_score", "topic_scores", "status"]
+    LOCKED_QUESTION_COLUMNS = ["answer", "score"]
+
+    @staticmethod
+    def _topic(topic_scores: Dict, topic_id) -> Dict:
+        return topic_scores.setdefault(
+            str(topic_id), {"questions": 0, "answered": 0, "scored": 0, "total": 0}
+        )
+
+    @staticmethod
+    def _set_average(interview: Interview):
+        interview.average_score = (
+            interview.total_score / interview.scored_count if interview.scored_count else None
+        )
+
+    @staticmethod
+    def add_questions(interview: Interview, questions: Iterable[Question]):
+        """Count newly created questions; call before the commit that inserts them"""
+        topic_scores = dict(interview.topic_scores or {})
+        added = 0
+        for question in questions:
+            added += 1
+            entry = dict(InterviewProgress._topic(topic_scores, question.topic_id))
+            entry["questions"] += 1
+            topic_scores[str(question.topic_id)] = entry
+        interview.question_count = (interview.question_count or 0) + added
+        # Assign a new dict so the JSON column is flagged as changed
+        interview.topic_scores = topic_scores
+
+    @staticmethod
+    async def lock(db: AsyncSession, interview: Interview, question: Question):
+        """
+        Take the interview's write lock and reload what record_answer reads from the locked rows
+
+        The no-op UPDATE starts the write transaction: on SQLite it takes the database
+        write lock (waiting up to busy_timeout for other writers), on PostgreSQL the row
+        lock. Both are held until the caller commits, so overlapping answers to the same
+        interview apply their deltas one after another instead of overwriting each other.
+        """
+        await db.execute(
+            update(Interview)
+            .where(Interview.id == interview.id)
+            .values(id=Interview.id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.refresh(interview, InterviewProgress.LOCKED_INTERVIEW_COLUMNS)
+        await db.refresh(question, InterviewProgress.LOCKED_QUESTION_COLUMNS)
+
+    @staticmethod
+    async def record_answer(db: AsyncSession, interview: Interview, question: Question, answer: str,
+                            score: Optional[int] = None):
+        """
+        Store an answer (and score) on a question and adjust the interview aggregates
+
+        Re-answering a question replaces its previous contribution rather than adding to it.
+        The interview stays locked until the caller commits (see lock), so the caller's
+        all_answered check sees every answer committed before this one.
+
+        Args:
+            db (AsyncSession): Session the caller commits
+            interview (Interview): The question's interview
+            question (Question): Question being answered
+            answer (str): Candidate's answer
+            score (int): New score, or None to keep the question's current score
+        """
+        await InterviewProgress.lock(db, interview, question)
+        was_answered = bool(question.answer)
+        previous_score = question.score
+
+        question.answer = answer
+        if score is not None:
+            question.score = score
+
+        answered_delta = int(bool(question.answer)) - int(was_answered)
+        scored_delta = int(question.score is not None) - int(previous_score is not None)
+        score_delta = (question.score or 0) - (previous_score or 0)
+
+        interview.answered_count = (interview.answered_count or 0) + answered_delta
+        interview.scored_count = (interview.scored_count or 0) + scored_delta
+        interview.total_score = (interview.total_score or 0) + score_delta
+        InterviewProgress._set_average(interview)
+
+        topic_scores = dict(interview.topic_scores or {})
+        entry = dict(InterviewProgress._topic(topic_scores, question.topic_id))
+        entry["answered"] += answered_delta
+        entry["scored"] += scored_delta
+        entry["total"] += score_delta
+        topic_scores[str(question.topic_id)] = entry
+        interview.topic_scores = topic_scores
+
+    @staticmethod
+    def all_answered(interview: Interview) -> bool:
+        """True once every question of an interview that has questions is answered"""
+        return bool(interview.question_count) and interview.answered_count >= interview.question_count
+
+    @staticmethod
+    def topic_averages(interview: Interview) -> Dict[int, int]:
+        """Rounded score per topic id over all of that topic's questions (unscored count as 0)"""
+        return {
+            int(topic_id): round(entry["total"] / entry["questions"])
+            for topic_id, entry in (interview.topic_scores or {}).items()
+            if entry["questions"]
+        }
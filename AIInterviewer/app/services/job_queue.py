@@ -0,0 +1,349 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.database import AsyncSessionLocal
+from app.models.models import Job
+
+# Jobs run at the same time by each app process (0 runs none; jobs then wait for another process)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+
+# Attempts before a job fails, and the delay before the first retry (doubled for every further retry)
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_DELAY = float(os.getenv("JOB_RETRY_DELAY", "5"))
+
+# Seconds an idle worker waits before looking for jobs queued by other processes
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+
+# Seconds a running job is reserved for its worker; after that it counts as abandoned
+# (the process died) and is run again. The worker renews the lease every third of it while
+# the job runs, so it bounds how long a crashed process's jobs wait, not how long a job may take
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "300"))
+
+class JobContext(NamedTuple):
+    """What a handler gets to know about the job it runs"""
+    id: int
+    uuid: str
+    kind: str
+    payload: Dict
+    attempt: int
+    max_attempts: int
+    created_at: datetime
+
+    @property
+    def final_attempt(self) -> bool:
+        return self.attempt >= self.max_attempts
+
+    def emit(self, text: str):
+        """Pass text the job produces (streamed AI feedback) to the pages following it"""
+        job_streams.emit(self.uuid, text)
+
+class RetryLater(Exception):
+    """Raised by a handler that cannot run yet; the job is queued again without using up an attempt"""
+
+    def __init__(self, delay: float, reason: str = ""):
+        super().__init__(reason)
+        self.delay = delay
+
+class JobStream:
+    """Text one attempt of a running job has emitted so far"""
+
+    def __init__(self, attempt: int):
+        self.attempt = attempt
+        self.text = ""
+        self.done = False
+        self._changed = asyncio.Event()
+
+    def _notify(self):
+        # Waiters hold the old event; the next ones wait on a fresh one
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def append(self, text: str):
+        self.text += text
+        self._notify()
+
+    def finish(self):
+        self.done = True
+        self._notify()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """The text so far, then each new piece until the attempt ends"""
+        sent = 0
+        while True:
+            changed = self._changed
+            if len(self.text) > sent:
+                piece, sent = self.text[sent:], len(self.text)
+                yield piece
+            elif self.done:
+                return
+            else:
+                await changed.wait()
+
+class JobStreams:
+    """
+    Live text of the jobs running in this process, for the job stream endpoint
+
+    Only jobs run by this process's workers can be followed token by token; for a job
+    running elsewhere the endpoint waits for its result in the database instead.
+    """
+
+    def __init__(self):
+        self._streams: Dict[str, JobStream] = {}
+        self._opened = asyncio.Event()
+
+    def open(self, job_uuid: str, attempt: int):
+        self._streams[job_uuid] = JobStream(attempt)
+        self._opened.set()
+        self._opened = asyncio.Event()
+
+    def emit(self, job_uuid: str, text: str):
+        stream = self._streams.get(job_uuid)
+        if stream is not None:
+            stream.append(text)
+
+    def close(self, job_uuid: str):
+        stream = self._streams.pop(job_uuid, None)
+        if stream is not None:
+            stream.finish()
+
+    async def wait(self, job_uuid: str, timeout: float) -> Optional[JobStream]:
+        """The job's stream, waiting up to timeout seconds for a worker here to start it"""
+        if job_uuid not in self._streams:
+            try:
+                await asyncio.wait_for(self._opened.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._streams.get(job_uuid)
+
+job_streams = JobStreams()
+
+# Job kind -> async handler(JobContext) returning the JSON result
+HANDLERS: Dict[str, Callable[[JobContext], Awaitable[Dict]]] = {}
+
+def job_handler(kind: str):
+    """Register the handler for a job kind"""
+    def register(handler):
+        HANDLERS[kind] = handler
+        return handler
+    return register
+
+def enqueue(db: AsyncSession, kind: str, payload: Dict, max_attempts: Optional[int] = None) -> Job:
+    """
+    Add a job to the caller's transaction
+
+    The job is written (and becomes visible to workers) when the caller commits, together
+    with the changes it belongs to. Call job_queue.notify() after the commit so the local
+    workers pick it up at once.
+    """
+    now = datetime.now()
+    job = Job(
+        uuid=str(uuid.uuid4()), kind=kind, status="queued", payload=payload,
+        max_attempts=max_attempts or JOB_MAX_ATTEMPTS, run_after=now, created_at=now
+    )
+    db.add(job)
+    return job
+
+class JobQueue:
+    """
+    Database-backed job queue with a pool of async workers in the app process
+
+    Jobs are rows in the jobs table, so they survive restarts and every app process can
+    run them. A worker claims the oldest due job with a conditional UPDATE on its attempt
+    count, so two workers (in any process) never run the same attempt. Failed attempts
+    are retried with exponential backoff until max_attempts. Jobs of a stopped worker are
+    handed back at shutdown; jobs of a crashed one are run again once their lease expires
+    (running jobs renew theirs).
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, retry_delay: float = JOB_RETRY_DELAY,
+                 poll_interval: float = JOB_POLL_INTERVAL, lease_seconds: float = JOB_LEASE_SECONDS,
+                 session_factory=AsyncSessionLocal):
+        self.workers = workers
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.session_factory = session_factory
+        self._tasks: List[asyncio.Task] = []
+        self._running: Set[int] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self.succeeded = 0
+        self.retried = 0
+        self.deferred = 0
+        self.failed = 0
+        self.recovered = 0
+
+    async def start(self):
+        """Start the workers on the running event loop"""
+        import app.services.ai_jobs  # noqa: F401  registers the AI job handlers
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if self._tasks:
+            print(f"✅ Started {len(self._tasks)} background job workers")
+
+    async def stop(self):
+        """Stop the workers and queue their unfinished jobs again, with the attempt given back"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._running:
+            async with self.session_factory() as db:
+                await db.execute(
+                    update(Job).where(Job.id.in_(self._running), Job.status == "running")
+                    .values(status="queued", attempts=Job.attempts - 1, locked_until=None, run_after=datetime.now())
+                )
+                await db.commit()
+            self._running.clear()
+
+    def notify(self):
+        """Wake idle workers; call after committing enqueued jobs"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _worker(self):
+        while True:
+            try:
+                job = await self._claim()
+            except Exception as e:
+                print(f"Error claiming a job: {str(e)}")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+            await self._run(job)
+
+    async def _claim(self) -> Optional[JobContext]:
+        """Reserve the oldest due job (or an abandoned one) for this worker"""
+        async with self.session_factory() as db:
+            while True:
+                now = datetime.now()
+                candidate = (await db.execute(
+                    select(Job.id, Job.status, Job.attempts)
+                    .where(Job.status == "queued", Job.run_after <= now)
+                    .order_by(Job.run_after, Job.id).limit(1)
+                )).first()
+                if candidate is None:
+                    candidate = (await db.execute(
+                        select(Job.id, Job.status, Job.attempts)
+                        .where(Job.status == "running", Job.locked_until < now)
+                        .order_by(Job.locked_until, Job.id).limit(1)
+                    )).first()
+                if candidate is None:
+                    return None
+
+                # The attempt count is the version: if another worker claimed the job
+                # since it was read, nothing is updated and the next one is tried
+                claimed = (await db.execute(
+                    update(Job)
+                    .where(Job.id == candidate.id, Job.status == candidate.status, Job.attempts == candidate.attempts)
+                    .values(
+                        status="running", attempts=Job.attempts + 1,
+                        locked_until=now + timedelta(seconds=self.lease_seconds),
+                        started_at=now
+                    )
+                )).rowcount
+                await db.commit()
+                if not claimed:
+                    continue
+                if candidate.status == "running":
+                    self.recovered += 1
+
+                job = await db.get(Job, candidate.id, populate_existing=True)
+                self._running.add(job.id)
+                return JobContext(
+                    job.id, job.uuid, job.kind, job.payload, job.attempts, job.max_attempts, job.created_at
+                )
+
+    async def _run(self, job: JobContext):
+        job_streams.open(job.uuid, job.attempt)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self._execute(job)
+        finally:
+            heartbeat.cancel()
+            # After the final status is written, so followers that see the end find it
+            job_streams.close(job.uuid)
+
+    async def _heartbeat(self, job: JobContext):
+        """Renew the job's lease while it runs, so a long job is not taken for abandoned"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with self.session_factory() as db:
+                    renewed = (await db.execute(
+                        update(Job)
+                        .where(Job.id == job.id, Job.attempts == job.attempt, Job.status == "running")
+                        .values(locked_until=datetime.now() + timedelta(seconds=self.lease_seconds))
+                    )).rowcount
+                    await db.commit()
+            except Exception as e:
+                print(f"Error renewing the lease of job {job.id}: {str(e)}")
+                continue
+            if not renewed:
+                print(f"⚠️ Job {job.id} ({job.kind}) lost its lease, its result will be discarded")
+                return
+
+    async def _execute(self, job: JobContext):
+        try:
+            handler = HANDLERS.get(job.kind)
+            if handler is None:
+                raise ValueError(f"No handler for job kind '{job.kind}'")
+            result = await handler(job)
+        except RetryLater as e:
+            self.deferred += 1
+            values = {
+                "status": "queued", "attempts": Job.attempts - 1, "locked_until": None,
+                "run_after": datetime.now() + timedelta(seconds=e.delay),
+            }
+        except Exception as e:
+            if job.final_attempt:
+                self.failed += 1
+                print(f"❌ Job {job.id} ({job.kind}) failed after {job.attempt} attempts: {str(e)}")
+                values = {"status": "failed", "error": str(e), "locked_until": None, "finished_at": datetime.now()}
+            else:
+                self.retried += 1
+                delay = self.retry_delay * 2 ** (job.attempt - 1)
+                print(f"⚠️ Job {job.id} ({job.kind}) attempt {job.attempt} failed, retrying in {delay:.0f}s: {str(e)}")
+                values = {
+                    "status": "queued", "error": str(e), "locked_until": None,
+                    "run_after": datetime.now() + timedelta(seconds=delay),
+                }
+        else:
+            self.succeeded += 1
+            values = {"status": "succeeded", "result": result, "error": None, "locked_until": None, "finished_at": datetime.now()}
+
+        try:
+            async with self.session_factory() as db:
+                # Only if the lease was not taken over in the meantime
+                await db.execute(update(Job).where(Job.id == job.id, Job.attempts == job.attempt).values(**values))
+                await db.commit()
+        except Exception as e:
+            # The job stays running until its lease expires, then it is run again
+            print(f"Error saving the outcome of job {job.id} ({job.kind}): {str(e)}")
+        self._running.discard(job.id)
+
+    async def stats(self) -> Dict:
+        """Jobs per status and this process's worker counters"""
+        async with self.session_factory() as db:
+            counts = dict((await db.execute(select(Job.status, func.count(Job.id)).group_by(Job.status))).all())
+        return {
+            "workers": len(self._tasks),
+            "running_here": len(self._running),
+            "jobs": {status: counts.get(status, 0) for status in ("queued", "running", "succeeded", "failed")},
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "deferred": self.deferred,
+            "failed": self.failed,
+            "recovered": self.recovered,
+        }
+
+# Started and stopped with the app (see main.py)
+job_queue = JobQueue()
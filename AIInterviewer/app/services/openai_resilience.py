@@ -0,0 +1,281 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+import openai
+
+T = TypeVar("T")
+
+# Seconds one attempt of each kind of OpenAI call may take before it is abandoned (and retried).
+# For streamed calls it bounds the wait for each piece of the response instead of the whole response
+OPERATION_TIMEOUTS = {
+    "questions": float(os.getenv("OPENAI_QUESTIONS_TIMEOUT", "45")),
+    "batch_questions": float(os.getenv("OPENAI_BATCH_QUESTIONS_TIMEOUT", "90")),
+    "evaluation": float(os.getenv("OPENAI_EVALUATION_TIMEOUT", "30")),
+    "summary": float(os.getenv("OPENAI_SUMMARY_TIMEOUT", "60")),
+    "connection_check": float(os.getenv("OPENAI_CHECK_TIMEOUT", "10")),
+}
+
+# Retries after a failed attempt (timeouts, connection errors, 408/409/429 and 5xx responses).
+# The delay before retry n is random between 0 and OPENAI_RETRY_BASE_DELAY * 2^(n-1), at most
+# OPENAI_RETRY_MAX_DELAY, or the Retry-After the response asks for (if it asks for longer, the
+# call gives up instead of tying up the worker)
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+OPENAI_RETRY_BASE_DELAY = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "1"))
+OPENAI_RETRY_MAX_DELAY = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "30"))
+
+# Consecutive failed attempts that open the circuit breaker, and the seconds it stays open
+# (calls fail at once) before one trial call is let through
+OPENAI_BREAKER_FAILURES = int(os.getenv("OPENAI_BREAKER_FAILURES", "5"))
+OPENAI_BREAKER_RESET_SECONDS = float(os.getenv("OPENAI_BREAKER_RESET_SECONDS", "30"))
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling OpenAI while the circuit breaker is open"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"OpenAI is unavailable (circuit breaker open), next attempt in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+class StreamInterruptedError(Exception):
+    """A streamed response failed after part of it was passed on; not retried, as that part cannot be taken back"""
+
+def is_transient(error: Exception) -> bool:
+    """Whether an error says the provider is unhealthy (and the call may succeed if repeated)"""
+    if isinstance(error, (TimeoutError, openai.APIConnectionError, StreamInterruptedError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds the response asks the client to wait (Retry-After-Ms or Retry-After), if any"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        if response.headers.get("retry-after-ms"):
+            return float(response.headers["retry-after-ms"]) / 1000
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            # An HTTP date
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+class CircuitBreaker:
+    """
+    Fails OpenAI calls fast while the provider is unhealthy
+
+    Closed: calls go through. After failure_threshold consecutive transient failures
+    (timeouts, connection errors, 5xx responses) it opens: calls raise CircuitOpenError at once for reset_seconds. Then it is half
+    open: one trial call goes through (others still fail fast); its success closes
+    the breaker, its failure opens it again, and if it is cancelled the next call is
+    the trial. Shared by the sync and async services.
+    """
+
+    def __init__(self, failure_threshold: int = OPENAI_BREAKER_FAILURES,
+                 reset_seconds: float = OPENAI_BREAKER_RESET_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a call through again"""
+        if self.state == "open":
+            return max(0.0, self._opened_at + self.reset_seconds - self.clock())
+        if self.state == "half_open" and self._trial_in_flight:
+            return 1.0
+        return 0.0
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a call may go through now; returns whether it is the half-open trial"""
+        with self._lock:
+            if self.state == "open" and self.retry_after == 0:
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self.state == "open" or (self.state == "half_open" and self._trial_in_flight):
+                self.rejected += 1
+                raise CircuitOpenError(self.retry_after)
+            if self.state == "half_open":
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def release_trial(self):
+        """The trial call ended without a verdict (cancelled); let the next call be the trial"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        """The provider answered (even with an error of the caller's making)"""
+        with self._lock:
+            if self.state != "closed":
+                print("✅ OpenAI circuit breaker closed, calls go through again")
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """An attempt failed with a transient error"""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or (self.state == "closed" and self.consecutive_failures >= self.failure_threshold):
+                self.state = "open"
+                self._opened_at = self.clock()
+                self.opened += 1
+                print(
+                    f"⚠️ OpenAI circuit breaker opened after {self.consecutive_failures} consecutive failures, "
+                    f"failing fast for {self.reset_seconds:.0f}s"
+                )
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_seconds": self.reset_seconds,
+            "retry_after_seconds": round(self.retry_after, 1),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+class OpenAIResilience:
+    """
+    Timeout, retry and circuit breaker policy for every OpenAI call
+
+    A call is given as make_call(timeout), which makes one attempt with that timeout
+    (passed on to the OpenAI client). Transient failures are retried with jittered
+    exponential backoff, or after the Retry-After the response asks for, and all but
+    rate limits are counted by the circuit breaker. Other errors (bad requests,
+    unparseable responses) are raised at once and count as the provider answering.
+    """
+
+    def __init__(self, timeouts: Optional[Dict[str, float]] = None, max_retries: int = OPENAI_MAX_RETRIES,
+                 base_delay: float = OPENAI_RETRY_BASE_DELAY, max_delay: float = OPENAI_RETRY_MAX_DELAY,
+                 breaker: Optional[CircuitBreaker] = None, rng: Optional[random.Random] = None):
+        self.timeouts = dict(OPERATION_TIMEOUTS if timeouts is None else timeouts)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker()
+        self.rng = rng or random.Random()
+        self.calls = 0
+        self.retries = 0
+        self.timeouts_hit = 0
+        self.failures = 0
+
+    def _retry_delay(self, retry: int, error: Exception) -> Optional[float]:
+        """Seconds to wait before the given retry (1 for the first), or None to give up"""
+        if retry > self.max_retries or not is_transient(error) or isinstance(error, StreamInterruptedError):
+            return None
+        requested = retry_after(error)
+        if requested is not None:
+            return requested if requested <= self.max_delay else None
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
+
+    def _failed(self, operation: str, retry: int, error: Exception) -> Optional[float]:
+        """Record a failed attempt; returns the delay before retrying it, or None if it is not retried"""
+        if isinstance(error, (TimeoutError, openai.APITimeoutError)):
+            self.timeouts_hit += 1
+        # A 429 is retried after its Retry-After, but the provider answered: it is not unhealthy
+        if is_transient(error) and not isinstance(error, openai.RateLimitError):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        delay = self._retry_delay(retry, error)
+        if delay is None:
+            self.failures += 1
+        else:
+            self.retries += 1
+            print(f"⚠️ OpenAI {operation} call failed, retry {retry} of {self.max_retries} in {delay:.1f}s: {str(error)}")
+        return delay
+
+    async def call(self, operation: str, make_call: Callable[[float], Awaitable[T]], total_timeout: bool = True) -> T:
+        """
+        Make an async call with the operation's timeout, retries and the circuit breaker
+
+        With total_timeout=False (streamed calls) the timeout only goes to the client,
+        where it bounds the wait for each piece of the response.
+        """
+        timeout = self.timeouts[operation]
+        self.calls += 1
+        retry = 0
+        while True:
+            trial = self.breaker.before_call()
+            try:
+                if total_timeout:
+                    try:
+                        result = await asyncio.wait_for(make_call(timeout), timeout)
+                    except asyncio.TimeoutError:
+                        raise TimeoutError(f"OpenAI {operation} call took longer than {timeout:g}s") from None
+                else:
+                    result = await make_call(timeout)
+            except Exception as e:
+                retry += 1
+                delay = self._failed(operation, retry, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled (the job was stopped, the client disconnected) or interrupted
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def call_sync(self, operation: str, make_call: Callable[[float], T]) -> T:
+        """call for the synchronous client; the timeout goes to the client"""
+        timeout = self.timeouts[operation]
+        self.calls += 1
+        retry = 0
+        while True:
+            trial = self.breaker.before_call()
+            try:
+                result = make_call(timeout)
+            except Exception as e:
+                retry += 1
+                delay = self._failed(operation, retry, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if trial:
+                    self.breaker.release_trial()
+                raise
+            self.breaker.record_success()
+            return result
+
+    def stats(self) -> Dict:
+        """Breaker state and call counters for /api/status/openai"""
+        return {
+            "breaker": self.breaker.stats(),
+            "timeouts": self.timeouts,
+            "max_retries": self.max_retries,
+            "calls": self.calls,
+            "retries": self.retries,
+            "timeouts_hit": self.timeouts_hit,
+            "failures": self.failures,
+        }
+
+# Shared by every OpenAI call in this worker process
+openai_resilience = OpenAIResilience()
@@ -1,90 +1,183 @@
+import asyncio
 import os
-from openai import OpenAI
-from typing import List, Dict, Optional
+import time
+import httpx
+from openai import AsyncOpenAI, OpenAI
+from typing import Callable, List, Dict, Optional, Tuple
 import json
 from dotenv import load_dotenv
+from app.services.evaluation_cache import evaluation_cache
+from app.services.openai_resilience import StreamInterruptedError, openai_resilience
+from app.services.question_cache import question_cache
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Chat model used for questions, evaluations and summaries
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+
+# Seconds to wait for a response (and to connect) before a call gives up. Calls made through
+# app.services.openai_resilience use their operation's timeout instead of OPENAI_TIMEOUT
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+
+# Topics whose questions are generated at the same time for one interview
+QUESTION_GENERATION_CONCURRENCY = int(os.getenv("QUESTION_GENERATION_CONCURRENCY", "5"))
+
+# How questions for several topics are generated: "batched" asks for all topics in one
+# request (the instructions are sent once), "per_topic" makes one request per topic
+QUESTION_GENERATION_MODE = os.getenv("QUESTION_GENERATION_MODE", "batched").lower()
+if QUESTION_GENERATION_MODE not in ("batched", "per_topic"):
+    raise ValueError(
+        f"Unknown QUESTION_GENERATION_MODE '{QUESTION_GENERATION_MODE}', expected one of: batched, per_topic"
+    )
+
+# Stream evaluation feedback and interview summaries token by token to the pages waiting
+# for them (false: they arrive in one piece when the call completes)
+FEEDBACK_STREAMING = os.getenv("FEEDBACK_STREAMING", "true").lower() == "true"
+
+# Line a streamed response writes between its text and the JSON with the structured fields
+STREAM_RESULT_MARKER = "### RESULT"
+
+def client_options(api_key: Optional[str] = None) -> Dict:
+    """Keyword arguments for OpenAI and AsyncOpenAI clients"""
+    return {
+        "api_key": api_key or os.getenv("OPENAI_API_KEY"),
+        "timeout": httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+        # Retries are made by app.services.openai_resilience, which also honours Retry-After
+        "max_retries": 0,
+    }
+
+# Initialize OpenAI clients
+# The synchronous client serves scripts (demo_ai_interview.py); request handlers use
+# the async client so a worker keeps serving other requests while a call is in flight
+client = OpenAI(**client_options())
+async_client = AsyncOpenAI(**client_options())
+
+def _create_sync(operation: str, request: Dict):
+    """client.chat.completions.create with the operation's timeout, retries and circuit breaker"""
+    return openai_resilience.call_sync(
+        operation,
+        lambda timeout: client.chat.completions.create(**request, timeout=httpx.Timeout(timeout, connect=OPENAI_CONNECT_TIMEOUT))
+    )
+
+async def _create(operation: str, request: Dict):
+    """async_client.chat.completions.create with the operation's timeout, retries and circuit breaker"""
+    return await openai_resilience.call(
+        operation,
+        lambda timeout: async_client.chat.completions.create(**request, timeout=httpx.Timeout(timeout, connect=OPENAI_CONNECT_TIMEOUT))
+    )
+
+def _questions_request(topic: str, difficulty: str, count: int) -> Dict:
+    prompt = f"""Generate {count} technical interview question(s) about {topic} at {difficulty} level.
 
-class OpenAIService:
-    @staticmethod
-    def generate_interview_questions(topic: str, difficulty: str, count: int = 1) -> List[Dict]:
-        """
-        Generate interview questions based on topic and difficulty using OpenAI
-        
-        Args:
-            topic (str): The topic for which questions should be generated
-            difficulty (str): The difficulty level (Beginner, Intermediate, Advanced)
-            count (int): Number of questions to generate
-            
-        Returns:
-            List[Dict]: List of dictionaries with question_text and expected_answer
-        """
-        prompt = f"""Generate {count} technical interview question(s) about {topic} at {difficulty} level.
-        
 For each question, provide:
 1. A detailed, challenging question that tests deep understanding
 2. An expected answer with key points that should be covered in a good response
 
 Format the response as a JSON array with objects containing 'question_text' and 'expected_answer'.
 """
+    return {
+        "model": OPENAI_MODEL,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": "You are an expert technical interviewer specializing in generating precise, challenging questions."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+    }
 
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer specializing in generating precise, challenging questions."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7
-            )
-            
-            # Parse the response content
-            content = response.choices[0].message.content
-            result = json.loads(content)
-            
-            # Ensure we have the expected structure
-            if "questions" in result:
-                return result["questions"]
-            else:
-                # Try to adapt to different response formats
-                if isinstance(result, list):
-                    return result
-                else:
-                    # Create a standard format from whatever we received
-                    return [{"question_text": "Default question about " + topic, 
-                             "expected_answer": "Please provide a detailed answer."}]
-        
-        except Exception as e:
-            print(f"Error generating questions: {str(e)}")
-            # Return a fallback question
-            return [{"question_text": f"Tell me about your experience with {topic}?", 
-                     "expected_answer": f"The candidate should demonstrate knowledge of {topic}."}]
+def _parse_questions(response, topic: str) -> List[Dict]:
+    # Parse the response content
+    content = response.choices[0].message.content
+    result = json.loads(content)
 
-    @staticmethod
-    def evaluate_answer(question: str, candidate_answer: str, expected_answer: Optional[str], 
-                       topic: str, difficulty: str) -> Dict:
-        """
-        Evaluate a candidate's answer using OpenAI
-        
-        Args:
-            question (str): The original question
-            candidate_answer (str): The candidate's answer
-            expected_answer (Optional[str]): The expected answer or reference points
-            topic (str): The topic of the question
-            difficulty (str): The difficulty level
-            
-        Returns:
-            Dict: Evaluation results with score, feedback, strengths, and areas_for_improvement
-        """
-        expected_answer_text = expected_answer if expected_answer else "No specific expected answer provided."
-        
-        prompt = f"""Evaluate this technical interview response:
+    # Ensure we have the expected structure
+    if "questions" in result:
+        return result["questions"]
+    else:
+        # Try to adapt to different response formats
+        if isinstance(result, list):
+            return result
+        else:
+            # Create a standard format from whatever we received
+            return [{"question_text": "Default question about " + topic,
+                     "expected_answer": "Please provide a detailed answer."}]
+
+def _fallback_questions(topic: str, error: Exception) -> List[Dict]:
+    print(f"Error generating questions: {str(error)}")
+    # Return a fallback question
+    return [{"question_text": f"Tell me about your experience with {topic}?",
+             "expected_answer": f"The candidate should demonstrate knowledge of {topic}."}]
+
+def _cacheable(questions) -> bool:
+    """Only well-formed question sets are stored in the question cache"""
+    return isinstance(questions, list) and len(questions) > 0 and all(_valid_question(q) for q in questions)
+
+def _batch_questions_request(specs: List[Tuple[str, str]], count: int) -> Dict:
+    listing = "\n".join(f"{i}. {topic} ({difficulty} level)" for i, (topic, difficulty) in enumerate(specs, 1))
+    prompt = f"""Generate {count} technical interview question(s) for each of these topics:
+{listing}
+
+For each question, provide:
+1. A detailed, challenging question that tests deep understanding
+2. An expected answer with key points that should be covered in a good response
+
+Format the response as a JSON object with a 'topics' array holding one entry per topic, in the order listed.
+Each entry has 'id' (the topic's number above), 'topic' and 'questions', an array of objects containing 'question_text' and 'expected_answer'.
+"""
+    return {
+        "model": OPENAI_MODEL,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": "You are an expert technical interviewer specializing in generating precise, challenging questions."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.7,
+    }
+
+def _valid_question(question) -> bool:
+    return (
+        isinstance(question, dict)
+        and isinstance(question.get("question_text"), str) and question["question_text"].strip() != ""
+        and isinstance(question.get("expected_answer", ""), str)
+    )
+
+def _parse_batch_questions(response, size: int, count: int) -> List[Optional[List[Dict]]]:
+    """
+    Split a batched response into questions per requested topic
+
+    Entries are matched by their id, not their position. A topic whose entry is
+    missing, duplicated or has no valid question gets None, and so does every topic
+    when the response is not the expected JSON object.
+    """
+    try:
+        result = json.loads(response.choices[0].message.content)
+    except (TypeError, ValueError):
+        return [None] * size
+    entries = result.get("topics") if isinstance(result, dict) else None
+    if not isinstance(entries, list):
+        return [None] * size
+
+    parsed: List[Optional[List[Dict]]] = [None] * size
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("questions"), list):
+            continue
+        index = entry.get("id")
+        if not isinstance(index, int) or not 1 <= index <= size or parsed[index - 1] is not None:
+            continue
+        questions = [
+            {"question_text": question["question_text"], "expected_answer": question.get("expected_answer", "")}
+            for question in entry["questions"] if _valid_question(question)
+        ]
+        parsed[index - 1] = questions[:count] or None
+    return parsed
+
+def _evaluation_request(question: str, candidate_answer: str, expected_answer: Optional[str],
+                        topic: str, difficulty: str, stream: bool = False) -> Dict:
+    expected_answer_text = expected_answer if expected_answer else "No specific expected answer provided."
+
+    prompt = f"""Evaluate this technical interview response:
 
 Question: {question}
 Topic: {topic}
@@ -104,68 +197,66 @@ Provide:
 3. Key strengths (bullet points)
 4. Areas for improvement (bullet points)
 
-Format your response as a JSON object with keys: 'score', 'feedback', 'strengths', and 'areas_for_improvement'.
 """
+    if stream:
+        prompt += f"""Write the detailed feedback first, as plain text. Then write a line containing only {STREAM_RESULT_MARKER}
+followed by a JSON object with keys: 'score', 'strengths', and 'areas_for_improvement'.
+"""
+    else:
+        prompt += """Format your response as a JSON object with keys: 'score', 'feedback', 'strengths', and 'areas_for_improvement'.
+"""
+    request = {
+        "model": OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": "You are an expert technical interviewer with years of experience evaluating candidates."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.3,
+    }
+    if stream:
+        request["stream"] = True
+    else:
+        request["response_format"] = {"type": "json_object"}
+    return request
 
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer with years of experience evaluating candidates."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            
-            # Parse the response content
-            content = response.choices[0].message.content
-            result = json.loads(content)
-            
-            # Ensure we have the expected structure with default values if needed
-            return {
-                "score": result.get("score", 50),
-                "feedback": result.get("feedback", "Evaluation completed."),
-                "strengths": result.get("strengths", []),
-                "areas_for_improvement": result.get("areas_for_improvement", [])
-            }
-        
-        except Exception as e:
-            print(f"Error evaluating answer: {str(e)}")
-            # Return a fallback evaluation
-            return {
-                "score": 50,
-                "feedback": "Unable to provide detailed feedback at this time.",
-                "strengths": ["Answer was submitted successfully"],
-                "areas_for_improvement": ["Try to provide more detailed responses"]
-            }
+def _parse_evaluation(response) -> Dict:
+    # Parse the response content
+    content = response.choices[0].message.content
+    return _evaluation_result(json.loads(content))
 
-    @staticmethod
-    def summarize_interview(evaluations: List[Dict], topics: List[str], difficulty: str) -> Dict:
-        """
-        Generate an overall interview summary based on all question evaluations
-        
-        Args:
-            evaluations (List[Dict]): List of evaluations with scores and feedback
-            topics (List[str]): List of topics covered
-            difficulty (str): The difficulty level of the interview
-            
-        Returns:
-            Dict: Summary with overall_score, summary text, strengths, and areas_for_improvement
-        """
-        # Create a detailed summary of all evaluations for the prompt
-        evaluation_summaries = []
-        for i, eval_data in enumerate(evaluations):
-            evaluation_summaries.append(f"""
+def _evaluation_result(result: Dict) -> Dict:
+    # Ensure we have the expected structure with default values if needed
+    return {
+        "score": result.get("score", 50),
+        "feedback": result.get("feedback", "Evaluation completed."),
+        "strengths": result.get("strengths", []),
+        "areas_for_improvement": result.get("areas_for_improvement", [])
+    }
+
+def _fallback_evaluation(error: Exception) -> Dict:
+    print(f"Error evaluating answer: {str(error)}")
+    # Return a fallback evaluation
+    return {
+        "score": 50,
+        "feedback": "Unable to provide detailed feedback at this time.",
+        "strengths": ["Answer was submitted successfully"],
+        "areas_for_improvement": ["Try to provide more detailed responses"]
+    }
+
+def _summary_request(evaluations: List[Dict], topics: List[str], difficulty: str, stream: bool = False) -> Dict:
+    # Create a detailed summary of all evaluations for the prompt
+    evaluation_summaries = []
+    for i, eval_data in enumerate(evaluations):
+        evaluation_summaries.append(f"""
 Question {i+1}: {eval_data.get('question', 'Unknown question')}
 Score: {eval_data.get('score', 0)}/100
 Strengths: {', '.join(eval_data.get('strengths', []))}
 Areas for improvement: {', '.join(eval_data.get('areas_for_improvement', []))}
 """)
-        
-        all_evaluations = '\n'.join(evaluation_summaries)
-        
-        prompt = f"""Summarize this technical interview:
+
+    all_evaluations = '\n'.join(evaluation_summaries)
+
+    prompt = f"""Summarize this technical interview:
 
 Topics covered: {', '.join(topics)}
 Difficulty level: {difficulty}
@@ -180,50 +271,357 @@ Provide:
 4. Areas for improvement (bullet points)
 5. Topic-specific scores (one score per topic)
 
-Format your response as a JSON object with keys: 'overall_score', 'summary', 'strengths', 'areas_for_improvement', and 'topic_scores'.
-The 'topic_scores' should be a dictionary with topics as keys and scores (0-100) as values.
 """
+    if stream:
+        prompt += f"""Write the comprehensive summary first, as plain text. Then write a line containing only {STREAM_RESULT_MARKER}
+followed by a JSON object with keys: 'overall_score', 'strengths', 'areas_for_improvement', and 'topic_scores'.
+"""
+    else:
+        prompt += """Format your response as a JSON object with keys: 'overall_score', 'summary', 'strengths', 'areas_for_improvement', and 'topic_scores'.
+"""
+    prompt += """The 'topic_scores' should be a dictionary with topics as keys and scores (0-100) as values.
+"""
+    request = {
+        "model": OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": "You are an expert technical interviewer responsible for providing comprehensive interview summaries."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.5,
+    }
+    if stream:
+        request["stream"] = True
+    else:
+        request["response_format"] = {"type": "json_object"}
+    return request
+
+def _parse_summary(response, evaluations: List[Dict], topics: List[str]) -> Dict:
+    # Parse the response content
+    content = response.choices[0].message.content
+    return _summary_result(json.loads(content), evaluations, topics)
+
+def _summary_result(result: Dict, evaluations: List[Dict], topics: List[str]) -> Dict:
+    # Calculate average score if not provided in the response
+    if "overall_score" not in result:
+        scores = [eval_data.get("score", 0) for eval_data in evaluations if "score" in eval_data]
+        overall_score = sum(scores) / len(scores) if scores else 50
+        result["overall_score"] = overall_score
+
+    # Ensure we have topic scores
+    if "topic_scores" not in result:
+        result["topic_scores"] = {topic: 50 for topic in topics}
+
+    return {
+        "overall_score": result.get("overall_score", 50),
+        "summary": result.get("summary", "Interview completed."),
+        "strengths": result.get("strengths", []),
+        "areas_for_improvement": result.get("areas_for_improvement", []),
+        "topic_scores": result.get("topic_scores", {})
+    }
+
+def _fallback_summary(topics: List[str], error: Exception) -> Dict:
+    print(f"Error generating interview summary: {str(error)}")
+    # Return a fallback summary
+    return {
+        "overall_score": 50,
+        "summary": "Interview completed with mixed results.",
+        "strengths": ["Successfully completed the interview"],
+        "areas_for_improvement": ["Continue practicing technical concepts"],
+        "topic_scores": {topic: 50 for topic in topics}
+    }
 
+async def _stream_completion(operation: str, request: Dict, on_token: Callable[[str], None]) -> Tuple[str, Dict]:
+    """
+    Make a streaming request, passing its text to on_token as it arrives
+
+    Returns the text before STREAM_RESULT_MARKER and the JSON object after it. The
+    end of the text is held back until it cannot be the start of the marker, so
+    on_token never sees any of the marker or the JSON. A stream that fails before
+    any text was passed on is retried; one that fails later is not.
+    """
+    async def attempt(timeout: float) -> Tuple[str, Dict]:
+        stream = await async_client.chat.completions.create(
+            **request, timeout=httpx.Timeout(timeout, connect=OPENAI_CONNECT_TIMEOUT)
+        )
+        content, sent, marker_at = "", 0, -1
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": "You are an expert technical interviewer responsible for providing comprehensive interview summaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5
-            )
-            
-            # Parse the response content
-            content = response.choices[0].message.content
-            result = json.loads(content)
-            
-            # Calculate average score if not provided in the response
-            if "overall_score" not in result:
-                scores = [eval_data.get("score", 0) for eval_data in evaluations if "score" in eval_data]
-                overall_score = sum(scores) / len(scores) if scores else 50
-                result["overall_score"] = overall_score
-                
-            # Ensure we have topic scores
-            if "topic_scores" not in result:
-                result["topic_scores"] = {topic: 50 for topic in topics}
-                
-            return {
-                "overall_score": result.get("overall_score", 50),
-                "summary": result.get("summary", "Interview completed."),
-                "strengths": result.get("strengths", []),
-                "areas_for_improvement": result.get("areas_for_improvement", []),
-                "topic_scores": result.get("topic_scores", {})
-            }
-        
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                content += chunk.choices[0].delta.content
+                if marker_at >= 0:
+                    continue
+                marker_at = content.find(STREAM_RESULT_MARKER, sent)
+                end = marker_at if marker_at >= 0 else len(content) - len(STREAM_RESULT_MARKER) + 1
+                if end > sent:
+                    on_token(content[sent:end])
+                    sent = end
+        except Exception as e:
+            if sent:
+                raise StreamInterruptedError(f"Stream interrupted: {str(e)}") from e
+            raise
+
+        if marker_at < 0:
+            raise ValueError("Streamed response has no result block")
+        # The model may wrap the JSON in a code fence
+        block = content[marker_at + len(STREAM_RESULT_MARKER):]
+        result = json.loads(block[block.index("{"):block.rindex("}") + 1])
+        return content[:marker_at].strip(), result
+
+    # The timeout bounds the wait for each chunk, so a long answer that keeps coming is not cut off
+    return await openai_resilience.call(operation, attempt, total_timeout=False)
+
+class OpenAIService:
+    @staticmethod
+    def generate_interview_questions(topic: str, difficulty: str, count: int = 1) -> List[Dict]:
+        """
+        Generate interview questions based on topic and difficulty using OpenAI
+
+        Args:
+            topic (str): The topic for which questions should be generated
+            difficulty (str): The difficulty level (Beginner, Intermediate, Advanced)
+            count (int): Number of questions to generate
+
+        Returns:
+            List[Dict]: List of dictionaries with question_text and expected_answer
+        """
+        request = _questions_request(topic, difficulty, count)
+        cached = question_cache.get_sync(request)
+        if cached:
+            return cached
+        try:
+            start_time = time.perf_counter()
+            response = _create_sync("questions", request)
+            questions = _parse_questions(response, topic)
+        except Exception as e:
+            return _fallback_questions(topic, e)
+        if _cacheable(questions):
+            question_cache.put_sync(request, questions, time.perf_counter() - start_time)
+        return questions
+
+    @staticmethod
+    def evaluate_answer(question: str, candidate_answer: str, expected_answer: Optional[str],
+                       topic: str, difficulty: str) -> Dict:
+        """
+        Evaluate a candidate's answer using OpenAI
+
+        Args:
+            question (str): The original question
+            candidate_answer (str): The candidate's answer
+            expected_answer (Optional[str]): The expected answer or reference points
+            topic (str): The topic of the question
+            difficulty (str): The difficulty level
+
+        Returns:
+            Dict: Evaluation results with score, feedback, strengths, and areas_for_improvement
+        """
+        request = _evaluation_request(question, candidate_answer, expected_answer, topic, difficulty)
+
+        def evaluate() -> Dict:
+            return _parse_evaluation(_create_sync("evaluation", request))
+
+        try:
+            # Identical submissions get the stored evaluation (see app.services.evaluation_cache)
+            return evaluation_cache.get_or_evaluate_sync(request, evaluate)
+        except Exception as e:
+            return _fallback_evaluation(e)
+
+    @staticmethod
+    def summarize_interview(evaluations: List[Dict], topics: List[str], difficulty: str) -> Dict:
+        """
+        Generate an overall interview summary based on all question evaluations
+
+        Args:
+            evaluations (List[Dict]): List of evaluations with scores and feedback
+            topics (List[str]): List of topics covered
+            difficulty (str): The difficulty level of the interview
+
+        Returns:
+            Dict: Summary with overall_score, summary text, strengths, and areas_for_improvement
+        """
+        try:
+            response = _create_sync("summary", _summary_request(evaluations, topics, difficulty))
+            return _parse_summary(response, evaluations, topics)
         except Exception as e:
-            print(f"Error generating interview summary: {str(e)}")
-            # Return a fallback summary
-            return {
-                "overall_score": 50,
-                "summary": "Interview completed with mixed results.",
-                "strengths": ["Successfully completed the interview"],
-                "areas_for_improvement": ["Continue practicing technical concepts"],
-                "topic_scores": {topic: 50 for topic in topics}
-            }
+            return _fallback_summary(topics, e)
+
+class AsyncOpenAIService:
+    """
+    OpenAIService for async request handlers, built on AsyncOpenAI
+
+    Same prompts, results and fallbacks as OpenAIService. While a call waits for OpenAI
+    the event loop serves other requests, so one worker can have many evaluations in
+    flight. Calls get their operation's timeout and retries, and fail fast while the
+    circuit breaker is open (see app.services.openai_resilience); then the fallback
+    result is returned.
+    """
+
+    @staticmethod
+    async def generate_interview_questions(topic: str, difficulty: str, count: int = 1) -> List[Dict]:
+        """See OpenAIService.generate_interview_questions"""
+        request = _questions_request(topic, difficulty, count)
+        cached = (await question_cache.get_many([request]))[0]
+        if cached:
+            return cached
+        try:
+            start_time = time.perf_counter()
+            response = await _create("questions", request)
+            questions = _parse_questions(response, topic)
+        except Exception as e:
+            return _fallback_questions(topic, e)
+        if _cacheable(questions):
+            await question_cache.put_many([(request, questions, time.perf_counter() - start_time)])
+        return questions
+
+    @staticmethod
+    async def generate_questions_for_topics(
+        topics: List[str], difficulty: str, count: int = 1,
+        concurrency: Optional[int] = None, batched: Optional[bool] = None
+    ) -> List[Optional[List[Dict]]]:
+        """
+        Generate questions for several topics
+
+        Topics with a cached question set (see app.services.question_cache) are served
+        from the cache. Batched mode asks for every other topic in one request and
+        validates the response per topic. Topics the batched response does not cover
+        properly (or all of them, if it is malformed or the call fails) are retried with
+        one concurrent request per topic. Unlike generate_interview_questions, a topic
+        whose calls fail gets no fallback question, so callers can keep the topics that
+        succeeded. Newly generated sets are stored in the cache.
+
+        Args:
+            topics (List[str]): Topic names
+            difficulty (str): The difficulty level
+            count (int): Questions per topic
+            concurrency (int): Most per-topic calls in flight at once (defaults to QUESTION_GENERATION_CONCURRENCY)
+            batched (bool): Try one batched request first (defaults to QUESTION_GENERATION_MODE)
+
+        Returns:
+            List[Optional[List[Dict]]]: Questions per topic, in the order given; None where generation failed
+        """
+        if batched is None:
+            batched = QUESTION_GENERATION_MODE == "batched"
+
+        # Cached sets first; only the remaining topics are sent to OpenAI
+        requests = [_questions_request(topic, difficulty, count) for topic in topics]
+        results = await question_cache.get_many(requests)
+        generation_seconds: Dict[int, float] = {}
+        pending = [index for index, questions in enumerate(results) if questions is None]
+
+        if batched and len(pending) > 1:
+            try:
+                start_time = time.perf_counter()
+                response = await _create(
+                    "batch_questions", _batch_questions_request([(topics[index], difficulty) for index in pending], count)
+                )
+                # Each topic is credited an equal share of the call as its generation time
+                elapsed = (time.perf_counter() - start_time) / len(pending)
+                for index, questions in zip(pending, _parse_batch_questions(response, len(pending), count)):
+                    if questions is not None:
+                        results[index] = questions
+                        generation_seconds[index] = elapsed
+            except Exception as e:
+                print(f"Error generating batched questions: {str(e)}")
+            pending = [index for index in pending if results[index] is None]
+            if pending:
+                print(f"Batched response incomplete, generating one by one for: {', '.join(topics[index] for index in pending)}")
+
+        semaphore = asyncio.Semaphore(concurrency or QUESTION_GENERATION_CONCURRENCY)
+
+        async def generate(index: int) -> Optional[List[Dict]]:
+            async with semaphore:
+                try:
+                    start_time = time.perf_counter()
+                    response = await _create("questions", requests[index])
+                    questions = _parse_questions(response, topics[index])
+                except Exception as e:
+                    print(f"Error generating questions for {topics[index]}: {str(e)}")
+                    return None
+                generation_seconds[index] = time.perf_counter() - start_time
+                return questions or None
+
+        for index, questions in zip(pending, await asyncio.gather(*(generate(index) for index in pending))):
+            results[index] = questions
+
+        await question_cache.put_many([
+            (requests[index], results[index], seconds)
+            for index, seconds in generation_seconds.items() if _cacheable(results[index])
+        ])
+        return results
+
+    @staticmethod
+    async def evaluate_answer(question: str, candidate_answer: str, expected_answer: Optional[str],
+                              topic: str, difficulty: str, fallback: bool = True,
+                              on_token: Optional[Callable[[str], None]] = None) -> Dict:
+        """
+        See OpenAIService.evaluate_answer
+
+        With fallback=False a failed call raises instead of returning the fallback
+        evaluation, so a background job can retry it. With on_token (and
+        FEEDBACK_STREAMING on) the feedback text is passed to it as the model writes it.
+        """
+        stream = on_token is not None and FEEDBACK_STREAMING
+        request = _evaluation_request(question, candidate_answer, expected_answer, topic, difficulty, stream=stream)
+
+        async def evaluate() -> Dict:
+            if stream:
+                feedback, result = await _stream_completion("evaluation", request, on_token)
+                if feedback:
+                    result["feedback"] = feedback
+                return _evaluation_result(result)
+            return _parse_evaluation(await _create("evaluation", request))
+
+        try:
+            return await evaluation_cache.get_or_evaluate(request, evaluate)
+        except Exception as e:
+            if not fallback:
+                raise
+            return _fallback_evaluation(e)
+
+    @staticmethod
+    async def summarize_interview(evaluations: List[Dict], topics: List[str], difficulty: str,
+                                  fallback: bool = True, on_token: Optional[Callable[[str], None]] = None) -> Dict:
+        """
+        See OpenAIService.summarize_interview; with fallback=False a failed call raises
+
+        With on_token (and FEEDBACK_STREAMING on) the summary text is passed to it as
+        the model writes it.
+        """
+        try:
+            if on_token is not None and FEEDBACK_STREAMING:
+                summary, result = await _stream_completion(
+                    "summary", _summary_request(evaluations, topics, difficulty, stream=True), on_token
+                )
+                if summary:
+                    result["summary"] = summary
+                return _summary_result(result, evaluations, topics)
+            response = await _create("summary", _summary_request(evaluations, topics, difficulty))
+            return _parse_summary(response, evaluations, topics)
+        except Exception as e:
+            if not fallback:
+                raise
+            return _fallback_summary(topics, e)
+
+    @staticmethod
+    async def check_connection(api_key: str, model: str = "gpt-3.5-turbo") -> float:
+        """
+        Make a minimal request with the given key; raises on failure
+
+        Goes through the circuit breaker like every other call, so it fails fast
+        while the breaker is open.
+
+        Returns:
+            float: Round-trip latency in seconds
+        """
+        start_time = time.time()
+        async with AsyncOpenAI(**client_options(api_key)) as key_client:
+            await openai_resilience.call(
+                "connection_check",
+                lambda timeout: key_client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": "Hello"}],
+                    max_tokens=5,
+                    timeout=httpx.Timeout(timeout, connect=OPENAI_CONNECT_TIMEOUT)
+                )
+            )
+        return time.time() - start_time
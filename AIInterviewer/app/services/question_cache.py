@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.database.database import AsyncSessionLocal, SessionLocal
+from app.models.models import CachedQuestionSet
+
+# Seconds a generated question set is served before it is generated again (0 disables the cache)
+QUESTION_CACHE_TTL = float(os.getenv("QUESTION_CACHE_TTL", "604800"))
+
+# Most bytes of question JSON kept; the least recently used sets are evicted first
+QUESTION_CACHE_MAX_BYTES = int(os.getenv("QUESTION_CACHE_MAX_BYTES", str(20 * 1024 * 1024)))
+
+# Share of cache hits that draw a new set from the API instead (0 always serves the
+# cached set, 1 always generates), so candidates do not all see the same questions
+QUESTION_CACHE_FRESHNESS = float(os.getenv("QUESTION_CACHE_FRESHNESS", "0.2"))
+if not 0 <= QUESTION_CACHE_FRESHNESS <= 1:
+    raise ValueError(f"QUESTION_CACHE_FRESHNESS must be between 0 and 1, got {QUESTION_CACHE_FRESHNESS}")
+
+def prompt_key(request: Dict) -> str:
+    """
+    Cache key for a chat completion request: a hash of its model, temperature,
+    response format and messages, with whitespace collapsed and case folded
+    """
+    messages = [
+        {"role": message["role"], "content": " ".join(message["content"].split()).casefold()}
+        for message in request["messages"]
+    ]
+    payload = json.dumps(
+        [request["model"], request.get("temperature"), request.get("response_format"), messages], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class QuestionSetCache:
+    """
+    Persistent cache of generated question sets, shared by every worker through the database
+
+    Interviews are created on the same few (topic, difficulty) pairs over and over, so
+    the question sets OpenAI generates for them are stored in question_set_cache and
+    served again until they are QUESTION_CACHE_TTL seconds old. Total size is bounded by
+    QUESTION_CACHE_MAX_BYTES with least recently used eviction. A QUESTION_CACHE_FRESHNESS
+    share of hits is treated as a miss and replaced with a newly generated set.
+
+    Cache failures are printed and treated as misses; question generation never fails
+    because of the cache. Hit, miss and saved latency counters are per worker process.
+    """
+
+    def __init__(self, ttl: float = QUESTION_CACHE_TTL, max_bytes: int = QUESTION_CACHE_MAX_BYTES,
+                 freshness: float = QUESTION_CACHE_FRESHNESS, session_factory=AsyncSessionLocal,
+                 sync_session_factory=SessionLocal, rng: Optional[random.Random] = None):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.freshness = freshness
+        self.session_factory = session_factory
+        self.sync_session_factory = sync_session_factory
+        self.rng = rng or random.Random()
+        self.hits = 0
+        self.misses = 0
+        self.fresh_draws = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    def _get_many(self, db: Session, keys: List[str]) -> List[Optional[List[Dict]]]:
+        now = datetime.now()
+        rows = {
+            row.cache_key: row for row in db.execute(
+                select(
+                    CachedQuestionSet.id, CachedQuestionSet.cache_key, CachedQuestionSet.questions,
+                    CachedQuestionSet.generation_seconds, CachedQuestionSet.created_at
+                ).where(CachedQuestionSet.cache_key.in_(set(keys)))
+            )
+        }
+
+        results: List[Optional[List[Dict]]] = []
+        used_ids = []
+        for key in keys:
+            row = rows.get(key)
+            if row is None or row.created_at < now - timedelta(seconds=self.ttl):
+                self.misses += 1
+                results.append(None)
+            elif self.freshness and self.rng.random() < self.freshness:
+                self.fresh_draws += 1
+                results.append(None)
+            else:
+                self.hits += 1
+                self.saved_seconds += row.generation_seconds
+                used_ids.append(row.id)
+                results.append(json.loads(row.questions))
+
+        for row_id in used_ids:
+            db.execute(
+                update(CachedQuestionSet).where(CachedQuestionSet.id == row_id)
+                .values(hits=CachedQuestionSet.hits + 1, last_used_at=now)
+            )
+        db.commit()
+        return results
+
+    def _put_many(self, db: Session, entries: Sequence[Tuple[Dict, List[Dict], float]]):
+        now = datetime.now()
+        latest = {prompt_key(request): (request, questions, seconds) for request, questions, seconds in entries}
+        for key, (request, questions, seconds) in latest.items():
+            payload = json.dumps(questions)
+            db.execute(delete(CachedQuestionSet).where(CachedQuestionSet.cache_key == key))
+            db.add(CachedQuestionSet(
+                cache_key=key, model=request["model"], temperature=request.get("temperature"),
+                questions=payload, size_bytes=len(payload.encode("utf-8")),
+                generation_seconds=seconds, created_at=now, last_used_at=now
+            ))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same prompt at the same time; keep its set
+            db.rollback()
+            return
+        self.stores += len(latest)
+        self._evict(db, now)
+
+    def _evict(self, db: Session, now: datetime):
+        """Drop expired sets, then the least recently used ones until the cache fits max_bytes"""
+        expired = db.execute(
+            delete(CachedQuestionSet).where(CachedQuestionSet.created_at < now - timedelta(seconds=self.ttl))
+        ).rowcount
+        total = db.scalar(select(func.coalesce(func.sum(CachedQuestionSet.size_bytes), 0)))
+        victims = []
+        if total > self.max_bytes:
+            for row_id, size_bytes in db.execute(
+                select(CachedQuestionSet.id, CachedQuestionSet.size_bytes)
+                .order_by(CachedQuestionSet.last_used_at, CachedQuestionSet.id)
+            ):
+                if total <= self.max_bytes:
+                    break
+                victims.append(row_id)
+                total -= size_bytes
+            db.execute(delete(CachedQuestionSet).where(CachedQuestionSet.id.in_(victims)))
+        db.commit()
+        self.evictions += max(expired, 0) + len(victims)
+
+    def _stats(self, db: Session) -> Dict:
+        entries, size_bytes = db.execute(
+            select(func.count(CachedQuestionSet.id), func.coalesce(func.sum(CachedQuestionSet.size_bytes), 0))
+        ).one()
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "freshness": self.freshness,
+            "entries": entries,
+            "bytes": size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fresh_draws": self.fresh_draws,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "saved_seconds": round(self.saved_seconds, 2),
+        }
+
+    async def get_many(self, requests: List[Dict]) -> List[Optional[List[Dict]]]:
+        """The cached question set for each chat completion request, or None where a new one must be generated"""
+        if not self.enabled or not requests:
+            return [None] * len(requests)
+        try:
+            async with self.session_factory() as db:
+                return await db.run_sync(self._get_many, [prompt_key(request) for request in requests])
+        except Exception as e:
+            print(f"Question cache lookup failed: {str(e)}")
+            return [None] * len(requests)
+
+    async def put_many(self, entries: Sequence[Tuple[Dict, List[Dict], float]]):
+        """Store (request, questions, generation seconds) entries, replacing older sets for the same prompts"""
+        if not self.enabled or not entries:
+            return
+        try:
+            async with self.session_factory() as db:
+                await db.run_sync(self._put_many, entries)
+        except Exception as e:
+            print(f"Question cache store failed: {str(e)}")
+
+    async def stats(self) -> Dict:
+        """Entries, bytes stored, hit/miss counters and API time saved, for the status page"""
+        async with self.session_factory() as db:
+            return await db.run_sync(self._stats)
+
+    def get_sync(self, request: Dict) -> Optional[List[Dict]]:
+        """get_many for one request, for the synchronous OpenAIService"""
+        if not self.enabled:
+            return None
+        try:
+            with self.sync_session_factory() as db:
+                return self._get_many(db, [prompt_key(request)])[0]
+        except Exception as e:
+            print(f"Question cache lookup failed: {str(e)}")
+            return None
+
+    def put_sync(self, request: Dict, questions: List[Dict], seconds: float):
+        """put_many for one request, for the synchronous OpenAIService"""
+        if not self.enabled:
+            return
+        try:
+            with self.sync_session_factory() as db:
+                self._put_many(db, [(request, questions, seconds)])
+        except Exception as e:
+            print(f"Question cache store failed: {str(e)}")
+
+# Shared by every request in this worker process
+question_cache = QuestionSetCache()
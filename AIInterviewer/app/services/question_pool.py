@@ -0,0 +1,113 @@
+import asyncio
+import os
+import random
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import QuestionBank
+
+# Seconds before the index is rebuilt to pick up bank changes made by other processes
+QUESTION_POOL_TTL = float(os.getenv("QUESTION_POOL_TTL", "300"))
+
+class QuestionPool:
+    """
+    Process-level index of question bank IDs keyed by (topic_id, difficulty_id)
+
+    The index holds integers only, so it stays small even for a very large bank.
+    Sampling picks k positions across the matching buckets in O(k) and only the
+    chosen QuestionBank rows are loaded from the database.
+    """
+
+    def __init__(self, ttl: float = QUESTION_POOL_TTL):
+        self.ttl = ttl
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Force a reload on next use; call after question bank rows are added or removed"""
+        self._expires_at = 0.0
+
+    async def _ensure_loaded(self, db: AsyncSession):
+        if time.monotonic() < self._expires_at:
+            return
+        async with self._lock:
+            # Another request may have reloaded while we waited for the lock
+            if time.monotonic() < self._expires_at:
+                return
+            buckets: Dict[Tuple[int, int], List[int]] = {}
+            rows = await db.execute(
+                select(QuestionBank.id, QuestionBank.topic_id, QuestionBank.difficulty_id)
+            )
+            for question_id, topic_id, difficulty_id in rows:
+                buckets.setdefault((topic_id, difficulty_id), []).append(question_id)
+            self._buckets = buckets
+            self._expires_at = time.monotonic() + self.ttl
+
+    async def sample_ids(
+        self,
+        db: AsyncSession,
+        topic_ids: Iterable[int],
+        difficulty_id: int,
+        k: int,
+        rng: Optional[random.Random] = None
+    ) -> List[int]:
+        """
+        Up to k distinct question IDs drawn uniformly from the given topics at one difficulty
+
+        Args:
+            db (AsyncSession): Session used only when the index needs (re)loading
+            topic_ids: Topics to draw from
+            difficulty_id (int): Difficulty to draw from
+            k (int): Number of IDs wanted
+            rng (random.Random): Optional random source
+
+        Returns:
+            List[int]: Sampled IDs in random order (all of them if fewer than k exist)
+        """
+        await self._ensure_loaded(db)
+        rng = rng or random
+        buckets = [self._buckets.get((topic_id, difficulty_id), []) for topic_id in dict.fromkeys(topic_ids)]
+        buckets = [bucket for bucket in buckets if bucket]
+        if not buckets or k <= 0:
+            return []
+
+        # Sample positions in the virtual concatenation of the buckets without building it
+        ends = list(accumulate(len(bucket) for bucket in buckets))
+        positions = rng.sample(range(ends[-1]), min(k, ends[-1]))
+        sampled = []
+        for position in positions:
+            index = bisect_right(ends, position)
+            start = ends[index - 1] if index else 0
+            sampled.append(buckets[index][position - start])
+        return sampled
+
+    async def sample_questions(
+        self,
+        db: AsyncSession,
+        topic_ids: Iterable[int],
+        difficulty_id: int,
+        k: int,
+        rng: Optional[random.Random] = None
+    ) -> List[QuestionBank]:
+        """Sample IDs, then load just those QuestionBank rows in sampled order"""
+        return await self.load(db, await self.sample_ids(db, topic_ids, difficulty_id, k, rng))
+
+    async def load(self, db: AsyncSession, ids: List[int]) -> List[QuestionBank]:
+        """Load the given QuestionBank rows in one query, keeping the order of ids"""
+        if not ids:
+            return []
+        rows = {
+            question.id: question
+            for question in (await db.scalars(select(QuestionBank).where(QuestionBank.id.in_(ids)))).all()
+        }
+        if len(rows) < len(ids):
+            # A question was deleted since the index was built
+            self.invalidate()
+        return [rows[question_id] for question_id in ids if question_id in rows]
+
+# Shared by every request in this worker process
+question_pool = QuestionPool()
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Topic, Difficulty, Timing
+
+# Seconds a cached table is served before it is reloaded, so other workers pick up admin changes
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", "600"))
+
+class TopicRef(NamedTuple):
+    id: int
+    name: str
+
+class DifficultyRef(NamedTuple):
+    id: int
+    name: str
+
+class TimingRef(NamedTuple):
+    id: int
+    name: str
+    minutes: int
+
+# Cached table -> (snapshot type, columns loaded, in that order)
+_TABLES = {
+    "topics": (TopicRef, (Topic.id, Topic.name)),
+    "difficulties": (DifficultyRef, (Difficulty.id, Difficulty.name)),
+    "timings": (TimingRef, (Timing.id, Timing.name, Timing.minutes)),
+}
+
+class ReferenceDataCache:
+    """
+    Process-level cache of the topic, difficulty and timing tables
+
+    Rows are held as immutable named tuples rather than ORM instances, so they can be
+    shared by every request without being attached to any session. Templates only read
+    id, name and minutes, which the tuples provide. Paths that link rows to an interview
+    still load real Topic rows through their own session.
+
+    Every invalidate() bumps a version number. A load that started before the bump does
+    not store its result, so a reader racing an admin write cannot bring stale rows back.
+    """
+
+    def __init__(self, ttl: float = REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self.version = 0
+        self._entries: Dict[str, Tuple[float, tuple]] = {}
+        self._lock = asyncio.Lock()
+        self.hits = {name: 0 for name in _TABLES}
+        self.misses = {name: 0 for name in _TABLES}
+
+    def invalidate(self):
+        """Drop every cached table; call after a topic, difficulty or timing change is committed"""
+        self.version += 1
+        self._entries.clear()
+
+    async def _get(self, db: AsyncSession, name: str) -> tuple:
+        entry = self._entries.get(name)
+        if entry and entry[0] > time.monotonic():
+            self.hits[name] += 1
+            return entry[1]
+
+        async with self._lock:
+            # Another request may have loaded the table while we waited for the lock
+            entry = self._entries.get(name)
+            if entry and entry[0] > time.monotonic():
+                self.hits[name] += 1
+                return entry[1]
+
+            self.misses[name] += 1
+            version = self.version
+            snapshot_type, columns = _TABLES[name]
+            rows = await db.execute(select(*columns).order_by(columns[0]))
+            snapshot = tuple(snapshot_type(*row) for row in rows)
+            if version == self.version:
+                self._entries[name] = (time.monotonic() + self.ttl, snapshot)
+            return snapshot
+
+    async def topics(self, db: AsyncSession) -> List[TopicRef]:
+        return list(await self._get(db, "topics"))
+
+    async def difficulties(self, db: AsyncSession) -> List[DifficultyRef]:
+        return list(await self._get(db, "difficulties"))
+
+    async def timings(self, db: AsyncSession) -> List[TimingRef]:
+        return list(await self._get(db, "timings"))
+
+    async def topics_by_id(self, db: AsyncSession, topic_ids: Iterable[int]) -> List[TopicRef]:
+        """The given topics in id order, skipping unknown IDs"""
+        wanted = set(topic_ids)
+        return [topic for topic in await self._get(db, "topics") if topic.id in wanted]
+
+    async def difficulty(self, db: AsyncSession, difficulty_id: int) -> Optional[DifficultyRef]:
+        return next((d for d in await self._get(db, "difficulties") if d.id == difficulty_id), None)
+
+    def stats(self) -> Dict:
+        """Version, TTL and per-table hit/miss counters for the status page"""
+        return {
+            "version": self.version,
+            "ttl_seconds": self.ttl,
+            "tables": {
+                name: {
+                    "cached": name in self._entries,
+                    "rows": len(self._entries[name][1]) if name in self._entries else None,
+                    "hits": self.hits[name],
+                    "misses": self.misses[name],
+                }
+                for name in _TABLES
+            },
+        }
+
+# Shared by every request in this worker process
+reference_data = ReferenceDataCache()
@@ -0,0 +1,78 @@
+import os
+import time
+from typing import Dict, Optional
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User, Interview, Topic, Difficulty, QuestionBank
+
+# Seconds a computed set of counters is served before it is recomputed
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "30"))
+
+# Per-process cache: (expires_at, counters). Other workers catch up within the TTL.
+_cache: Dict[str, tuple] = {}
+
+def _count_where(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+def _dashboard_stats_query():
+    """All admin counters in one statement: one aggregate pass over interviews plus scalar subqueries"""
+    interview_stats = select(
+        func.count(Interview.id).label("interview_count"),
+        _count_where(Interview.approval_status == "requested").label("requested_interviews_count"),
+        _count_where(Interview.approval_status == "rejected").label("rejected_count"),
+        _count_where(Interview.status == "completed").label("completed_count"),
+        _count_where(Interview.status == "in_progress").label("in_progress_count"),
+    ).subquery()
+
+    return select(
+        select(func.count(User.id)).scalar_subquery().label("user_count"),
+        select(func.count(QuestionBank.id)).scalar_subquery().label("question_count"),
+        select(func.count(Topic.id)).scalar_subquery().label("topic_count"),
+        select(func.count(Difficulty.id)).scalar_subquery().label("difficulty_count"),
+        *interview_stats.c
+    )
+
+class StatisticsService:
+    @staticmethod
+    async def get_dashboard_stats(db: AsyncSession, ttl: Optional[float] = None) -> Dict[str, int]:
+        """
+        Counters shown on the admin dashboard and AI settings page
+
+        Args:
+            db (AsyncSession): Session used when the cached counters have expired
+            ttl (float): Override for STATS_CACHE_TTL
+
+        Returns:
+            Dict[str, int]: user, interview, status, approval and question bank counts
+        """
+        now = time.monotonic()
+        cached = _cache.get("dashboard")
+        if cached and cached[0] > now:
+            return dict(cached[1])
+
+        row = (await db.execute(_dashboard_stats_query())).mappings().one()
+        stats = {key: int(value or 0) for key, value in row.items()}
+        _cache["dashboard"] = (now + (STATS_CACHE_TTL if ttl is None else ttl), stats)
+        return dict(stats)
+
+    @staticmethod
+    async def get_user_interview_stats(db: AsyncSession, user_id: int) -> Dict[str, int]:
+        """
+        Counters for one user's dashboard, computed in one indexed aggregate query
+
+        Returns:
+            Dict[str, int]: total, completed and requested (pending approval) interview counts
+        """
+        row = (await db.execute(
+            select(
+                func.count(Interview.id).label("total"),
+                _count_where(Interview.status == "completed").label("completed"),
+                _count_where(Interview.approval_status == "requested").label("requested"),
+            ).where(Interview.user_id == user_id)
+        )).mappings().one()
+        return {key: int(value or 0) for key, value in row.items()}
+
+    @staticmethod
+    def invalidate():
+        """Drop the cached counters; call after an interview, user or catalogue change is committed"""
+        _cache.clear()
@@ -0,0 +1,93 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import User
+
+# Seconds a resolved session user is trusted before it is reloaded, bounding how long
+# another worker keeps serving a user that an admin changed or deactivated
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+
+# Most session users kept per worker; the least recently used are evicted first
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+
+class UserPrincipal(NamedTuple):
+    """The parts of a User that authentication, routers and templates read"""
+    id: int
+    username: str
+    email: str
+    is_admin: bool
+    is_active: bool
+
+class UserPrincipalCache:
+    """
+    Bounded LRU cache of session users, with a TTL per entry
+
+    Every authenticated request resolves request.session["user_id"] to a user. The
+    cache answers that from memory, so the users table is only read when an entry is
+    missing, expired or invalidated. Entries are immutable named tuples, not ORM
+    instances. Handlers that change a user load it through their own session.
+
+    Every invalidate() bumps a version number. A load that started before the bump does
+    not store its result, so a request racing an admin edit cannot cache the old row.
+    """
+
+    def __init__(self, ttl: float = USER_CACHE_TTL, max_size: int = USER_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.version = 0
+        self._entries: "OrderedDict[int, Tuple[float, UserPrincipal]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """Drop one user (or every user); call after a user change is committed"""
+        self.version += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+    async def get(self, db: AsyncSession, user_id: int) -> Optional[UserPrincipal]:
+        """The user's principal, or None when no such user exists"""
+        entry = self._entries.get(user_id)
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        version = self.version
+        row = (await db.execute(
+            select(User.id, User.username, User.email, User.is_admin, User.is_active).where(User.id == user_id)
+        )).first()
+        if row is None:
+            self._entries.pop(user_id, None)
+            return None
+
+        principal = UserPrincipal(row.id, row.username, row.email, bool(row.is_admin), bool(row.is_active))
+        if version == self.version:
+            self._entries[user_id] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return principal
+
+    def stats(self) -> Dict:
+        """Size, limits and hit/miss counters for the status page"""
+        return {
+            "version": self.version,
+            "ttl_seconds": self.ttl,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+# Shared by every request in this worker process
+user_principals = UserPrincipalCache()
@@ -25,17 +25,13 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
+    // Check if we're on an AI interview related page
+    const isAiPage = window.location.pathname.includes('/interview/ai-') || 
+                    window.location.pathname.includes('/interview/create-dynamic') ||
+                    window.location.pathname.includes('/interview/dynamic-');
+    
     // Function to show API key warning
     function showApiKeyWarning(message) {
-        // Check if we're on an AI interview related page
-        const isAiPage = window.location.pathname.includes('/interview/ai-') || 
-                        window.location.pathname.includes('/interview/create-dynamic') ||
-                        window.location.pathname.includes('/interview/dynamic-');
-        
-        if (!isAiPage) {
-            return; // Only show warning on AI-related pages
-        }
-        
         // Create warning element
         const warningDiv = document.createElement('div');
         warningDiv.className = 'alert alert-warning alert-dismissible fade show mt-3';
@@ -55,8 +51,8 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
-    // Check API key status if we're on a page that needs it
-    if (window.location.pathname.includes('/interview/')) {
+    // Check API key status only on the pages that need it (the warning is only shown there)
+    if (isAiPage) {
         checkApiKeyStatus();
     }
 });
@@ -0,0 +1,52 @@
+// Background job polling for TechInterviewer
+
+// Poll a job's status_url until it finishes; resolves with the job's result and
+// rejects with its error if it failed after all attempts
+async function waitForJob(statusUrl, intervalMs = 1000) {
+    while (true) {
+        const response = await fetch(statusUrl);
+        const job = await response.json();
+        
+        if (!response.ok) {
+            throw new Error(job.detail || 'Could not load the job status');
+        }
+        if (job.status === 'succeeded') {
+            return job.result;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'The job failed');
+        }
+        
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+}
+
+// Follow a job's Server-Sent Events at streamUrl, passing each piece of streamed text
+// to onToken (and calling onReset when a retry starts its text again); resolves with
+// the job's result like waitForJob, which it falls back to if the stream is unavailable
+function followJob(streamUrl, statusUrl, { onToken = () => {}, onReset = () => {} } = {}) {
+    if (!window.EventSource) {
+        return waitForJob(statusUrl);
+    }
+    
+    return new Promise((resolve, reject) => {
+        const source = new EventSource(streamUrl);
+        
+        source.addEventListener('token', event => onToken(JSON.parse(event.data)));
+        source.addEventListener('reset', () => onReset());
+        source.addEventListener('result', event => {
+            source.close();
+            resolve(JSON.parse(event.data));
+        });
+        source.addEventListener('error', event => {
+            source.close();
+            if (event.data) {
+                // The job failed after all attempts
+                reject(new Error(JSON.parse(event.data).error || 'The job failed'));
+            } else {
+                // The connection dropped; poll for the result instead
+                waitForJob(statusUrl).then(resolve, reject);
+            }
+        });
+    });
+}
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent request throughput for the synchronous and async database layers.
+
+Two throwaway FastAPI apps expose the same "user dashboard" query against a temporary
+SQLite database: one runs it through a blocking Session inside an async handler (the
+old pattern), the other through AsyncSession. Each request also awaits a short
+simulated I/O wait so the numbers show how much the event loop is held up.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.db_throughput --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.models.models import Base, Interview, User
+
+
+def seed_database(path: str, interviews: int):
+    """Create the schema and one user with the requested number of interviews"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        db.add(user)
+        db.flush()
+        now = datetime.now()
+        db.add_all([
+            Interview(
+                uuid=f"bench-{i}",
+                candidate_name="bench",
+                email="bench@example.com",
+                user_id=user.id,
+                created_at=now - timedelta(minutes=i)
+            )
+            for i in range(interviews)
+        ])
+        db.commit()
+        user_id = user.id
+    engine.dispose()
+    return user_id
+
+
+def build_sync_app(path: str, user_id: int, io_wait: float, pool_size: int) -> FastAPI:
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}, pool_size=pool_size
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    @app.get("/dashboard")
+    async def dashboard(db: Session = Depends(get_db)):
+        interviews = db.query(Interview).filter(Interview.user_id == user_id).order_by(Interview.created_at.desc()).all()
+        await asyncio.sleep(io_wait)
+        return {"count": len(interviews)}
+
+    return app
+
+
+def build_async_app(path: str, user_id: int, io_wait: float, pool_size: int) -> FastAPI:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=AsyncAdaptedQueuePool, pool_size=pool_size
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    async def get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/dashboard")
+    async def dashboard(db: AsyncSession = Depends(get_db)):
+        interviews = (await db.scalars(
+            select(Interview).where(Interview.user_id == user_id).order_by(Interview.created_at.desc())
+        )).all()
+        await asyncio.sleep(io_wait)
+        return {"count": len(interviews)}
+
+    return app
+
+
+async def drive(app: FastAPI, requests: int, concurrency: int) -> dict:
+    """Fire requests at the app with a fixed number of concurrent clients"""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get("/dashboard")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "throughput": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async database throughput benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="Total requests per run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--interviews", type=int, default=200, help="Interviews returned by the dashboard query")
+    parser.add_argument("--io-wait", type=float, default=0.005, help="Simulated non-database await per request (seconds)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        user_id = seed_database(path, args.interviews)
+
+        print(f"Running {args.requests} requests with concurrency {args.concurrency}...")
+        results = {}
+        for label, builder in (("sync Session", build_sync_app), ("AsyncSession", build_async_app)):
+            # Size the pool to the client count so neither run waits on connection checkout
+            app = builder(path, user_id, args.io_wait, args.concurrency)
+            results[label] = asyncio.run(drive(app, args.requests, args.concurrency))
+
+        for label, result in results.items():
+            print(
+                f"{label:>14}: {result['throughput']:8.1f} req/s  "
+                f"p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms"
+            )
+
+        speedup = results["AsyncSession"]["throughput"] / results["sync Session"]["throughput"]
+        print(f"Async throughput: {speedup:.2f}x the synchronous session")
+
+
+if __name__ == "__main__":
+    main()
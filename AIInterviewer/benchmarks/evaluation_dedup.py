@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the evaluation cache on duplicate answer submissions.
+
+Each distinct answer is submitted --duplicates times at once (double-clicks), and the
+whole set is submitted again afterwards (client retries), all through
+AsyncOpenAIService.evaluate_answer. The run is repeated with the cache disabled and
+enabled, against a temporary SQLite cache, with the mock OpenAI endpoint from
+benchmarks.llm_concurrency. The script reports API calls, the calls shared by
+concurrent duplicates, cache hits and the wall time of each round.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.evaluation_dedup --answers 50 --duplicates 3 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+from openai import AsyncOpenAI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.models import Base
+from app.services import openai_service
+from app.services.evaluation_cache import EvaluationCache
+from app.services.openai_service import AsyncOpenAIService
+from benchmarks.llm_concurrency import MockOpenAI
+
+
+def build_cache(path: str, enabled: bool) -> EvaluationCache:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    return EvaluationCache(
+        retention=3600 if enabled else 0,
+        session_factory=async_sessionmaker(
+            bind=create_async_engine(f"sqlite+aiosqlite:///{path}"), class_=AsyncSession, expire_on_commit=False
+        ),
+        sync_session_factory=sessionmaker(bind=engine),
+    )
+
+
+async def run(cache: EvaluationCache, answers: int, duplicates: int, latency: float) -> dict:
+    mock = MockOpenAI(latency)
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return await mock.async_handler(request)
+
+    openai_service.evaluation_cache = cache
+    openai_service.async_client = AsyncOpenAI(
+        api_key="bench", base_url="http://mock-openai/v1", max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    async def submit(i: int):
+        evaluation = await AsyncOpenAIService.evaluate_answer(
+            "What is a Python decorator?", f"Answer number {i}: a function that wraps another function.",
+            "Wraps a callable to extend its behaviour.", "Python", "Medium"
+        )
+        assert evaluation["score"] == 80, evaluation
+
+    result = {}
+    for label, copies in (("double-click", duplicates), ("retry", 1)):
+        start = time.perf_counter()
+        await asyncio.gather(*(submit(i) for i in range(answers) for _ in range(copies)))
+        result[label] = time.perf_counter() - start
+    stats = await cache.stats()
+    result.update(calls=calls, coalesced=stats["coalesced"], hits=stats["hits"])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluation cache duplicate submission benchmark")
+    parser.add_argument("--answers", type=int, default=50, help="Distinct answers")
+    parser.add_argument("--duplicates", type=int, default=3, help="Identical submissions of each answer sent at once")
+    parser.add_argument("--latency", type=float, default=0.5, help="Mock OpenAI response time (seconds)")
+    args = parser.parse_args()
+
+    submissions = args.answers * (args.duplicates + 1)
+    print(f"Submitting {args.answers} answers {args.duplicates} times at once, then once more ({submissions} evaluations)...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, enabled in (("no cache", False), ("cache", True)):
+            result = asyncio.run(run(build_cache(os.path.join(tmp, f"{label}.db"), enabled),
+                                     args.answers, args.duplicates, args.latency))
+            print(
+                f"{label:>9}: {result['calls']:4d} API calls  {result['coalesced']:4d} shared in flight  "
+                f"{result['hits']:4d} cache hits  double-click round {result['double-click']:5.2f} s  "
+                f"retry round {result['retry']:5.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark time to first feedback for answer evaluations, streamed vs in one piece.
+
+Runs AsyncOpenAIService.evaluate_answer for the same answers once without a token
+callback (the feedback arrives with the complete JSON) and once streaming (the
+feedback text is passed on as the model writes it, the score parsed at the end). The
+script reports the median and worst time until the first feedback text reaches the
+caller, the time to the complete evaluation, and checks that every streamed
+evaluation was parsed into a score.
+
+By default a mock OpenAI endpoint answers: it waits --base-latency before the first
+token and --ms-per-token for each token after it, as a chat completion or as a
+Server-Sent Events stream. With --live the real API is called with OPENAI_API_KEY.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.feedback_streaming --evaluations 10
+    python -m benchmarks.feedback_streaming --live --evaluations 3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.services import openai_service
+from app.services.evaluation_cache import EvaluationCache
+from app.services.openai_service import STREAM_RESULT_MARKER, AsyncOpenAIService
+from benchmarks.llm_batching import WORDS, estimate_tokens
+
+
+class MockStreamingOpenAI:
+    """Answers evaluation prompts after a per-token delay, streamed when the request asks for it"""
+
+    def __init__(self, base_latency: float, ms_per_token: float, feedback_words: int):
+        self.base_latency = base_latency
+        self.ms_per_token = ms_per_token
+        self.feedback_words = feedback_words
+        self.rng = random.Random(1)
+
+    def evaluation(self) -> dict:
+        return {
+            "score": self.rng.randint(40, 95),
+            "feedback": " ".join(self.rng.choice(WORDS) for _ in range(self.feedback_words)) + ".",
+            "strengths": ["Correct core idea", "Clear structure"],
+            "areas_for_improvement": ["Mention edge cases"],
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        evaluation = self.evaluation()
+        if not body.get("stream"):
+            content = json.dumps(evaluation)
+            await asyncio.sleep(self.base_latency + estimate_tokens(content) * self.ms_per_token / 1000)
+            return httpx.Response(200, json={
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            })
+
+        feedback = evaluation.pop("feedback")
+        content = f"{feedback}\n{STREAM_RESULT_MARKER}\n{json.dumps(evaluation)}"
+
+        async def events():
+            await asyncio.sleep(self.base_latency)
+            # One chunk per estimated token (4 characters)
+            for start in range(0, len(content), 4):
+                await asyncio.sleep(self.ms_per_token / 1000)
+                chunk = {
+                    "id": "chatcmpl-bench",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": body["model"],
+                    "choices": [{"index": 0, "delta": {"content": content[start:start + 4]}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n".encode()
+            yield b"data: [DONE]\n\n"
+
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=events())
+
+
+async def run(evaluations: int, stream: bool, transport) -> dict:
+    """Evaluate the answers one after another, timing the first feedback text and the result"""
+    options = openai_service.client_options()
+    if transport is not None:
+        options.update(api_key="bench", base_url="http://mock-openai/v1", max_retries=0)
+    openai_service.async_client = AsyncOpenAI(http_client=httpx.AsyncClient(transport=transport), **options)
+    # Every evaluation goes to the API
+    openai_service.evaluation_cache = EvaluationCache(retention=0)
+
+    first, complete, parsed = [], [], 0
+    for i in range(evaluations):
+        first_token = None
+
+        def on_token(text: str):
+            nonlocal first_token
+            if first_token is None and text.strip():
+                first_token = time.perf_counter()
+
+        start = time.perf_counter()
+        evaluation = await AsyncOpenAIService.evaluate_answer(
+            "What is a Python decorator?", f"Answer {i}: a function that takes a function and returns a wrapped one.",
+            "Wraps a callable to extend its behaviour.", "Python", "Medium",
+            fallback=False, on_token=on_token if stream else None
+        )
+        end = time.perf_counter()
+        first.append((first_token or end) - start)
+        complete.append(end - start)
+        parsed += isinstance(evaluation["score"], (int, float)) and bool(evaluation["feedback"])
+    return {"first": first, "complete": complete, "parsed": parsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamed vs complete answer feedback benchmark")
+    parser.add_argument("--evaluations", type=int, default=10, help="Answers evaluated in each mode")
+    parser.add_argument("--base-latency", type=float, default=0.4, help="Mock time to first token (seconds)")
+    parser.add_argument("--ms-per-token", type=float, default=15, help="Mock generation time per token")
+    parser.add_argument("--feedback-words", type=int, default=120, help="Words of feedback the mock writes")
+    parser.add_argument("--live", action="store_true", help="Call the real OpenAI API instead of the mock")
+    args = parser.parse_args()
+
+    transport = None
+    if not args.live:
+        transport = httpx.MockTransport(
+            MockStreamingOpenAI(args.base_latency, args.ms_per_token, args.feedback_words).handler
+        )
+
+    print(f"Evaluating {args.evaluations} answers in each mode ({'live API' if args.live else 'mock API'})...")
+    for label, stream in (("complete", False), ("streamed", True)):
+        result = asyncio.run(run(args.evaluations, stream, transport))
+        print(
+            f"{label:>9}: first feedback median {statistics.median(result['first']):5.2f} s  "
+            f"max {max(result['first']):5.2f} s  complete evaluation median {statistics.median(result['complete']):5.2f} s  "
+            f"parsed {result['parsed']}/{args.evaluations}"
+        )
+
+
+if __name__ == "__main__":
+    main()
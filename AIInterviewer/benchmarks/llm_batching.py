@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark tokens and wall time of batched vs per-topic question generation.
+
+Runs AsyncOpenAIService.generate_questions_for_topics for the same topics once with
+one request per topic and once with a single batched request, and reports requests
+made, prompt/completion/total tokens (from each response's usage) and wall time.
+
+By default a mock OpenAI endpoint answers: tokens are estimated as characters / 4,
+and each response takes --base-latency plus --ms-per-token per completion token, so
+a longer batched answer takes longer than one short per-topic answer. With --live the
+real API is called with OPENAI_API_KEY and the usage OpenAI reports is used.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.llm_batching --topics 5 --questions 2
+    python -m benchmarks.llm_batching --live
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.services import openai_service
+from app.services.openai_service import AsyncOpenAIService
+
+TOPICS = ["Python", "JavaScript", "Java", "SQL", "React", "Data Structures", "Algorithms"]
+
+WORDS = (
+    "explain how the runtime handles memory concurrency errors and state when a function object class "
+    "module query index transaction component hook tree graph sort search complexity cache request "
+    "should mention trade-offs examples edge cases performance and correct usage in production code"
+).split()
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class MockOpenAI:
+    """Answers question generation prompts, per topic or batched, after a token-based delay"""
+
+    def __init__(self, base_latency: float, ms_per_token: float):
+        self.base_latency = base_latency
+        self.ms_per_token = ms_per_token
+        self.rng = random.Random(1)
+
+    def question(self, topic: str) -> dict:
+        return {
+            "question_text": f"{topic}: " + " ".join(self.rng.choice(WORDS) for _ in range(25)) + "?",
+            "expected_answer": " ".join(self.rng.choice(WORDS) for _ in range(70)) + ".",
+        }
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        prompt = " ".join(message["content"] for message in body["messages"])
+        count = int(re.search(r"Generate (\d+) technical", prompt).group(1))
+        listing = re.findall(r"^(\d+)\. (.+) \(.+ level\)$", prompt, re.MULTILINE)
+        if listing:
+            result = {"topics": [
+                {"id": int(number), "topic": topic, "questions": [self.question(topic) for _ in range(count)]}
+                for number, topic in listing
+            ]}
+        else:
+            topic = re.search(r"questions?\(s\) about (.+) at ", prompt).group(1)
+            result = {"questions": [self.question(topic) for _ in range(count)]}
+
+        content = json.dumps(result)
+        usage = {"prompt_tokens": estimate_tokens(prompt), "completion_tokens": estimate_tokens(content)}
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        await asyncio.sleep(self.base_latency + usage["completion_tokens"] * self.ms_per_token / 1000)
+        return httpx.Response(200, json={
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage,
+        })
+
+
+async def run(topics, questions: int, batched: bool, transport) -> dict:
+    """Generate questions once with the given mode, totalling the usage of every response"""
+    totals = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+    async def record_usage(response: httpx.Response):
+        await response.aread()
+        usage = response.json().get("usage") or {}
+        totals["requests"] += 1
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            totals[key] += usage.get(key, 0)
+
+    options = openai_service.client_options()
+    if transport is not None:
+        options.update(api_key="bench", base_url="http://mock-openai/v1", max_retries=0)
+    openai_service.async_client = AsyncOpenAI(
+        http_client=httpx.AsyncClient(transport=transport, event_hooks={"response": [record_usage]}), **options
+    )
+
+    start = time.perf_counter()
+    results = await AsyncOpenAIService.generate_questions_for_topics(topics, "Intermediate", questions, batched=batched)
+    totals["elapsed"] = time.perf_counter() - start
+    totals["failed"] = sum(1 for result in results if not result)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched vs per-topic question generation benchmark")
+    parser.add_argument("--topics", type=int, default=5, help="Topics per interview")
+    parser.add_argument("--questions", type=int, default=2, help="Questions per topic")
+    parser.add_argument("--base-latency", type=float, default=0.6, help="Mock time to first token (seconds)")
+    parser.add_argument("--ms-per-token", type=float, default=12.0, help="Mock generation time per completion token")
+    parser.add_argument("--live", action="store_true", help="Call the real OpenAI API (uses OPENAI_API_KEY)")
+    args = parser.parse_args()
+
+    topics = (TOPICS * (args.topics // len(TOPICS) + 1))[:args.topics]
+    print(f"Generating {args.questions} question(s) for {len(topics)} topics ({'live API' if args.live else 'mock API'})...")
+
+    results = {}
+    for label, batched in (("per topic", False), ("batched", True)):
+        transport = None if args.live else httpx.MockTransport(MockOpenAI(args.base_latency, args.ms_per_token).handler)
+        results[label] = asyncio.run(run(topics, args.questions, batched, transport))
+
+    for label, result in results.items():
+        print(
+            f"{label:>10}: {result['requests']:3d} requests  prompt {result['prompt_tokens']:6d}  "
+            f"completion {result['completion_tokens']:6d}  total {result['total_tokens']:6d} tokens  "
+            f"{result['elapsed']:6.2f} s  failed topics {result['failed']}"
+        )
+    saved = 1 - results["batched"]["total_tokens"] / results["per topic"]["total_tokens"]
+    print(f"Batched prompt uses {saved:.0%} fewer tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark how many answer evaluations one worker keeps in flight.
+
+A mock OpenAI endpoint (an httpx transport that answers every chat completion after
+a fixed latency) stands in for the API, so no key or network is needed. The same
+burst of POST /api/openai/evaluate-answer requests is sent to two throwaway apps
+in one event loop: one calls the synchronous OpenAIService from its async handler
+(the old pattern), the other mounts the real openai_interview router, which awaits
+AsyncOpenAIService. The script reports the wall time and the highest number of
+evaluations the mock saw at the same time.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.llm_concurrency --evaluations 50 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI
+from openai import AsyncOpenAI, OpenAI
+
+from app.routers import openai_interview
+from app.schemas.openai_schemas import EvaluateAnswerRequest
+from app.services import openai_service
+from app.services.auth import validate_api_user
+from app.services.openai_service import OpenAIService
+from app.services.user_principals import UserPrincipal
+
+EVALUATION = {"score": 80, "feedback": "Solid answer.", "strengths": ["Clear"], "areas_for_improvement": []}
+
+
+class MockOpenAI:
+    """Chat completion responses after a fixed latency, counting concurrent calls"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _response() -> httpx.Response:
+        return httpx.Response(200, json={
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": openai_service.OPENAI_MODEL,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps(EVALUATION)},
+                "finish_reason": "stop",
+            }],
+        })
+
+    def sync_handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        time.sleep(self.latency)
+        self._exit()
+        return self._response()
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        await asyncio.sleep(self.latency)
+        self._exit()
+        return self._response()
+
+
+def install_mock(mock: MockOpenAI):
+    """Point both OpenAIService clients at the mock"""
+    options = {"api_key": "bench", "base_url": "http://mock-openai/v1", "max_retries": 0}
+    openai_service.client = OpenAI(http_client=httpx.Client(transport=httpx.MockTransport(mock.sync_handler)), **options)
+    openai_service.async_client = AsyncOpenAI(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(mock.async_handler)), **options
+    )
+
+
+def build_sync_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/openai/evaluate-answer")
+    async def evaluate_answer(request: EvaluateAnswerRequest):
+        return OpenAIService.evaluate_answer(
+            question=request.question,
+            candidate_answer=request.candidate_answer,
+            expected_answer=request.expected_answer,
+            topic=request.topic,
+            difficulty=request.difficulty
+        )
+
+    return app
+
+
+def build_async_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(openai_interview.router)
+    app.dependency_overrides[validate_api_user] = lambda: UserPrincipal(1, "bench", "bench@example.com", False, True)
+    return app
+
+
+async def drive(app: FastAPI, evaluations: int) -> float:
+    """Send every evaluation at once and wait for all of them"""
+    transport = httpx.ASGITransport(app=app)
+    payload = {
+        "question": "What is a Python decorator?",
+        "candidate_answer": "A function that wraps another function.",
+        "expected_answer": "Wraps a callable to extend its behaviour.",
+        "topic": "Python",
+        "difficulty": "Medium",
+    }
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one():
+            response = await client.post("/api/openai/evaluate-answer", json=payload)
+            response.raise_for_status()
+            assert response.json()["score"] == EVALUATION["score"], response.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(evaluations)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync vs async OpenAI client evaluation concurrency benchmark")
+    parser.add_argument("--evaluations", type=int, default=50, help="Concurrent evaluation requests")
+    parser.add_argument("--latency", type=float, default=0.5, help="Mock OpenAI response time (seconds)")
+    args = parser.parse_args()
+
+    print(f"Sending {args.evaluations} concurrent evaluations, mock OpenAI latency {args.latency}s...")
+    results = {}
+    for label, builder in (("sync client", build_sync_app), ("AsyncOpenAI", build_async_app)):
+        mock = MockOpenAI(args.latency)
+        install_mock(mock)
+        elapsed = asyncio.run(drive(builder(), args.evaluations))
+        results[label] = (elapsed, mock.peak)
+
+    for label, (elapsed, peak) in results.items():
+        print(f"{label:>12}: {elapsed:7.2f} s  {args.evaluations / elapsed:7.1f} evaluations/s  peak in flight {peak:4d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark login throughput and event loop responsiveness during a burst of logins.
+
+Two throwaway FastAPI apps serve POST /login against a temporary SQLite database with
+bcrypt-hashed users: one verifies the password inline in the async handler (the old
+pattern), the other mounts the real auth router, which verifies on the password
+worker pool. While the logins run, a heartbeat task sleeps in short intervals and
+records how late it wakes up. That event loop lag is the delay every other request,
+such as a candidate submitting an answer, sees during the burst.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.login_throughput --logins 100 --concurrency 20
+    BCRYPT_ROUNDS=10 python -m benchmarks.login_throughput   # another work factor
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+from fastapi import Depends, FastAPI, Form
+from fastapi.responses import RedirectResponse
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.middleware.sessions import SessionMiddleware
+
+from app.database.database import get_async_db
+from app.models.models import Base, User
+from app.routers import auth as auth_router
+from app.services.auth import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, pwd_context
+
+PASSWORD = "bench-password"
+
+
+def seed_database(path: str, users: int):
+    """Create the schema and users sharing one password hash (hashing each would take minutes)"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    hashed_password = pwd_context.hash(PASSWORD)
+    with Session(engine) as db:
+        db.add_all([
+            User(username=f"bench{i}", email=f"bench{i}@example.com", hashed_password=hashed_password)
+            for i in range(users)
+        ])
+        db.commit()
+    engine.dispose()
+
+
+def session_dependency(path: str, pool_size: int):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{path}", poolclass=AsyncAdaptedQueuePool, pool_size=pool_size
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+    async def get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    return get_db
+
+
+def add_sessions(app: FastAPI) -> FastAPI:
+    app.add_middleware(SessionMiddleware, secret_key="bench")
+    return app
+
+
+def build_inline_app(path: str, pool_size: int) -> FastAPI:
+    get_db = session_dependency(path, pool_size)
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login(username: str = Form(...), password: str = Form(...), db: AsyncSession = Depends(get_db)):
+        user = await db.scalar(select(User).where(User.username == username))
+        if not user or not pwd_context.verify(password, user.hashed_password):
+            return {"error": "Incorrect username or password"}
+        return RedirectResponse(url="/user/dashboard", status_code=303)
+
+    return add_sessions(app)
+
+
+def build_offloaded_app(path: str, pool_size: int) -> FastAPI:
+    app = FastAPI()
+    app.include_router(auth_router.router)
+    app.dependency_overrides[get_async_db] = session_dependency(path, pool_size)
+    return add_sessions(app)
+
+
+async def drive(app: FastAPI, logins: int, concurrency: int, users: int) -> dict:
+    """Fire logins with a fixed number of concurrent clients while measuring event loop lag"""
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    lags = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int):
+            async with semaphore:
+                response = await client.post(
+                    "/login", data={"username": f"bench{i % users}", "password": PASSWORD}
+                )
+                assert response.status_code == 303, response.text
+
+        async def heartbeat(done: asyncio.Event, interval: float = 0.005):
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(interval)
+                lags.append(time.perf_counter() - start - interval)
+
+        done = asyncio.Event()
+        heartbeat_task = asyncio.create_task(heartbeat(done))
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await heartbeat_task
+
+    lags.sort()
+    return {
+        "throughput": logins / elapsed,
+        "lag_p50_ms": lags[len(lags) // 2] * 1000,
+        "lag_p95_ms": lags[int(len(lags) * 0.95) - 1] * 1000,
+        "lag_max_ms": lags[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inline vs offloaded bcrypt login benchmark")
+    parser.add_argument("--logins", type=int, default=100, help="Logins per run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent login clients")
+    parser.add_argument("--users", type=int, default=50, help="Users in the temporary database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        seed_database(path, args.users)
+
+        print(
+            f"Running {args.logins} logins with concurrency {args.concurrency} "
+            f"(bcrypt rounds {BCRYPT_ROUNDS}, {PASSWORD_HASH_WORKERS} hash workers)..."
+        )
+        results = {}
+        for label, builder in (("inline bcrypt", build_inline_app), ("worker pool", build_offloaded_app)):
+            app = builder(path, args.concurrency)
+            results[label] = asyncio.run(drive(app, args.logins, args.concurrency, args.users))
+
+        for label, result in results.items():
+            print(
+                f"{label:>14}: {result['throughput']:7.1f} logins/s  "
+                f"event loop lag p50 {result['lag_p50_ms']:7.1f} ms  p95 {result['lag_p95_ms']:7.1f} ms  "
+                f"max {result['lag_max_ms']:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
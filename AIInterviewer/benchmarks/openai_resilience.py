@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark answer evaluations against a degraded OpenAI provider.
+
+A mock OpenAI endpoint (from benchmarks.llm_concurrency) answers after --latency,
+except that it can be made flaky (a share of requests get a 503, or a 429 with
+Retry-After) or go down entirely for a while (requests hang past the timeout).
+Evaluations arrive at a fixed rate, the same for every policy, and run through
+AsyncOpenAIService.evaluate_answer with three policies: timeout only, timeout and
+jittered retries, and timeout, retries and the circuit breaker. The script reports
+real evaluations (not the fallback), requests sent to the provider, the median and
+95th percentile time an evaluation waited, and the most evaluations in flight at once
+(the workers a degraded provider ties up).
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.openai_resilience --evaluations 400 --rate 40
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.services import openai_service
+from app.services.evaluation_cache import EvaluationCache
+from app.services.openai_resilience import CircuitBreaker, OpenAIResilience
+from app.services.openai_service import AsyncOpenAIService
+from benchmarks.llm_concurrency import EVALUATION, MockOpenAI
+
+
+class DegradedOpenAI(MockOpenAI):
+    """MockOpenAI that fails a share of requests, and hangs every request during an outage window"""
+
+    def __init__(self, latency: float, error_rate: float, rate_limit_rate: float,
+                 outage: tuple, hang: float, seed: int = 5):
+        super().__init__(latency)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.outage_start, self.outage_end = outage
+        self.hang = hang
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.started = None
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        now = time.perf_counter() - self.started
+        if self.outage_start <= now < self.outage_end:
+            await asyncio.sleep(self.hang)
+        roll = self.rng.random()
+        if roll < self.error_rate:
+            await asyncio.sleep(self.latency / 5)
+            return httpx.Response(503, json={"error": {"message": "Service unavailable"}})
+        if roll < self.error_rate + self.rate_limit_rate:
+            return httpx.Response(429, headers={"retry-after": "0.2"}, json={"error": {"message": "Rate limited"}})
+        return await self.async_handler(request)
+
+
+async def run(args, resilience: OpenAIResilience) -> dict:
+    mock = DegradedOpenAI(args.latency, args.error_rate, args.rate_limit_rate,
+                          (args.outage_start, args.outage_start + args.outage), args.hang)
+    openai_service.async_client = AsyncOpenAI(
+        api_key="bench", base_url="http://mock-openai/v1", max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(mock.handler))
+    )
+    openai_service.openai_resilience = resilience
+    # Every evaluation goes to the provider
+    openai_service.evaluation_cache = EvaluationCache(retention=0)
+
+    waits, real, in_flight, peak = [], 0, 0, 0
+
+    async def evaluate(i: int):
+        nonlocal real, in_flight, peak
+        # Arrivals do not depend on how fast earlier evaluations finished
+        await asyncio.sleep(i / args.rate)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        start = time.perf_counter()
+        evaluation = await AsyncOpenAIService.evaluate_answer(
+            "What is a Python decorator?", f"Answer {i}", "Wraps a callable.", "Python", "Medium"
+        )
+        waits.append(time.perf_counter() - start)
+        in_flight -= 1
+        real += evaluation["feedback"] == EVALUATION["feedback"]
+
+    mock.started = time.perf_counter()
+    await asyncio.gather(*(evaluate(i) for i in range(args.evaluations)))
+    return {
+        "real": real,
+        "requests": mock.requests,
+        "median_wait": statistics.median(waits),
+        "p95_wait": statistics.quantiles(waits, n=20)[-1],
+        "peak": peak,
+        "opened": resilience.breaker.opened,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI timeout, retry and circuit breaker benchmark")
+    parser.add_argument("--evaluations", type=int, default=400, help="Answers evaluated")
+    parser.add_argument("--rate", type=float, default=40, help="Evaluations started per second")
+    parser.add_argument("--latency", type=float, default=0.2, help="Mock response time (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.2, help="Share of requests answered with a 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.1, help="Share of requests answered with a 429")
+    parser.add_argument("--outage-start", type=float, default=2.0, help="Seconds into the run the provider goes down")
+    parser.add_argument("--outage", type=float, default=3.0, help="Seconds the provider stays down")
+    parser.add_argument("--hang", type=float, default=10.0, help="Seconds a request hangs during the outage")
+    parser.add_argument("--timeout", type=float, default=1.0, help="Evaluation timeout (seconds)")
+    args = parser.parse_args()
+
+    def policy(retries: int, breaker_failures: int) -> OpenAIResilience:
+        return OpenAIResilience(
+            timeouts={"evaluation": args.timeout}, max_retries=retries, base_delay=0.1, max_delay=2,
+            breaker=CircuitBreaker(failure_threshold=breaker_failures, reset_seconds=1), rng=random.Random(2)
+        )
+
+    print(
+        f"Evaluating {args.evaluations} answers, {args.rate:g} per second: {args.error_rate:.0%} 503s, "
+        f"{args.rate_limit_rate:.0%} 429s, provider down from {args.outage_start:g}s for {args.outage:g}s..."
+    )
+    policies = [
+        ("timeout only", policy(0, 10 ** 9)),
+        ("retries", policy(2, 10 ** 9)),
+        ("retries+breaker", policy(2, 5)),
+    ]
+    for label, resilience in policies:
+        result = asyncio.run(run(args, resilience))
+        print(
+            f"{label:>15}: {result['real']:4d}/{args.evaluations} real evaluations  {result['requests']:4d} requests  "
+            f"median wait {result['median_wait']:5.2f} s  p95 wait {result['p95_wait']:5.2f} s  "
+            f"peak in flight {result['peak']:4d}  breaker opened {result['opened']}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
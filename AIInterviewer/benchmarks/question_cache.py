@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark the persistent question set cache on a stream of interview creations.
+
+Each simulated interview picks a few topics and one difficulty from SEED_QUESTIONS, the
+way dynamic interviews are created, and generates its questions through
+AsyncOpenAIService.generate_questions_for_topics. The same stream runs with the cache
+disabled and then at several QUESTION_CACHE_FRESHNESS values, each against a fresh
+temporary SQLite cache. The mock OpenAI endpoint from benchmarks.llm_batching answers
+the calls. The script reports API requests made, cache hit rate, bytes stored, the API
+time hits saved and the total wall time.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.question_cache --interviews 100 --topics 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+
+import httpx
+from openai import AsyncOpenAI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.seed_questions import SEED_QUESTIONS
+from app.models.models import Base
+from app.services import openai_service
+from app.services.openai_service import AsyncOpenAIService
+from app.services.question_cache import QuestionSetCache
+from benchmarks.llm_batching import MockOpenAI
+
+
+def interview_stream(interviews: int, topics_per_interview: int):
+    """(topics, difficulty) for each simulated interview, the same for every run"""
+    rng = random.Random(7)
+    topics = sorted(SEED_QUESTIONS)
+    difficulties = sorted({question["difficulty"] for questions in SEED_QUESTIONS.values() for question in questions})
+    return [
+        (rng.sample(topics, min(topics_per_interview, len(topics))), rng.choice(difficulties))
+        for _ in range(interviews)
+    ]
+
+
+def build_cache(path: str, freshness: float, enabled: bool) -> QuestionSetCache:
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{path}"))
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    return QuestionSetCache(
+        ttl=3600 if enabled else 0,
+        freshness=freshness,
+        session_factory=async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False),
+        sync_session_factory=sessionmaker(bind=create_engine(f"sqlite:///{path}")),
+        rng=random.Random(3),
+    )
+
+
+async def run(stream, cache: QuestionSetCache, base_latency: float, ms_per_token: float) -> dict:
+    mock = MockOpenAI(base_latency, ms_per_token)
+    requests = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        return await mock.handler(request)
+
+    openai_service.question_cache = cache
+    openai_service.async_client = AsyncOpenAI(
+        api_key="bench", base_url="http://mock-openai/v1", max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    start = time.perf_counter()
+    for topics, difficulty in stream:
+        results = await AsyncOpenAIService.generate_questions_for_topics(topics, difficulty, 2)
+        assert all(results), (topics, difficulty)
+    elapsed = time.perf_counter() - start
+
+    stats = await cache.stats()
+    lookups = stats["hits"] + stats["misses"] + stats["fresh_draws"]
+    return {
+        "requests": requests,
+        "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+        "bytes": stats["bytes"],
+        "saved_seconds": stats["saved_seconds"],
+        "elapsed": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Question set cache benchmark")
+    parser.add_argument("--interviews", type=int, default=100, help="Interviews created")
+    parser.add_argument("--topics", type=int, default=3, help="Topics per interview")
+    parser.add_argument("--base-latency", type=float, default=0.05, help="Mock time to first token (seconds)")
+    parser.add_argument("--ms-per-token", type=float, default=0.5, help="Mock generation time per completion token")
+    parser.add_argument("--freshness", type=float, nargs="+", default=[0.0, 0.2, 0.5], help="Freshness values to run")
+    args = parser.parse_args()
+
+    stream = interview_stream(args.interviews, args.topics)
+    pairs = len({(topic, difficulty) for topics, difficulty in stream for topic in topics})
+    print(f"Creating {args.interviews} interviews with {args.topics} topics each ({pairs} distinct topic/difficulty pairs)...")
+
+    runs = [("no cache", 0.0, False)] + [(f"freshness {value:g}", value, True) for value in args.freshness]
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (label, freshness, enabled) in enumerate(runs):
+            cache = build_cache(os.path.join(tmp, f"cache{i}.db"), freshness, enabled)
+            result = asyncio.run(run(stream, cache, args.base_latency, args.ms_per_token))
+            print(
+                f"{label:>15}: {result['requests']:5d} API requests  hit rate {result['hit_rate']:4.0%}  "
+                f"stored {result['bytes'] / 1024:7.1f} KB  saved {result['saved_seconds']:7.2f} s of API time  "
+                f"wall {result['elapsed']:6.2f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
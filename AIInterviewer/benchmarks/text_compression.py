@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark database size and evaluation page read latency with and without text compression.
+
+The same interviews (long answers, feedback and summaries, as LLM evaluations produce)
+are written to temporary SQLite databases once as plain text and once per available
+compression method (see app.database.compression). For each database the script
+reports the file size after VACUUM and the latency of loading an interview the way
+the evaluation pages do (queries.get_interview_session with its questions), which
+includes decompressing every answer and feedback.
+
+Usage (from the AIInterviewer directory):
+    python -m benchmarks.text_compression --interviews 500 --questions 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.database import compression, queries
+from app.models.models import Base, Difficulty, Interview, Question, Timing, Topic, User
+
+WORDS = (
+    "the candidate answer explains function class object method decorator generator iterator "
+    "context manager exception handling memory garbage collection thread process async await "
+    "event loop database index query transaction isolation cache latency throughput scalability "
+    "correct partially missing example trade-off complexity time space algorithm structure list "
+    "dictionary set tuple immutable mutable reference value scope closure lambda comprehension "
+    "strong clear good understanding could improve by mentioning edge cases performance testing"
+).split()
+
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    """Feedback-like prose: sentences drawn from a technical vocabulary"""
+    return " ".join(
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+def seed_database(path: str, interviews: int, questions: int, method: str):
+    """Create the schema and the benchmark interviews, stored with the given compression method"""
+    rng = random.Random(42)
+    compression.TEXT_COMPRESSION = method
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        user = User(username="bench", email="bench@example.com", hashed_password="x")
+        topic, difficulty, timing = Topic(name="Python"), Difficulty(name="Medium"), Timing(name="30 minutes", minutes=30)
+        db.add_all([user, topic, difficulty, timing])
+        db.flush()
+        for i in range(interviews):
+            interview = Interview(
+                uuid=f"bench-{i}", candidate_name="bench", email="bench@example.com", user_id=user.id,
+                difficulty_id=difficulty.id, timing_id=timing.id, status="completed",
+                created_at=datetime.now(), summary=paragraph(rng, 12), topics=[topic]
+            )
+            interview.questions = [
+                Question(
+                    topic_id=topic.id, question_order=order, question_text=paragraph(rng, 1),
+                    answer=paragraph(rng, rng.randint(3, 15)), feedback=paragraph(rng, rng.randint(4, 10)),
+                    score=rng.randint(0, 10)
+                )
+                for order in range(questions)
+            ]
+            db.add(interview)
+        db.commit()
+    with engine.connect() as connection:
+        connection.execute(text("VACUUM"))
+    engine.dispose()
+    return os.path.getsize(path)
+
+
+async def read_latency(path: str, interviews: int, reads: int) -> dict:
+    """Load random interviews the way the evaluation pages do"""
+    rng = random.Random(7)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    latencies = []
+    for _ in range(reads):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            interview = await queries.get_interview_session(
+                db, interview_uuid=f"bench-{rng.randrange(interviews)}", include_archived=True
+            )
+            sum(len(question.answer) + len(question.feedback) for question in interview.questions)
+            latencies.append(time.perf_counter() - start)
+    await engine.dispose()
+
+    latencies.sort()
+    return {
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text column compression size and read latency benchmark")
+    parser.add_argument("--interviews", type=int, default=500, help="Completed interviews to store")
+    parser.add_argument("--questions", type=int, default=10, help="Questions per interview")
+    parser.add_argument("--reads", type=int, default=500, help="Evaluation page loads per database")
+    args = parser.parse_args()
+
+    methods = ["none", "zlib"] + (["zstd"] if compression.zstandard is not None else [])
+    print(
+        f"Storing {args.interviews} interviews x {args.questions} questions "
+        f"(threshold {compression.TEXT_COMPRESSION_MIN_BYTES} bytes)..."
+    )
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for method in methods:
+            path = os.path.join(tmp, f"{method}.db")
+            size = seed_database(path, args.interviews, args.questions, method)
+            results[method] = dict(asyncio.run(read_latency(path, args.interviews, args.reads)), size=size)
+
+    plain = results["none"]["size"]
+    for method, result in results.items():
+        label = "plain text" if method == "none" else method
+        print(
+            f"{label:>10}: {result['size'] / 1048576:7.2f} MB ({result['size'] / plain:5.1%})  "
+            f"evaluation load p50 {result['p50_ms']:6.2f} ms  p95 {result['p95_ms']:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
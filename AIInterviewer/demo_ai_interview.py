@@ -10,8 +10,7 @@ import sys
 import json
 from datetime import datetime
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from app.database.database import SessionLocal
 from app.models.models import Base, Topic, Difficulty, Timing, User, Interview, Question
 from app.services.openai_service import OpenAIService
 import uuid
@@ -27,10 +26,8 @@ if not api_key or api_key == "your-openai-api-key-here":
     print("Example: OPENAI_API_KEY=sk-your-api-key")
     sys.exit(1)
 
-# Connect to database
-engine = create_engine("sqlite:///techinterviewer.db")
-Session = sessionmaker(bind=engine)
-session = Session()
+# Connect to the database configured by DATABASE_URL
+session = SessionLocal()
 
 # Create test data if needed
 def create_test_data():
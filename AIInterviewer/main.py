@@ -12,7 +12,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 from app.database.database import create_tables, get_db
 from app.models.models import User
-from app.routers import auth, user, admin, interview, openai_interview, dynamic_interview, admin_ai, status
+from app.routers import auth, user, admin, interview, openai_interview, dynamic_interview, admin_ai, status, system, jobs
+from app.services.job_queue import job_queue
 from fastapi.responses import RedirectResponse
 
 # Load environment variables from .env file
@@ -23,8 +24,10 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     # Startup logic
     create_tables()
+    await job_queue.start()
     yield
-    # Shutdown logic (if any)
+    # Shutdown logic: unfinished jobs go back to the queue for the next start
+    await job_queue.stop()
 
 app = FastAPI(title="TechInterviewer", lifespan=lifespan)
 
@@ -47,6 +50,8 @@ app.include_router(openai_interview.router)
 app.include_router(dynamic_interview.router)
 app.include_router(admin_ai.router)
 app.include_router(status.router)
+app.include_router(system.router)
+app.include_router(jobs.router)
 
 @app.get("/")
 async def root(request: Request):
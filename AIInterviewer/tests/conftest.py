@@ -0,0 +1,12 @@
+"""
+Test settings, applied before any app module is imported
+
+The tests never touch techinterviewer.db or the OpenAI API: the app's engines point at
+a throwaway SQLite database, and the OpenAI clients (built at import) get a dummy key.
+"""
+
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ.setdefault("OPENAI_API_KEY", "test")
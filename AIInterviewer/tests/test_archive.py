@@ -0,0 +1,119 @@
+"""
+Tests for moving completed interviews to the archive tier and back
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.database import queries
+from app.database.archive import archive_completed_interviews, restore_interviews
+from app.database.database import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from app.models.models import ArchivedInterview, ArchivedQuestion, Interview, Question, Topic
+
+Base.metadata.create_all(bind=engine)
+
+# Long enough to be stored compressed, so the copy must keep the stored bytes readable
+LONG_ANSWER = "A generator pauses at each yield and resumes where it left off on next(). " * 20
+
+
+def create_interviews() -> dict:
+    """Interviews in every state the archive job tells apart, by name"""
+    old = datetime.now() - timedelta(days=60)
+    recent = datetime.now() - timedelta(days=1)
+    with SessionLocal() as db:
+        topic = Topic(name=f"Archive {uuid.uuid4()}")
+        interviews = {
+            "completed_old": Interview(status="completed", created_at=old, completed_at=old),
+            "completed_unstamped": Interview(status="completed", created_at=old),
+            "completed_recent": Interview(status="completed", created_at=old, completed_at=recent),
+            "in_progress_old": Interview(status="in_progress", created_at=old),
+        }
+        for name, interview in interviews.items():
+            interview.uuid = str(uuid.uuid4())
+            interview.candidate_name = name
+            interview.summary = LONG_ANSWER
+            interview.topics = [topic]
+            interview.questions = [
+                Question(topic=topic, question_text=f"Question {i}", answer=LONG_ANSWER, question_order=i)
+                for i in range(2)
+            ]
+            db.add(interview)
+        db.commit()
+        # The newest interview is never archived, so SQLite cannot hand out an archived id again
+        newest = Interview(uuid=str(uuid.uuid4()), status="completed", created_at=old, completed_at=old)
+        db.add(newest)
+        db.commit()
+        ids = {name: interview.id for name, interview in interviews.items()}
+        ids["newest"] = newest.id
+        return ids
+
+
+def tier(interview_id: int) -> str:
+    with SessionLocal() as db:
+        if db.get(Interview, interview_id) is not None:
+            return "hot"
+        if db.get(ArchivedInterview, interview_id) is not None:
+            return "archive"
+        return "missing"
+
+
+def load_session(interview_id: int):
+    """The interview as the evaluation pages load it"""
+    async def main():
+        try:
+            async with AsyncSessionLocal() as db:
+                return await queries.get_interview_session(db, interview_id=interview_id, include_archived=True)
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(main())
+
+
+def test_archive_moves_old_completed_interviews_and_restore_moves_them_back():
+    ids = create_interviews()
+    assert archive_completed_interviews(older_than_days=30, dry_run=True) >= 2
+
+    assert archive_completed_interviews(older_than_days=30, batch_size=1) >= 2
+    tiers = {name: tier(interview_id) for name, interview_id in ids.items()}
+    assert tiers == {
+        "completed_old": "archive",
+        "completed_unstamped": "archive",
+        "completed_recent": "hot",
+        "in_progress_old": "hot",
+        "newest": "hot",
+    }
+
+    with SessionLocal() as db:
+        archived_questions = db.scalars(
+            select(ArchivedQuestion).where(ArchivedQuestion.interview_id == ids["completed_old"])
+        ).all()
+        hot_questions = db.scalars(select(Question).where(Question.interview_id == ids["completed_old"])).all()
+    assert [question.answer for question in archived_questions] == [LONG_ANSWER, LONG_ANSWER]
+    assert hot_questions == []
+
+    # Still readable, from the archive
+    interview = load_session(ids["completed_old"])
+    assert interview.is_archived
+    assert interview.summary == LONG_ANSWER
+    assert len(interview.topics) == 1
+    assert [question.question_text for question in interview.questions] == ["Question 0", "Question 1"]
+
+    assert restore_interviews([ids["completed_old"], ids["newest"]]) == 1
+    assert tier(ids["completed_old"]) == "hot"
+    assert tier(ids["completed_unstamped"]) == "archive"
+    interview = load_session(ids["completed_old"])
+    assert not interview.is_archived
+    assert interview.summary == LONG_ANSWER
+    assert len(interview.topics) == 1
+    assert [question.answer for question in interview.questions] == [LONG_ANSWER, LONG_ANSWER]
+    assert all(question.topic_id == interview.topics[0].id for question in interview.questions)
+    with SessionLocal() as db:
+        assert db.get(ArchivedInterview, ids["completed_old"]) is None
+        assert db.scalars(
+            select(ArchivedQuestion).where(ArchivedQuestion.interview_id == ids["completed_old"])
+        ).all() == []
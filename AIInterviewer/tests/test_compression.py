@@ -0,0 +1,78 @@
+"""
+Tests for CompressedText and the compress_text / decompress_text round trip
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.database.compression import (
+    ZLIB_HEADER, ZSTD_HEADER, CompressedText, compress_text, decompress_text, is_compressed
+)
+from app.database.database import Base, SessionLocal, engine
+from app.models.models import Question
+
+Base.metadata.create_all(bind=engine)
+
+LONG_TEXT = "Büyük bir yanıt: the event loop schedules coroutines — ✓ " * 40
+
+
+@pytest.mark.parametrize("value", [None, "", "short answer", LONG_TEXT])
+def test_round_trip(value):
+    assert decompress_text(compress_text(value)) == value
+
+
+def test_only_long_values_that_shrink_are_compressed():
+    assert compress_text("short answer") == "short answer"
+    assert compress_text(LONG_TEXT).startswith(ZLIB_HEADER)
+    assert compress_text(LONG_TEXT, method="none") == LONG_TEXT
+    assert compress_text("abc", min_bytes=0) == "abc"  # would grow
+    assert is_compressed(compress_text(LONG_TEXT))
+    assert not is_compressed(LONG_TEXT)
+
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    compressed = compress_text(LONG_TEXT, method="zstd")
+    assert compressed.startswith(ZSTD_HEADER)
+    assert decompress_text(compressed) == LONG_TEXT
+
+
+def test_postgresql_values_pass_through():
+    assert CompressedText().process_bind_param(LONG_TEXT, postgresql.dialect()) == LONG_TEXT
+
+
+def stored(question_id: int) -> tuple:
+    with engine.connect() as connection:
+        return tuple(connection.execute(
+            text("SELECT typeof(answer), typeof(feedback) FROM questions WHERE id = :id"), {"id": question_id}
+        ).one())
+
+
+def test_orm_round_trip_on_sqlite():
+    with SessionLocal() as db:
+        question = Question(question_text="What is the event loop?", answer=LONG_TEXT, feedback="Good")
+        db.add(question)
+        db.commit()
+        question_id = question.id
+
+    assert stored(question_id) == ("blob", "text")
+    with SessionLocal() as db:
+        question = db.get(Question, question_id)
+        assert (question.answer, question.feedback) == (LONG_TEXT, "Good")
+
+
+def test_rows_written_before_compression_read_back_unchanged():
+    with SessionLocal() as db:
+        question_id = db.execute(
+            text("INSERT INTO questions (question_text, answer) VALUES ('Legacy', :answer) RETURNING id"),
+            {"answer": LONG_TEXT}
+        ).scalar()
+        db.commit()
+
+    assert stored(question_id)[0] == "text"
+    with SessionLocal() as db:
+        assert db.get(Question, question_id).answer == LONG_TEXT
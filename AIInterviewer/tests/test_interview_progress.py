@@ -0,0 +1,104 @@
+"""
+Concurrency tests for InterviewProgress.record_answer
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+import uuid
+
+from app.database.database import AsyncSessionLocal, Base, async_engine, engine
+from app.models.models import Interview, Question
+from app.services.interview_progress import InterviewProgress
+
+Base.metadata.create_all(bind=engine)
+
+
+def run(main):
+    """Run a test coroutine, closing the pooled connections (and their threads) before the loop closes"""
+    async def run_and_dispose():
+        try:
+            return await main
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(run_and_dispose())
+
+
+async def create_interview(questions: int) -> tuple:
+    """An interview with the given number of unanswered questions over two topics"""
+    async with AsyncSessionLocal() as db:
+        interview = Interview(uuid=str(uuid.uuid4()), candidate_name="Test", status="in_progress")
+        db.add(interview)
+        await db.flush()
+        new_questions = [
+            Question(interview_id=interview.id, topic_id=1 + i % 2, question_text=f"Question {i}", question_order=i)
+            for i in range(questions)
+        ]
+        db.add_all(new_questions)
+        InterviewProgress.add_questions(interview, new_questions)
+        await db.commit()
+        return interview.id, [question.id for question in new_questions]
+
+
+async def answer(interview_id: int, question_id: int, loaded: asyncio.Barrier, score=None) -> bool:
+    """Submit an answer in its own session, like a request; every submission loads the interview first"""
+    async with AsyncSessionLocal() as db:
+        interview = await db.get(Interview, interview_id)
+        question = await db.get(Question, question_id)
+        await loaded.wait()
+        await InterviewProgress.record_answer(db, interview, question, f"Answer {question_id}", score)
+        completed = InterviewProgress.all_answered(interview)
+        # Let the other submissions run before this one commits
+        await asyncio.sleep(0.05)
+        await db.commit()
+        return completed
+
+
+async def load(interview_id: int) -> Interview:
+    async with AsyncSessionLocal() as db:
+        return await db.get(Interview, interview_id)
+
+
+def test_overlapping_answers_are_all_counted():
+    async def main():
+        interview_id, question_ids = await create_interview(3)
+        loaded = asyncio.Barrier(len(question_ids))
+        completed = await asyncio.gather(*(answer(interview_id, q, loaded) for q in question_ids))
+        return await load(interview_id), completed
+
+    interview, completed = run(main())
+    assert interview.answered_count == 3
+    assert InterviewProgress.all_answered(interview)
+    assert sum(entry["answered"] for entry in interview.topic_scores.values()) == 3
+    # Exactly the last submission saw the interview complete
+    assert completed.count(True) == 1
+
+
+def test_overlapping_scores_are_all_counted():
+    async def main():
+        interview_id, question_ids = await create_interview(4)
+        loaded = asyncio.Barrier(len(question_ids))
+        await asyncio.gather(*(answer(interview_id, q, loaded, score=50 + q % 10) for q in question_ids))
+        return await load(interview_id), question_ids
+
+    interview, question_ids = run(main())
+    total = sum(50 + q % 10 for q in question_ids)
+    assert interview.scored_count == 4
+    assert interview.total_score == total
+    assert interview.average_score == total / 4
+    assert sum(entry["total"] for entry in interview.topic_scores.values()) == total
+
+
+def test_reanswering_replaces_the_previous_contribution():
+    async def main():
+        interview_id, question_ids = await create_interview(2)
+        loaded = asyncio.Barrier(2)
+        # The same question answered twice at once counts once
+        await asyncio.gather(*(answer(interview_id, question_ids[0], loaded, score) for score in (40, 80)))
+        return await load(interview_id)
+
+    interview = run(main())
+    assert interview.answered_count == 1
+    assert interview.scored_count == 1
+    assert interview.total_score in (40, 80)
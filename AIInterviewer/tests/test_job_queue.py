@@ -0,0 +1,115 @@
+"""
+Tests for job leases and worker resilience in JobQueue
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+import os
+import tempfile
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.models import Base, Job
+from app.services.job_queue import JobQueue, enqueue, job_handler
+
+runs = []
+failing_writes = []
+
+
+@job_handler("test_slow")
+async def slow(job):
+    runs.append(job.attempt)
+    await asyncio.sleep(1)
+    return {"attempt": job.attempt}
+
+
+@job_handler("test_quick")
+async def quick(job):
+    return {"attempt": job.attempt}
+
+
+def temporary_database():
+    """An async engine and session factory for a new SQLite database with the app's tables"""
+    path = os.path.join(tempfile.mkdtemp(), "jobs.db")
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{path}"))
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    return async_engine, async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def load(session_factory, job_uuid: str) -> Job:
+    async with session_factory() as db:
+        return await db.scalar(select(Job).where(Job.uuid == job_uuid))
+
+
+def test_job_longer_than_its_lease_runs_once():
+    async_engine, session_factory = temporary_database()
+
+    async def main():
+        # Two processes' queues; the job takes over three leases
+        queues = [
+            JobQueue(workers=1, poll_interval=0.05, lease_seconds=0.3, session_factory=session_factory)
+            for _ in range(2)
+        ]
+        for queue in queues:
+            await queue.start()
+        async with session_factory() as db:
+            job = enqueue(db, "test_slow", {})
+            await db.commit()
+        await asyncio.sleep(1.5)
+        for queue in queues:
+            await queue.stop()
+        job = await load(session_factory, job.uuid)
+        await async_engine.dispose()
+        return job, sum(queue.recovered for queue in queues)
+
+    job, recovered = asyncio.run(main())
+    assert runs == [1]
+    assert recovered == 0
+    assert job.status == "succeeded"
+    assert job.result == {"attempt": 1}
+
+
+class FailingSession(AsyncSession):
+    """Fails the commit of a job's outcome while failing_writes is not empty"""
+
+    async def commit(self):
+        if failing_writes:
+            failing_writes.pop()
+            raise RuntimeError("database is locked")
+        await super().commit()
+
+
+def test_worker_survives_a_failed_outcome_write():
+    async_engine, _ = temporary_database()
+    session_factory = async_sessionmaker(bind=async_engine, class_=FailingSession, expire_on_commit=False)
+
+    async def main():
+        queue = JobQueue(workers=1, poll_interval=0.05, lease_seconds=0.3, session_factory=session_factory)
+        async with session_factory() as db:
+            first = enqueue(db, "test_quick", {})
+            await db.commit()
+        # Run the first job as a worker would, with the write of its outcome failing
+        claim = await queue._claim()
+        failing_writes.append(True)
+        await queue._run(claim)
+        running_here = (await queue.stats())["running_here"]
+
+        # The workers go on: the abandoned job is run again once its lease expires
+        async with session_factory() as db:
+            second = enqueue(db, "test_quick", {})
+            await db.commit()
+        await queue.start()
+        await asyncio.sleep(1)
+        await queue.stop()
+        jobs = [await load(session_factory, job.uuid) for job in (first, second)]
+        await async_engine.dispose()
+        return running_here, jobs
+
+    running_here, (first, second) = asyncio.run(main())
+    assert running_here == 0
+    assert second.status == "succeeded"
+    assert first.status == "succeeded"
+    assert first.attempts == 2
@@ -0,0 +1,59 @@
+"""
+Tests for the schema migrations
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from app.database.database import Base
+from app.database.migrations import check_query_plans, create_indexes, run_migrations
+
+
+# Indexes added to existing databases by migrations 1 and 2
+MIGRATED_INDEXES = {
+    "ix_question_bank_topic_difficulty", "ix_question_bank_topic_id", "ix_questions_interview_order",
+    "ix_interviews_user_created", "ix_interviews_created", "ix_interviews_status_created",
+    "ix_interviews_approval_created",
+}
+
+
+def migrated_engine(create_all: bool):
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'migrations.db')}")
+    if create_all:
+        Base.metadata.create_all(bind=engine)
+    else:
+        # The tables as the first migration found them, without the indexes migrations ship
+        Base.metadata.create_all(bind=engine)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name in MIGRATED_INDEXES:
+                    index.drop(bind=engine)
+    run_migrations(engine)
+    return engine
+
+
+@pytest.mark.parametrize("create_all", [True, False])
+def test_migrations_build_the_declared_interview_indexes(create_all):
+    engine = migrated_engine(create_all)
+    indexes = {
+        index["name"] for table in ("interviews", "questions", "question_bank")
+        for index in inspect(engine).get_indexes(table)
+    }
+    assert MIGRATED_INDEXES <= indexes
+    # Created by migration 1 and superseded by migration 2's composites
+    assert "ix_interviews_status" not in indexes
+    assert "ix_interviews_approval_status" not in indexes
+    check_query_plans(engine)
+
+
+def test_create_indexes_rejects_undeclared_names():
+    engine = create_engine("sqlite://")
+    Base.metadata.tables["interviews"].create(bind=engine)
+    with engine.begin() as connection, pytest.raises(ValueError):
+        create_indexes(connection, "interviews", {"ix_interviews_status"})
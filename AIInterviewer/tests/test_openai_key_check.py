@@ -0,0 +1,64 @@
+"""
+Tests for the cached OpenAI key check behind /api/openai/validate-key
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+
+import pytest
+
+from app.routers import openai_interview
+from app.services.openai_resilience import CircuitOpenError
+from app.services.openai_service import AsyncOpenAIService
+
+
+@pytest.fixture
+def checks(monkeypatch):
+    """Counts live key checks, which raise the errors queued in the returned list"""
+    calls = {"count": 0, "errors": []}
+
+    async def check_connection(api_key: str) -> float:
+        calls["count"] += 1
+        if calls["errors"]:
+            raise calls["errors"].pop(0)
+        return 0.1
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(AsyncOpenAIService, "check_connection", staticmethod(check_connection))
+    monkeypatch.setattr(openai_interview, "_key_checks", {})
+    return calls
+
+
+def validate():
+    return asyncio.run(openai_interview.validate_openai_api_key())
+
+
+def test_page_loads_share_one_live_check(checks):
+    async def main():
+        return await asyncio.gather(*(openai_interview.validate_openai_api_key() for _ in range(5)))
+
+    assert asyncio.run(main()) == [{"valid": True}] * 5
+    assert validate() == {"valid": True}
+    assert checks["count"] == 1
+
+
+def test_check_is_repeated_after_the_ttl(checks, monkeypatch):
+    monkeypatch.setattr(openai_interview, "OPENAI_KEY_CHECK_TTL", 0)
+    validate()
+    validate()
+    assert checks["count"] == 2
+
+
+def test_open_breaker_is_not_cached(checks):
+    checks["errors"].append(CircuitOpenError(10))
+    assert validate()["valid"] is False
+    assert validate() == {"valid": True}
+    assert checks["count"] == 2
+
+
+def test_unconfigured_key_makes_no_request(checks, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY")
+    assert validate()["valid"] is False
+    assert checks["count"] == 0
@@ -0,0 +1,65 @@
+"""
+Tests for the circuit breaker's half-open trial call
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.openai_resilience import CircuitBreaker, CircuitOpenError, OpenAIResilience
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def half_open_resilience() -> OpenAIResilience:
+    """A resilience policy whose breaker has opened and waited out its reset time"""
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    return OpenAIResilience(timeouts={"evaluation": 5}, max_retries=0, breaker=breaker)
+
+
+def test_cancelled_trial_lets_the_next_call_through():
+    resilience = half_open_resilience()
+
+    async def hang(timeout: float):
+        await asyncio.sleep(60)
+
+    async def answer(timeout: float):
+        return "ok"
+
+    async def main():
+        trial = asyncio.create_task(resilience.call("evaluation", hang))
+        await asyncio.sleep(0.01)
+        # Only one trial call at a time
+        with pytest.raises(CircuitOpenError):
+            await resilience.call("evaluation", answer)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        return await resilience.call("evaluation", answer)
+
+    assert asyncio.run(main()) == "ok"
+    assert resilience.breaker.state == "closed"
+
+
+def test_interrupted_sync_trial_lets_the_next_call_through():
+    resilience = half_open_resilience()
+
+    def interrupted(timeout: float):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        resilience.call_sync("evaluation", interrupted)
+    assert resilience.call_sync("evaluation", lambda timeout: "ok") == "ok"
+    assert resilience.breaker.state == "closed"
@@ -0,0 +1,131 @@
+"""
+Tests for keyset pagination of the listing pages
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.database import queries
+from app.database.database import AsyncSessionLocal, Base, async_engine, engine
+from app.database.pagination import decode_cursor, encode_cursor, fetch_page
+from app.models.models import Interview, QuestionBank, User
+from app.routers import admin
+
+Base.metadata.create_all(bind=engine)
+
+
+def run(main):
+    """Run a test coroutine, closing the pooled connections (and their threads) before the loop closes"""
+    async def run_and_dispose():
+        try:
+            return await main
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(run_and_dispose())
+
+
+async def walk(loader, **kwargs) -> list:
+    """Every page of a listing, following next_cursor until the last page"""
+    pages, cursor = [], None
+    async with AsyncSessionLocal() as db:
+        while True:
+            page = await loader(db, cursor=cursor, **kwargs)
+            pages.append(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                return pages
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30)
+    assert decode_cursor(encode_cursor(created_at, 42), datetime, int) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", encode_cursor(1), encode_cursor("not a date", 1)])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, datetime, int)
+
+
+def test_interview_pages_cover_every_row_once_newest_first():
+    async def main():
+        async with AsyncSessionLocal() as db:
+            user = User(username=f"pager-{uuid.uuid4()}", email=f"{uuid.uuid4()}@example.com")
+            db.add(user)
+            await db.flush()
+            start = datetime(2024, 1, 1)
+            # Pairs of interviews share a created_at, so pages must break ties on id
+            db.add_all([
+                Interview(uuid=str(uuid.uuid4()), user_id=user.id, created_at=start + timedelta(hours=i // 2))
+                for i in range(7)
+            ])
+            await db.commit()
+        return await walk(queries.paginate_interviews, limit=3, user_id=user.id)
+
+    pages = run(main())
+    assert [len(page) for page in pages] == [3, 3, 1]
+    keys = [(interview.created_at, interview.id) for page in pages for interview in page]
+    assert keys == sorted(keys, reverse=True)
+    assert len(set(keys)) == 7
+
+
+def test_question_bank_pages_filter_in_sql():
+    async def main():
+        async with AsyncSessionLocal() as db:
+            db.add_all([QuestionBank(topic_id=9001, question_text=f"Paged question {i}") for i in range(5)])
+            db.add(QuestionBank(topic_id=9002, question_text="Other topic"))
+            await db.commit()
+        return await walk(queries.paginate_question_bank, limit=2, topic_id=9001)
+
+    pages = run(main())
+    ids = [question.id for page in pages for question in page]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert ids == sorted(ids)
+    assert all(question.topic_id == 9001 for page in pages for question in page)
+
+
+def test_user_search_matches_the_start_of_username_or_email():
+    tag = uuid.uuid4().hex[:8]
+
+    async def main():
+        async with AsyncSessionLocal() as db:
+            db.add_all([
+                User(username=f"{tag}_ann", email=f"ann-{tag}@example.com", is_active=True),
+                User(username=f"ann-{tag}", email=f"{tag}.bo@example.com", is_active=True),
+                User(username=f"{tag}x_inactive", email=f"in-{tag}@example.com", is_active=False),
+                User(username=f"{tag}xann", email=f"x-{tag}@example.com", is_active=True),
+            ])
+            await db.commit()
+            active = await queries.paginate_users(db, search=tag.upper(), is_active=True)
+            # _ is matched literally, not as any one character
+            underscore = await queries.paginate_users(db, search=f"{tag}_")
+        return [user.username for user in active.items], [user.username for user in underscore.items]
+
+    active, underscore = run(main())
+    assert sorted(active) == sorted([f"{tag}_ann", f"ann-{tag}", f"{tag}xann"])
+    assert underscore == [f"{tag}_ann"]
+
+
+def test_bad_cursor_is_a_400():
+    async def main():
+        async with AsyncSessionLocal() as db:
+            with pytest.raises(HTTPException) as loader_error:
+                await fetch_page(queries.paginate_interviews, db, cursor="garbage")
+            # The JSON listing routes answer through fetch_page
+            with pytest.raises(HTTPException) as route_error:
+                await admin.list_users_json(
+                    paging={"cursor": encode_cursor("x", "y"), "limit": None},
+                    filters=admin.user_filters(None, None, None, None, None), admin=None, db=db
+                )
+        return loader_error.value, route_error.value
+
+    loader_error, route_error = run(main())
+    assert loader_error.status_code == 400
+    assert route_error.status_code == 400
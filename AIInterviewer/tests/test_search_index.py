@@ -0,0 +1,106 @@
+"""
+Tests for the question bank search index over compressed model answers
+
+Run from the AIInterviewer directory:
+    python -m pytest tests
+"""
+
+import asyncio
+import sqlite3
+
+from sqlalchemy import event, text
+
+from app.database import queries
+from app.database.database import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from app.database.migrations import compress_columns
+from app.database.search import rebuild_search_index
+from app.models.models import QuestionBank
+
+Base.metadata.create_all(bind=engine)
+
+# Long enough to be stored compressed
+LONG_ANSWER = "A descriptor defines __get__ and __set__ to customise attribute access. " * 20
+
+
+def search(query: str):
+    async def main():
+        async with AsyncSessionLocal() as db:
+            page = await queries.search_question_bank(db, query)
+        await async_engine.dispose()
+        return [question.id for question in page.items]
+    return asyncio.run(main())
+
+
+def stored_type(question_id: int) -> str:
+    with engine.connect() as connection:
+        return connection.execute(
+            text("SELECT typeof(model_answer) FROM question_bank WHERE id = :id"), {"id": question_id}
+        ).scalar()
+
+
+def test_orm_writes_keep_compressed_answers_searchable():
+    with SessionLocal() as db:
+        question = QuestionBank(question_text="What are Python descriptors?", model_answer=LONG_ANSWER + " quokka")
+        db.add(question)
+        db.commit()
+        question_id = question.id
+        assert stored_type(question_id) == "blob"
+        assert question_id in search("quokka")
+
+        question.model_answer = LONG_ANSWER + " wombat"
+        db.commit()
+        assert question_id not in search("quokka")
+        assert question_id in search("wombat")
+
+        db.delete(question)
+        db.commit()
+        assert question_id not in search("wombat")
+
+
+def test_other_sqlite_clients_can_write_the_question_bank():
+    # A plain sqlite3 connection, without anything the app registers on its own connections
+    connection = sqlite3.connect(engine.url.database)
+    cursor = connection.execute(
+        "INSERT INTO question_bank (question_text, model_answer) VALUES ('What is a platypus?', 'A monotreme')"
+    )
+    question_id = cursor.lastrowid
+    connection.execute("UPDATE question_bank SET question_text = 'What is a numbat?' WHERE id = ?", (question_id,))
+    connection.commit()
+    connection.close()
+
+    # Searchable once the index is rebuilt
+    with engine.begin() as connection:
+        rebuild_search_index(connection)
+    assert search("numbat") == [question_id]
+
+    connection = sqlite3.connect(engine.url.database)
+    connection.execute("DELETE FROM question_bank WHERE id = ?", (question_id,))
+    connection.commit()
+    connection.close()
+
+
+def test_compress_columns_commits_each_batch():
+    with SessionLocal() as db:
+        db.execute(text("INSERT INTO question_bank (question_text, model_answer) VALUES (:q, :a)"), [
+            {"q": f"Legacy question {i}", "a": LONG_ANSWER} for i in range(5)
+        ])
+        db.commit()
+
+    commits = []
+
+    def count_commit(connection):
+        commits.append(connection)
+
+    event.listen(engine, "commit", count_commit)
+    try:
+        compress_columns(engine, "question_bank", ["model_answer"], batch_size=2)
+    finally:
+        event.remove(engine, "commit", count_commit)
+
+    with engine.connect() as connection:
+        plain = connection.execute(
+            text("SELECT count(*) FROM question_bank WHERE typeof(model_answer) = 'text' AND length(model_answer) >= 512")
+        ).scalar()
+    assert plain == 0
+    # Three batches of at most two rows, each in its own transaction
+    assert len(commits) >= 3